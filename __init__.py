@@ -1,15 +1,6 @@
-from . import (
-    btypes,
-    gizmo,
-    ops,
-    preferences,
-    registry,
-    tools,
-    ui,
-    utils,
-)
+from . import registry
 
-__all__ = ["btypes", "gizmo", "ops", "preferences", "registry", "tools", "ui", "utils"]
+__all__ = ["registry"]
 
 
 def register():
@@ -0,0 +1,233 @@
+"""Micro-benchmarks of the utilsbmesh shape builders and edit helpers.
+
+Each builder runs against a host bmesh of growing size, the way the edit
+mesh tool builds the cutter inside the target's bmesh, and at growing cutter
+sizes. The report shows how each function scales with both, so per-frame
+costs that grow with the host stand out::
+
+    blender --background --factory-startup --python benchmarks/builders.py -- \\
+        [--hosts 0 10000 100000] [--repeat 5] [--output PATH]
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import bmesh
+import bpy
+from mathutils import Vector
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import enable, module  # noqa: E402
+
+PLANE = (Vector((0.0, 0.0, 2.0)), Vector((0.0, 0.0, 1.0)))
+DIRECTION = Vector((0.0, 1.0, 0.0))
+
+# A host is flagged when its largest size makes a case this much slower
+THRESHOLD = 2.0
+
+
+def _host(verts):
+    """A grid with about ``verts`` vertices, or an empty bmesh."""
+    bm = bmesh.new()
+    if verts:
+        segments = max(int(math.sqrt(verts)) - 1, 1)
+        bmesh.ops.create_grid(
+            bm, x_segments=segments, y_segments=segments, size=1.0
+        )
+    return bm
+
+
+def _circle(bm, verts):
+    """A circle face of ``verts`` vertices."""
+    circle = module("utilsbmesh.circle")
+    face = circle.create(bm, PLANE, verts_number=verts)[0]
+    circle.set_xy(face, PLANE, None, DIRECTION, radius=0.5, local_space=True)
+    return face
+
+
+def _rectangle(bm):
+    """A rectangle face."""
+    rectangle = module("utilsbmesh.rectangle")
+    face = rectangle.create(bm, PLANE)[0]
+    rectangle.set_xy(face, PLANE, (0.8, 0.6), DIRECTION, local_space=True)
+    return face
+
+
+def _case_rectangle(bm, _size):
+    return _rectangle, (bm,)
+
+
+def _case_circle(bm, size):
+    return _circle, (bm, size)
+
+
+def _case_sphere(bm, size):
+    sphere = module("utilsbmesh.sphere")
+    return sphere.create, (bm, PLANE, DIRECTION, size, 0.5)
+
+
+def _case_corner(bm, _size):
+    corner = module("utilsbmesh.corner")
+
+    def build():
+        faces = corner.create(bm, PLANE)
+        corner.set_xy(
+            faces, PLANE, (0.8, 0.6), DIRECTION, (0.0, 0.0), local_space=True
+        )
+
+    return build, ()
+
+
+def _case_ngon(bm, size):
+    ngon = module("utilsbmesh.ngon")
+    points = [
+        SimpleNamespace(co=Vector((math.cos(a), math.sin(a), 2.0)))
+        for a in (i * math.tau / size for i in range(size))
+    ]
+    return ngon.new, (bm, points)
+
+
+def _case_extrude(bm, size):
+    facet = module("utilsbmesh.facet")
+    return facet.extrude, (bm, _circle(bm, size), PLANE, 0.5)
+
+
+def _case_bevel_verts(bm, size):
+    facet = module("utilsbmesh.facet")
+    return facet.bevel_verts, (bm, _rectangle(bm), 0.1, size)
+
+
+def _case_bevel_edges(bm, size):
+    facet = module("utilsbmesh.facet")
+    faces = facet.extrude(bm, _rectangle(bm), PLANE, 0.5)
+    edges = list(faces[-1].edges)
+    return facet.bevel_edges, (bm, edges, 0.1, size)
+
+
+# Name: (prepare, cutter sizes). ``prepare`` builds what the timed call needs
+# in the host and returns the function and its arguments
+CASES = {
+    "rectangle": (_case_rectangle, (4,)),
+    "circle": (_case_circle, (8, 32, 128)),
+    "sphere": (_case_sphere, (1, 2, 3)),
+    "corner": (_case_corner, (6,)),
+    "ngon": (_case_ngon, (8, 32, 128)),
+    "facet.extrude": (_case_extrude, (8, 32, 128)),
+    "facet.bevel_verts": (_case_bevel_verts, (1, 4, 16)),
+    "facet.bevel_edges": (_case_bevel_edges, (1, 4, 16)),
+}
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="builders.py", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--hosts",
+        type=int,
+        nargs="+",
+        default=[0, 10000, 100000],
+        help="Host mesh vertex counts",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per case; the fastest is kept"
+    )
+    parser.add_argument(
+        "--cases", nargs="+", default=[*CASES, "mesh.get_copy"], help="Cases to run"
+    )
+    parser.add_argument("--output", type=Path, help="Write the results to JSON")
+    return parser.parse_args(argv)
+
+
+def _measure(host, prepare, size, repeat):
+    """Fastest time of a case on a copy of the host, in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        bm = host.copy()
+        fn, args = prepare(bm, size)
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+        bm.free()
+    return best * 1000.0
+
+
+def _measure_get_copy(host, repeat):
+    """Fastest restore of an edit mesh from its saved copy, in ms."""
+    get_copy = module("utilsbmesh.mesh").get_copy
+
+    mesh = bpy.data.meshes.new("Host")
+    host.to_mesh(mesh)
+    obj = bpy.data.objects.new("Host", mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+
+    copy = mesh.copy()
+    bm = bmesh.from_edit_mesh(mesh)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        get_copy(obj, bm, copy)
+        best = min(best, time.perf_counter() - start)
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+    bpy.data.meshes.remove(copy)
+    return best * 1000.0
+
+
+def _report(results, hosts):
+    """Print times per host size and flag cases that grow with the host."""
+    header = "".join(f"{h:>12}" for h in hosts)
+    print(f"{'case':<20}{'size':>6}{header}   host x")
+    for name, sizes in results.items():
+        for size, times in sizes.items():
+            row = "".join(f"{times[str(h)]:>10.3f}ms" for h in hosts)
+            growth = times[str(hosts[-1])] / max(times[str(hosts[0])], 1e-6)
+            flag = "  <- scales with host" if growth > THRESHOLD else ""
+            print(f"{name:<20}{size:>6}{row}   {growth:>6.1f}{flag}")
+
+
+def main():
+    args = _parse_args()
+    enable()
+
+    results = {}
+    hosts = sorted(args.hosts)
+    for verts in hosts:
+        host = _host(verts)
+        for name in args.cases:
+            if name == "mesh.get_copy":
+                timings = {"-": _measure_get_copy(host, args.repeat)}
+            else:
+                prepare, sizes = CASES[name]
+                timings = {
+                    str(size): _measure(host, prepare, size, args.repeat)
+                    for size in sizes
+                }
+            for size, time_ms in timings.items():
+                results.setdefault(name, {}).setdefault(size, {})[str(verts)] = time_ms
+        host.free()
+
+    _report(results, hosts)
+
+    if args.output:
+        data = {
+            "blender": bpy.app.version_string,
+            "hosts": hosts,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
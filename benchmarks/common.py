@@ -0,0 +1,28 @@
+"""Helpers shared by the benchmark scripts."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import addon_utils
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT.name
+
+
+def enable():
+    """Load the add-on from this checkout."""
+    sys.path.insert(0, str(ROOT.parent))
+    if addon_utils.enable(PACKAGE, default_set=True) is None:
+        raise RuntimeError(f"Could not enable {PACKAGE} from {ROOT}")
+
+
+def module(name):
+    """Import a module of the add-on.
+
+    :param name: Module path inside the add-on, e.g. ``utils.timing``.
+    :type name: str
+    :return: The module.
+    :rtype: module
+    """
+    return importlib.import_module(f"{PACKAGE}.{name}")
@@ -0,0 +1,261 @@
+"""Replay a recorded Block tool session.
+
+Restores the view, selection and tool settings a session saved from
+Debug > Save Session started from, then feeds its events back through
+Blender's event simulation and reports the Block tool's stage timings::
+
+    blender --factory-startup --enable-event-simulate \\
+        --python benchmarks/replay.py -- SESSION \\
+        [--blend FILE] [--output PATH] [--profile PATH] [--realtime]
+
+The modal runs in a window, so ``--background`` can't be used; on machines
+without a display run Blender under a virtual one (e.g. ``xvfb-run``).
+Cursor positions are scaled when the 3D viewport size differs from the
+recorded one; pass the same ``--window-geometry`` for identical rays. Edit
+mode sessions restore the mesh selection from the blend file, so save it in
+the state the session started from.
+"""
+
+import argparse
+import cProfile
+import json
+import sys
+from pathlib import Path
+
+import bpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import enable, module  # noqa: E402
+
+TOOLS = {
+    "OBJECT": ("object.bout_block_obj", "object.bout_block_obj_tool"),
+    "EDIT_MESH": ("object.bout_block_mesh", "object.bout_block_mesh_tool"),
+}
+
+# Values Blender derives from press and release on its own
+DERIVED = {"CLICK", "DOUBLE_CLICK", "CLICK_DRAG"}
+
+# Event loop steps to wait for the modal to end after the last event
+SETTLE = 100
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="replay.py", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("session", type=Path, help="Session JSON to replay")
+    parser.add_argument(
+        "--blend", type=Path, help="Blend file to replay in; the recorded one if unset"
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the timings to a JSON file"
+    )
+    parser.add_argument(
+        "--profile", type=Path, help="Write a cProfile of the replay"
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Keep the recorded time between events instead of replaying at once",
+    )
+    return parser.parse_args(argv)
+
+
+def _view3d(window):
+    """The largest 3D viewport of a window and its main region."""
+    areas = [area for area in window.screen.areas if area.type == "VIEW_3D"]
+    if not areas:
+        raise RuntimeError("No 3D viewport to replay in")
+    area = max(areas, key=lambda area: area.width * area.height)
+    region = next(region for region in area.regions if region.type == "WINDOW")
+    return area, region
+
+
+def _apply(pg, values):
+    """Set recorded property values, skipping ones that no longer apply."""
+    for key, value in values.items():
+        prop = pg.bl_rna.properties.get(key)
+        if prop is None or prop.is_readonly:
+            continue
+        if prop.type == "ENUM" and isinstance(value, list):
+            value = set(value)
+        try:
+            setattr(pg, key, value)
+        except (TypeError, ValueError):
+            print(f"Skipped {key}={value!r}")
+
+
+def _setup(session, window, area, region):
+    """Restore the state the session started from."""
+    space = area.spaces.active
+    rv3d = space.region_3d
+    view = session["view"]
+    rv3d.view_perspective = view["perspective"]
+    rv3d.view_location = view["location"]
+    rv3d.view_rotation = view["rotation"]
+    rv3d.view_distance = view["distance"]
+    space.lens = view["lens"]
+    space.clip_start = view["clip_start"]
+    space.clip_end = view["clip_end"]
+
+    context = bpy.context
+    prefs = module("utils.addon").pref()
+    prefs.timing = True
+    prefs.record = False
+
+    block = prefs.tools.block
+    block.shape = session["shape"]
+    _apply(block.align, session["align"])
+    _apply(block.form, session["form"])
+    _apply(context.scene.bout.align, session["scene_align"])
+    context.scene.tool_settings.use_snap = session["snap"]
+
+    with context.temp_override(window=window, area=area, region=region):
+        if context.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        for obj in context.view_layer.objects:
+            obj.select_set(obj.name in session["selected"])
+        context.view_layer.objects.active = bpy.data.objects.get(session["active"])
+
+        if session["type"] == "EDIT_MESH":
+            bpy.ops.object.mode_set(mode="EDIT")
+        # Knife only exists in edit mode, so set the mode after switching
+        block.mode = session["mode"]
+
+        bpy.ops.wm.tool_set_by_id(name=TOOLS[session["type"]][0])
+
+
+def _events(session, region):
+    """The events to simulate, in window coordinates, each with the recorded
+    time since the previous one."""
+    recorded = session["region"]
+    scale_x = region.width / recorded["width"]
+    scale_y = region.height / recorded["height"]
+    if (scale_x, scale_y) != (1.0, 1.0):
+        print(
+            f"Viewport is {region.width}x{region.height}, recorded in "
+            f"{recorded['width']}x{recorded['height']}; scaling the cursor"
+        )
+
+    def at(x, y):
+        return round(region.x + x * scale_x), round(region.y + y * scale_y)
+
+    invoke, *events = session["events"]
+    press = at(*session["press"])
+
+    # The tool starts on a click-drag: press where the drag began, then
+    # move to where the tool was invoked
+    yield 0.0, {"type": "MOUSEMOVE", "value": "NOTHING", "xy": press}
+    yield 0.0, {"type": "LEFTMOUSE", "value": "PRESS", "xy": press}
+    drag = at(invoke["x"], invoke["y"])
+    yield 0.0, {"type": "MOUSEMOVE", "value": "NOTHING", "xy": drag}
+
+    previous = invoke["time"]
+    for event in events:
+        if event["value"] in DERIVED:
+            continue
+        delay, previous = event["time"] - previous, event["time"]
+        yield delay, {**event, "xy": at(event["x"], event["y"])}
+
+
+class Replay:
+    """Feeds a session to the window one event per event loop step."""
+
+    def __init__(self, session, window, args):
+        self.session = session
+        self.window = window
+        self.args = args
+        self.events = None
+        self.pending = None
+        self.settle = SETTLE
+        self.profiler = cProfile.Profile() if args.profile else None
+
+    def _simulate(self, event):
+        x, y = event["xy"]
+        kwargs = {
+            "x": x,
+            "y": y,
+            "ctrl": event.get("ctrl", False),
+            "shift": event.get("shift", False),
+            "alt": event.get("alt", False),
+            "oskey": event.get("oskey", False),
+        }
+        if event.get("unicode"):
+            kwargs["unicode"] = event["unicode"]
+        self.window.event_simulate(event["type"], event["value"], **kwargs)
+
+    def _running(self):
+        category, name = TOOLS[self.session["type"]][1].split(".")
+        idname = f"{category.upper()}_OT_{name}"
+        return any(op.bl_idname == idname for op in self.window.modal_operators)
+
+    def step(self):
+        if self.events is None:
+            area, region = _view3d(self.window)
+            _setup(self.session, self.window, area, region)
+            self.events = _events(self.session, region)
+            module("utils.timing").reset()
+            if self.profiler:
+                self.profiler.enable()
+            return 0.0
+
+        if self.pending is None:
+            self.pending = next(self.events, None)
+            if self.pending and self.args.realtime and self.pending[0] > 0.0:
+                return self.pending[0]
+
+        if self.pending is not None:
+            _delay, event = self.pending
+            self.pending = None
+            self._simulate(event)
+            return 0.0
+
+        if self._running() and self.settle > 0:
+            self.settle -= 1
+            return 0.0
+
+        self._finish()
+        return None
+
+    def _finish(self):
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(str(self.args.profile))
+
+        timing = module("utils.timing")
+        summary = timing.summary()
+        for name, stats in summary.items():
+            print(
+                f"{name:<20} mean {stats['mean']:>9.2f} ms  "
+                f"max {stats['max']:>9.2f} ms  x{stats['count']}"
+            )
+        if self._running():
+            print("The tool was still running after the last event")
+        if self.args.output:
+            timing.dump(str(self.args.output))
+
+        with bpy.context.temp_override(window=self.window):
+            bpy.ops.wm.quit_blender()
+
+
+def main():
+    args = _parse_args()
+    session = json.loads(args.session.read_text(encoding="utf-8"))
+    if session.get("version") != module("utils.record").VERSION:
+        print(f"Session version {session.get('version')} may not replay")
+
+    blend = args.blend or (Path(session["file"]) if session["file"] else None)
+    if blend:
+        bpy.ops.wm.open_mainfile(filepath=str(blend), load_ui=False)
+
+    replay = Replay(session, bpy.context.window_manager.windows[0], args)
+    bpy.app.timers.register(replay.step, first_interval=0.5, persistent=True)
+
+
+if __name__ == "__main__":
+    if not bpy.app.use_event_simulate:
+        sys.exit("Run Blender with --enable-event-simulate")
+    enable()
+    main()
@@ -0,0 +1,299 @@
+"""Headless benchmark of the Block tool's execute (F9 redo) path.
+
+Runs every shape and mode of the Block tools against generated targets of
+increasing density, and reports the wall time and peak memory of each case.
+Results are compared with a stored baseline so regressions in the hot paths
+show up as numbers::
+
+    blender --background --factory-startup --python benchmarks/run.py -- \\
+        [--levels 2 4 6] [--repeat 3] [--baseline PATH] [--update]
+
+The add-on is loaded from this checkout, so the checkout folder name must be
+a valid module name (e.g. ``blockout``).
+
+Object tool cases time ``execute`` and the evaluation of the booleans it
+adds; edit mesh cases apply the boolean inside ``execute``. Peak memory is
+the resident set size reached during a case above the size before it. It is
+exact on Linux; elsewhere it only grows when a case raises the process peak.
+
+Exits with status 1 when a case is slower or bigger than its baseline by
+more than the tolerance.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+import bmesh
+import bpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import PACKAGE, enable, module  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+MODES = {
+    "OBJECT": ("CUT", "SLICE", "UNION", "INTERSECT", "CARVE"),
+    "EDIT_MESH": ("CUT", "SLICE", "UNION", "INTERSECT", "CARVE", "KNIFE"),
+}
+
+OPERATORS = {
+    "OBJECT": "bout_block_obj_tool",
+    "EDIT_MESH": "bout_block_mesh_tool",
+}
+
+# Cutter settings per shape, drawn on a horizontal plane inside the target
+_NGON = [
+    {"co": (math.cos(a) * 0.6, math.sin(a) * 0.4, -0.5)}
+    for a in (0.3, 1.9, 3.4, 4.6, 5.8)
+]
+
+SHAPES = {
+    "RECTANGLE": {"size": (0.8, 0.6), "extrusion": 1.5},
+    "BOX": {"size": (0.8, 0.6), "extrusion": 1.5},
+    "TRIANGLE": {"height": 0.8, "angle": math.radians(60.0), "extrusion": 1.5},
+    "PRISM": {"height": 0.8, "angle": math.radians(60.0), "extrusion": 1.5},
+    "CIRCLE": {"radius": 0.5, "verts": 32, "extrusion": 1.5},
+    "CYLINDER": {"radius": 0.5, "verts": 32, "extrusion": 1.5},
+    "SPHERE": {"radius": 0.6, "subdivisions": 3},
+    "CORNER": {"size": (0.8, 0.6), "extrusion": 1.5},
+    "NGON": {"points": _NGON, "extrusion": 1.5},
+    "NHEDRON": {"points": _NGON, "extrusion": 1.5},
+}
+
+# Differences below these are noise, whatever the tolerance
+MIN_TIME = 1.0
+MIN_MEMORY = 1.0
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="run.py", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--levels",
+        type=int,
+        nargs="+",
+        default=[2, 4, 6],
+        help="Icosphere subdivisions of the targets (20 * 4^n faces)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per case; the fastest is kept"
+    )
+    parser.add_argument(
+        "--shapes", nargs="+", default=list(SHAPES), choices=list(SHAPES)
+    )
+    parser.add_argument("--tools", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--update", action="store_true", help="Write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed relative regression"
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Also write the results to a JSON file"
+    )
+    return parser.parse_args(argv)
+
+
+def _rss_peak_reset():
+    """Reset the peak resident set size, where the platform allows it."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def _rss():
+    """Current and peak resident set size, in MiB."""
+    try:
+        status = Path("/proc/self/status").read_text().splitlines()
+    except OSError:
+        status = None
+
+    if status:
+        fields = {
+            line.split(":")[0]: line.split()[1]
+            for line in status
+            if line.startswith("Vm")
+        }
+        return int(fields["VmRSS"]) / 1024.0, int(fields["VmHWM"]) / 1024.0
+
+    if resource is None:
+        return 0.0, 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KiB elsewhere
+    peak /= 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return peak, peak
+
+
+def _clear():
+    """Remove everything a previous case created."""
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.data.batch_remove([*bpy.data.objects, *bpy.data.meshes, *bpy.data.collections])
+
+
+def _target(level):
+    """Link an icosphere target and make it the only selected, active object."""
+    mesh = bpy.data.meshes.new("Target")
+    bm = bmesh.new()
+    bmesh.ops.create_icosphere(bm, subdivisions=level, radius=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    obj = bpy.data.objects.new("Target", mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    return obj
+
+
+def _run(tool, shape, mode, level):
+    """Run one case.
+
+    :return: Execute and evaluation time in ms, and peak memory in MiB.
+    :rtype: tuple[float, float, float]
+    """
+    _clear()
+    target = _target(level)
+
+    block = bpy.context.preferences.addons[PACKAGE].preferences.tools.block
+    if tool == "EDIT_MESH":
+        bpy.ops.object.mode_set(mode="EDIT")
+        bpy.ops.mesh.select_all(action="DESELECT")
+    else:
+        block.mode = mode
+
+    pref = {
+        "type": tool,
+        "mode": mode,
+        "offset": 0.001,
+        "plane": {"origin": (0.0, 0.0, -0.5), "normal": (0.0, 0.0, 1.0)},
+        "direction": (0.0, 1.0, 0.0),
+        "detected": target.name if tool == "OBJECT" else "",
+    }
+    shape_props = {"active": shape, shape.lower(): SHAPES[shape]}
+
+    operator = getattr(bpy.ops.object, OPERATORS[tool])
+    before, _peak = _rss()
+    _rss_peak_reset()
+    start = time.perf_counter()
+    result = operator("EXEC_DEFAULT", pref=pref, shape=shape_props)
+    executed = time.perf_counter()
+    bpy.context.view_layer.update()
+    evaluated = time.perf_counter()
+    _current, peak = _rss()
+
+    if result != {"FINISHED"}:
+        raise RuntimeError(f"{tool} {shape} {mode}: {result}")
+    return (
+        (executed - start) * 1000.0,
+        (evaluated - executed) * 1000.0,
+        max(peak - before, 0.0),
+    )
+
+
+def _case(timing, tool, shape, mode, level, repeat):
+    """Fastest of several runs of a case, with its peak memory."""
+    best = None
+    memory = 0.0
+    timing.reset()
+
+    for _ in range(repeat):
+        execute, evaluate, peak = _run(tool, shape, mode, level)
+        memory = max(memory, peak)
+        if best is None or execute + evaluate < sum(best):
+            best = (execute, evaluate)
+
+    return {
+        "time": sum(best),
+        "execute": best[0],
+        "evaluate": best[1],
+        "memory": memory,
+        "stages": {name: s["mean"] for name, s in timing.summary().items()},
+    }
+
+
+def _compare(results, baseline, tolerance):
+    """Cases slower or bigger than the baseline beyond the tolerance."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, floor in (("time", MIN_TIME), ("memory", MIN_MEMORY)):
+            limit = max(base[metric] * (1.0 + tolerance), base[metric] + floor)
+            if result[metric] > limit:
+                regressions.append((key, metric, base[metric], result[metric]))
+    return regressions
+
+
+def main():
+    args = _parse_args()
+    enable()
+    timing = module("utils.timing")
+    timing.enabled = True
+
+    results = {}
+    for tool in args.tools:
+        for level in args.levels:
+            for shape in args.shapes:
+                for mode in MODES[tool]:
+                    key = f"{tool}/{shape}/{mode}/{level}"
+                    result = _case(timing, tool, shape, mode, level, args.repeat)
+                    results[key] = result
+                    print(
+                        f"{key:<40} {result['time']:>9.2f} ms "
+                        f"(eval {result['evaluate']:>8.2f}) "
+                        f"{result['memory']:>8.1f} MiB",
+                        flush=True,
+                    )
+
+    data = {
+        "blender": bpy.app.version_string,
+        "platform": sys.platform,
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    if args.update:
+        args.baseline.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("blender") != data["blender"]:
+        print(
+            f"Baseline is from Blender {baseline.get('blender')}; "
+            "numbers may not compare"
+        )
+
+    regressions = _compare(results, baseline["results"], args.tolerance)
+    for key, metric, before, after in regressions:
+        unit = "ms" if metric == "time" else "MiB"
+        print(f"REGRESSION {key} {metric}: {before:.2f} -> {after:.2f} {unit}")
+
+    print(f"{len(results)} case(s), {len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
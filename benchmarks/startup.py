@@ -0,0 +1,110 @@
+"""Measure how long enabling the add-on takes.
+
+Run in a fresh Blender, so nothing of the add-on is imported yet::
+
+    blender --background --factory-startup --python benchmarks/startup.py -- \\
+        [--budget MS]
+
+Reports the import and register time and the modules enabling pulled in.
+Exits with status 1 when enabling takes longer than the budget, or imports a
+module that should only load on first use. In background mode tools, panels,
+gizmos and keymaps are neither imported nor registered, which is checked
+too; run without ``--background`` to time an interactive enable.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+import addon_utils
+import bpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import PACKAGE, ROOT  # noqa: E402
+
+# Modules the add-on only imports on first use
+DEFERRED = ("numpy",)
+
+# Add-on modules of tools, panels, gizmos and keymaps; not imported in
+# background mode, where they are never registered
+INTERACTIVE = (
+    "gizmo",
+    "keymap",
+    "tools.block.mesh",
+    "tools.block.obj",
+    "tools.block.warmup",
+    "ui",
+)
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="startup.py", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--budget", type=float, default=250.0, help="Allowed enable time in ms"
+    )
+    return parser.parse_args(argv)
+
+
+def main():
+    args = _parse_args()
+    sys.path.insert(0, str(ROOT.parent))
+
+    if PACKAGE in sys.modules:
+        print(f"{PACKAGE} is already imported; run in a fresh Blender")
+        return 1
+
+    before = set(sys.modules)
+    preloaded = [name for name in DEFERRED if name in before]
+
+    start = time.perf_counter()
+    importlib.import_module(PACKAGE)
+    imported = time.perf_counter()
+    if addon_utils.enable(PACKAGE, default_set=True) is None:
+        print(f"Could not enable {PACKAGE}")
+        return 1
+    registered = time.perf_counter()
+
+    loaded = set(sys.modules) - before
+    own = sorted(name for name in loaded if name.split(".")[0] == PACKAGE)
+    foreign = sorted(
+        name for name in loaded if name.split(".")[0] != PACKAGE and "." not in name
+    )
+
+    import_ms = (imported - start) * 1000.0
+    register_ms = (registered - imported) * 1000.0
+    total = import_ms + register_ms
+
+    mode = "background" if bpy.app.background else "interactive"
+    print(f"Blender {bpy.app.version_string}, {mode}")
+    print(f"import   {import_ms:>8.1f} ms  ({len(own)} modules)")
+    print(f"register {register_ms:>8.1f} ms")
+    print(f"total    {total:>8.1f} ms  (budget {args.budget:.0f} ms)")
+    print(f"other top-level modules imported: {', '.join(foreign) or 'none'}")
+
+    failed = False
+    if total > args.budget:
+        print("FAIL: over budget")
+        failed = True
+    for name in DEFERRED:
+        if name in preloaded:
+            print(f"{name} was imported before the add-on; not checked")
+        elif name in loaded:
+            print(f"FAIL: enabling imported {name}")
+            failed = True
+    if bpy.app.background:
+        for name in INTERACTIVE:
+            if f"{PACKAGE}.{name}" in loaded:
+                print(f"FAIL: background enable imported {PACKAGE}.{name}")
+                failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
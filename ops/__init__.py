@@ -4,6 +4,7 @@ from . import obj
 from . import tools
 from . import block
 from . import align
+from . import debug
 
 
 class Theme(bpy.types.PropertyGroup):
@@ -29,4 +30,5 @@ classes = (
     *block.classes,
     *tools.classes,
     *align.classes,
+    *debug.classes,
 )
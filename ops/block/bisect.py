@@ -3,9 +3,14 @@ import math
 import bmesh
 from mathutils import Vector
 
-from ...utils import view3d
+from ...utils import lazy, view3d
 from ...utilsmath import geometry
 
+np = lazy.module("numpy")
+
+# Distance, in local units, within which a vert counts as on a plane
+PLANE_EPSILON = 1e-6
+
 
 def modal(op, context, event):
     """Bisect the mesh"""
@@ -85,72 +90,286 @@ def modal(op, context, event):
 
     op.data.bisect.plane = (location, normal)
 
+    preview(op, context)
+
+
+def preview(op, context):
+    """Draw where the bisect planes cut the targets.
+
+    The targets' mesh arrays are read once per run; each update only
+    intersects them with the planes.
+    """
+    bd = op.data.bisect
+    if bd.targets is None:
+        bd.targets = _targets(_objects(op, context))
+    cuts = planes(*bd.plane, bd.flip, bd.count, bd.spacing)
+    op.ui.bisect_section.callback.update_batch(_section(bd.targets, cuts))
+
+
+def planes(co, no, flip=False, count=1, spacing=0.0):
+    """World-space planes of a batch bisect.
+
+    The first is the drawn plane; each next one follows it `spacing` further
+    into the side the cut keeps, so `count` planes split the kept part into
+    parallel slabs.
+
+    :return: (co, no) pairs, with no facing the side a CUT clears.
+    :rtype: list[tuple[mathutils.Vector, mathutils.Vector]]
+    """
+    no = Vector(no).normalized()
+    if flip:
+        no = -no
+    co = Vector(co)
+    return [(co - no * (spacing * i), no) for i in range(count)]
+
 
 def execute(op, context, obj, bm, bisect_data):
     """Bisect the mesh"""
 
+    co, no, flip, mode, count, spacing, separate = bisect_data
+    cuts = planes(co, no, flip, count, spacing)
+
     if op.pref.type == "EDIT_MESH":
-        edited_objects = [
-            obj for obj in context.objects_in_mode_unique_data if obj.type == "MESH"
-        ]
-        for obj in edited_objects:
+        for obj in _objects(op, context):
             bm = bmesh.from_edit_mesh(obj.data)
-            _bisect(obj, bm, bisect_data)
+            coords = np.array([v.co for v in bm.verts], dtype=np.float64)
+            action, crossing = _classify(obj, coords, cuts, mode)
+            if action == "KEEP":
+                continue
+            if action == "CLEAR":
+                _clear(bm)
+            else:
+                _bisect(obj, bm, cuts, mode, separate, crossing)
             bmesh.update_edit_mesh(obj.data)
     else:
-        selected_objects = [
-            obj for obj in context.selected_objects if obj.type == "MESH"
-        ]
-        for obj in selected_objects:
+        for obj in _objects(op, context):
+            mesh = obj.data
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            action, crossing = _classify(obj, coords.reshape(-1, 3), cuts, mode)
+            if action == "KEEP":
+                continue
+            hidden = _hidden(mesh)
             bm = bmesh.new()
-            bm.from_mesh(obj.data)
-            _bisect(obj, bm, bisect_data)
+            bm.from_mesh(mesh)
+            if action == "CLEAR":
+                _clear(bm, hidden)
+            else:
+                _bisect(obj, bm, cuts, mode, separate, crossing, hidden)
             op.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-            bm.to_mesh(obj.data)
+            bm.to_mesh(mesh)
             bm.free()
 
     return {"FINISHED"}
 
 
-def _bisect(obj, bm, bisect_data):
-    """Bisect the mesh"""
+def _objects(op, context):
+    """The mesh objects a bisect cuts."""
+    if op.pref.type == "EDIT_MESH":
+        objects = context.objects_in_mode_unique_data
+    else:
+        objects = context.selected_objects
+    return [obj for obj in objects if obj.type == "MESH"]
+
+
+def _targets(objects):
+    """Mesh arrays of the objects, concatenated, for section previews.
+
+    :return: World-space vertex coordinates (n, 3), edge vertex indices
+        (m, 2), and the edge and face index of each loop.
+    :rtype: tuple[numpy.ndarray, ...]
+    """
+    coords, edges, loop_edges, loop_faces = [], [], [], []
+    verts_offset = edges_offset = faces_offset = 0
+    for obj in objects:
+        if obj.mode == "EDIT":
+            obj.update_from_editmode()
+        mesh = obj.data
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        coords.append(co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+
+        verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", verts)
+        edges.append(verts.reshape(-1, 2) + verts_offset)
+
+        loops = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loops)
+        loop_edges.append(loops + edges_offset)
+
+        # Faces own consecutive runs of loops, in order
+        totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", totals)
+        faces = np.arange(faces_offset, faces_offset + len(totals), dtype=np.int32)
+        loop_faces.append(np.repeat(faces, totals))
+
+        verts_offset += len(mesh.vertices)
+        edges_offset += len(mesh.edges)
+        faces_offset += len(mesh.polygons)
+
+    return (
+        np.concatenate(coords or [np.empty((0, 3), dtype=np.float32)]),
+        np.concatenate(edges or [np.empty((0, 2), dtype=np.int32)]),
+        np.concatenate(loop_edges or [np.empty(0, dtype=np.int32)]),
+        np.concatenate(loop_faces or [np.empty(0, dtype=np.int32)]),
+    )
 
-    plane_co_global = bisect_data[0]
-    plane_no_global = bisect_data[1]
-    flip = bisect_data[2]
-    mode = bisect_data[3]
 
-    # obj.update_from_editmode()
-    plane_no = obj.matrix_world.transposed() @ plane_no_global
-    plane_co = obj.matrix_world.inverted() @ plane_co_global
+def _section(targets, cuts):
+    """Segments where the world-space `cuts` cross the faces of `targets`.
+
+    Each face a plane crosses contributes the segment between the points
+    where the plane meets two of its edges; faces crossed more than once,
+    on concave ngons, are left out.
+
+    :return: An (n, 2, 3) float32 numpy.ndarray, or None when nothing is cut.
+    """
+    coords, edges, loop_edges, loop_faces = targets
+    if not len(loop_faces):
+        return None
+
+    segments = []
+    for co, no in cuts:
+        normal = np.array(no, dtype=np.float32)
+        distances = coords @ normal - np.dot(normal, np.array(co, dtype=np.float32))
+        side = distances > 0.0
+
+        crossing = side[edges[:, 0]] != side[edges[:, 1]]
+        index = np.flatnonzero(crossing)
+        if not len(index):
+            continue
+
+        # Where the plane meets each crossing edge
+        a, b = edges[index].T
+        t = distances[a] / (distances[a] - distances[b])
+        points = coords[a] + (coords[b] - coords[a]) * t[:, None]
+        row = np.empty(len(edges), dtype=np.int32)
+        row[index] = np.arange(len(index), dtype=np.int32)
+
+        # Pair the two crossing loops of each face
+        loops = np.flatnonzero(crossing[loop_edges])
+        faces = loop_faces[loops]
+        counts = np.bincount(faces)
+        loops = loops[counts[faces] == 2]
+        segments.append(points[row[loop_edges[loops]]].reshape(-1, 2, 3))
+
+    if not segments:
+        return None
+    return np.concatenate(segments)
+
+
+def _classify(obj, coords, cuts, mode):
+    """Sort an object by where its verts lie against the world-space `cuts`.
+
+    Signed distances of all verts to all planes are taken in one product.
+
+    :param coords: Local vertex coordinates, an (n, 3) numpy.ndarray.
+    :return: The action, "KEEP" when no plane changes the mesh, "CLEAR" when
+        the CUT plane clears all of it, or "BISECT"; and per plane whether
+        verts lie on both of its sides.
+    :rtype: tuple[str, list[bool]]
+    """
+    if not len(coords):
+        return "KEEP", [False] * len(cuts)
+
+    # Planes to local space, as rows of (normal, offset)
+    matrix_inv = obj.matrix_world.inverted()
+    matrix_no = obj.matrix_world.transposed()
+    normals = np.array([matrix_no @ no for _, no in cuts], dtype=np.float64)
+    origins = np.array([matrix_inv @ co for co, _ in cuts], dtype=np.float64)
+    offsets = np.einsum("ij,ij->i", normals, origins)
+
+    distances = coords @ normals.T - offsets
+    outer = (distances > PLANE_EPSILON).any(axis=0)
+    inner = (distances < -PLANE_EPSILON).any(axis=0)
+    crossing = (outer & inner).tolist()
 
-    geom = bm.verts[:] + bm.edges[:] + bm.faces[:]
-    geom = [g for g in geom if not g.hide]
+    if mode == "CUT":
+        if not outer[0]:
+            # Nothing to clear; the other planes lie deeper still
+            return ("BISECT" if any(crossing[1:]) else "KEEP"), crossing
+        if not inner[0]:
+            return "CLEAR", crossing
+        return "BISECT", crossing
+    return ("BISECT" if any(crossing) else "KEEP"), crossing
 
-    if flip:
-        plane_no = -plane_no
 
-    clear_outer = False
-    if mode == "CUT":
-        clear_outer = True
-
-    # Perform bisect
-    geom_cut = bmesh.ops.bisect_plane(
-        bm,
-        geom=geom,
-        plane_co=plane_co,
-        plane_no=plane_no,
-        clear_outer=clear_outer,
-        clear_inner=False,
-        use_snap_center=False,
-    )
+def _hidden(mesh):
+    """True if any vert, edge or face of a mesh is hidden."""
+    for seq in (mesh.vertices, mesh.edges, mesh.polygons):
+        hide = np.empty(len(seq), dtype=bool)
+        seq.foreach_get("hide", hide)
+        if hide.any():
+            return True
+    return False
+
+
+def _geom(bm, hidden=True):
+    """All visible elements of a bmesh, unfiltered when none are hidden."""
+    if not hidden:
+        for seq in (bm.verts, bm.edges, bm.faces):
+            seq.ensure_lookup_table()
+        return bm.verts[:] + bm.edges[:] + bm.faces[:]
+    return [g for seq in (bm.verts, bm.edges, bm.faces) for g in seq if not g.hide]
 
-    # Select the newly cut geometry
-    for geom_elem in geom_cut["geom_cut"]:
-        geom_elem.select = True
 
-    if clear_outer:
-        bmesh.ops.contextual_create(bm, geom=geom_cut["geom_cut"], mat_nr=0)
+def _clear(bm, hidden=True):
+    """Delete the visible geometry; what a CUT beyond all of it leaves."""
+    bmesh.ops.delete(bm, geom=_geom(bm, hidden), context="VERTS")
+
+
+def _bisect(obj, bm, cuts, mode, separate, crossing, hidden=True):
+    """Bisect the mesh with each of the world-space `cuts` in turn.
+
+    With mode CUT the first plane clears its outer side and is capped; the
+    others, and all of them with mode SPLIT, only cut. Planes that do not
+    cross the mesh, per `crossing`, are skipped. With `separate`, the mesh is
+    split apart along the cuts that are kept, capped again in CUT mode.
+    """
+
+    # obj.update_from_editmode()
+    matrix_inv = obj.matrix_world.inverted()
+    matrix_no = obj.matrix_world.transposed()
+
+    edges = []
+    for index, (plane_co_global, plane_no_global) in enumerate(cuts):
+        if not crossing[index]:
+            continue
+        clear_outer = mode == "CUT" and index == 0
+
+        plane_no = matrix_no @ plane_no_global
+        plane_co = matrix_inv @ plane_co_global
+
+        # Perform bisect
+        geom_cut = bmesh.ops.bisect_plane(
+            bm,
+            geom=_geom(bm, hidden),
+            plane_co=plane_co,
+            plane_no=plane_no,
+            clear_outer=clear_outer,
+            clear_inner=False,
+            use_snap_center=False,
+        )
+
+        # Select the newly cut geometry
+        for geom_elem in geom_cut["geom_cut"]:
+            geom_elem.select = True
+
+        if clear_outer:
+            bmesh.ops.contextual_create(bm, geom=geom_cut["geom_cut"], mat_nr=0)
+        else:
+            edges.extend(
+                g for g in geom_cut["geom_cut"] if isinstance(g, bmesh.types.BMEdge)
+            )
+
+    if separate:
+        # Later cuts can split or remove the edges of earlier ones
+        edges = [e for e in edges if e.is_valid]
+        split = bmesh.ops.split_edges(bm, edges=edges)
+        if mode == "CUT":
+            bmesh.ops.holes_fill(bm, edges=split["edges"], sides=0)
 
 
 def _snap(op, context, precision=False):
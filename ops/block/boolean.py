@@ -1,21 +1,42 @@
-from ...utils import modifier, addon
+from ...utils import modifier, addon, relations
+from ...utils import boolean as boolean_utils
 
 
 def add_modifier(bool_obj, obj, operation="DIFFERENCE"):
     """Add the boolean modifier"""
+    align = addon.pref().tools.block.align
+    if align.collection:
+        return boolean_utils.add(bool_obj, obj, operation, align.solver)
+
     mod = modifier.add(bool_obj, "Boolean", "BOOLEAN")
     mod.operation = operation
-    mod.solver = addon.pref().tools.block.align.solver
+    mod.solver = align.solver
     mod.object = obj
     mod.show_in_editmode = True
+    relations.refresh(bool_obj)
 
     return mod
 
 
+def remove_modifier(mod, cutter):
+    """Remove a single boolean modifier added for the cutter"""
+    if mod.mod.operand_type == "COLLECTION":
+        boolean_utils.unlink(cutter, mod.mod.collection)
+        boolean_utils.release(mod.obj, mod.mod)
+    else:
+        modifier.remove(mod.obj, mod.mod)
+        relations.refresh(mod.obj)
+
+
 def clear_modifiers(modifiers):
     """Clear all boolean modifiers"""
     if not modifiers.booleans:
         return
 
     for mod in modifiers.booleans:
-        modifier.remove(mod.obj, mod.mod)
+        if mod.mod.operand_type == "COLLECTION":
+            # Shared with earlier cuts; only drop it once nothing is left in it
+            boolean_utils.release(mod.obj, mod.mod)
+        else:
+            modifier.remove(mod.obj, mod.mod)
+            relations.refresh(mod.obj)
@@ -61,6 +61,10 @@ class Draw:
     # Per-axis snap flags detected at invoke; not user-controlled symmetry.
     axis_snap: tuple = (False, False)
     corner: Vector = field(default_factory=Vector)
+    # Live verts / subdivisions of a round cutter; 0 builds at the configured one
+    resolution: int = 0
+    # Freehand lasso samples, (region co, plane co) pairs
+    stroke: list = field(default_factory=list)
 
 @dataclass
 class BevelType:
@@ -84,6 +88,12 @@ class Bisect:
     plane: tuple = field(default_factory=lambda: (Vector(), Vector()))
     mode: str = "CUT"
     flip: bool = False
+    # Parallel planes cut at once; see bisect.planes
+    count: int = 1
+    spacing: float = 0.1
+    separate: bool = False
+    # Cached target arrays for the section preview; see bisect.preview
+    targets: tuple = None
 
 @dataclass
 class ExtrudeEdge:
@@ -161,11 +171,12 @@ class EditHistory:
     """In-modal undo/redo for NGON/NHEDRON point editing.
 
     Each entry is an ordered snapshot of the editable face's vertex
-    coordinates (object-local, as plain tuples). ``index`` is the current
-    state; committing a new action truncates the redo tail and appends.
+    coordinates (object-local, a read-only float32 array of shape (n, 3)).
+    ``index`` is the current state; committing a new action truncates the
+    redo tail and appends.
     """
 
-    states: list = field(default_factory=list)  # list[tuple[tuple[float, float, float], ...]]
+    states: list = field(default_factory=list)  # list[numpy.ndarray]
     index: int = -1
     max_depth: int = 64
 
@@ -188,6 +199,7 @@ class Objects:
     selected: list = field(default_factory=list)
     created: bpy.types.Object = None
     duplicated: list = field(default_factory=list)
+    sources: dict = field(default_factory=dict)  # duplicate -> source object
     detected: str = ""
 
 @dataclass
@@ -515,6 +527,25 @@ class BisectPref(bpy.types.PropertyGroup):
         default="CUT",
     )
     flip: bpy.props.BoolProperty(name="Flip", description="Flip", default=False)
+    count: bpy.props.IntProperty(
+        name="Count",
+        description="Number of parallel planes to cut with",
+        default=1,
+        min=1,
+        max=256,
+    )
+    spacing: bpy.props.FloatProperty(
+        name="Spacing",
+        description="Distance between the parallel planes, stepping into the kept side",
+        default=0.1,
+        min=0.0,
+        subtype="DISTANCE",
+    )
+    separate: bpy.props.BoolProperty(
+        name="Separate",
+        description="Split the mesh apart along the parallel cuts",
+        default=False,
+    )
     plane: bpy.props.PointerProperty(type=Plane)
 
 class Pref(bpy.types.PropertyGroup):
@@ -4,6 +4,8 @@ from mathutils import Matrix, Vector
 
 from ...utils import view3d
 from ...utilsbmesh import circle, corner, ngon, rectangle, sphere, triangle
+from ...utilsbmesh.mesh import indexes
+from . import lasso, resolution
 
 def _build_plane_matrix(plane, direction):
     location, normal = plane
@@ -44,31 +46,30 @@ def invoke(op, context):
     shape = op.config.shape
     match shape:
         case "RECTANGLE":
-            op.data.draw.faces = rectangle.create(bm, plane)
+            op.data.draw.faces = indexes(bm, rectangle.create(bm, plane))
         case "NGON":
             op.data.draw.faces, op.data.draw.verts = ngon.create(bm, plane)
         case "NHEDRON":
             op.data.draw.faces, op.data.draw.verts = ngon.create(bm, plane)
         case "BOX":
-            op.data.draw.faces = rectangle.create(bm, plane)
-        case "CIRCLE":
-            op.data.draw.faces = circle.create(
-                bm, plane, verts_number=op.shape.circle.verts
-            )
-        case "CYLINDER":
-            op.data.draw.faces = circle.create(
-                bm, plane, verts_number=op.shape.cylinder.verts
-            )
+            op.data.draw.faces = indexes(bm, rectangle.create(bm, plane))
+        case "CIRCLE" | "CYLINDER":
+            faces = circle.create(bm, plane, verts_number=resolution.start(op))
+            op.data.draw.faces = indexes(bm, faces)
         case "SPHERE":
-            op.data.draw.faces = sphere.create(
-                bm, plane, direction, subdivisions=op.shape.sphere.subdivisions
+            faces = sphere.create(
+                bm, plane, direction, subdivisions=resolution.start(op)
             )
+            op.data.draw.faces = indexes(bm, faces)
         case "CORNER":
-            op.data.draw.faces = corner.create(bm, plane)
+            op.data.draw.faces = indexes(bm, corner.create(bm, plane))
         case "TRIANGLE":
-            op.data.draw.faces = triangle.create(bm, plane)
+            op.data.draw.faces = indexes(bm, triangle.create(bm, plane))
         case "PRISM":
-            op.data.draw.faces = triangle.create(bm, plane)
+            op.data.draw.faces = indexes(bm, triangle.create(bm, plane))
+
+    if lasso.active(op):
+        lasso.start(op, context)
 
     op.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
     return True
@@ -88,6 +89,11 @@ def modal(op, context, event):
     verts = op.data.draw.verts
     increments = op.config.align.increments if op.config.snap else 0.0
 
+    if lasso.active(op):
+        # Only the preview follows the stroke; the face is built on release
+        lasso.modal(op, context)
+        return
+
     if shape not in ["NGON", "NHEDRON"]:
         bevel_verts = [obj.matrix_world @ v.co.copy() for v in faces[0].verts]
         op.data.bevel.origin = sum(bevel_verts, Vector()) / len(bevel_verts)
@@ -143,6 +149,9 @@ def modal(op, context, event):
                 )
 
     sd = op.shape.data
+    if shape in {"CIRCLE", "CYLINDER", "SPHERE"}:
+        faces = resolution.update(op, context, faces, abs(sd.radius))
+
     match shape:
         case "RECTANGLE" | "BOX":
             co = sd.size
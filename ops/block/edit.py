@@ -1,8 +1,9 @@
-import math
-from mathutils import Matrix
-from ...utils import addon, view3d
+from mathutils import Matrix, Vector
+from ...utils import addon, lazy, view3d
 from ...utilsbmesh import ngon
 
+np = lazy.module("numpy")
+
 def invoke(op, context):
     """Build the mesh data"""
 
@@ -22,7 +23,7 @@ def invoke(op, context):
     return True
 
 def enter_from_converted(op, context):
-    """Enter EDIT on a TAB-converted primitive face.
+    """Enter EDIT on a TAB-converted primitive face or a traced lasso face.
 
     edit_mode stays NONE (free hover) instead of invoke's INIT auto-grab, so a
     stray click can't immediately finalize.
@@ -111,31 +112,11 @@ def modal(op, context, event):
     if op.edit_mode == "GET":
         if op.data.draw.faces:
             face = bm.faces[op.data.draw.faces[0]]
-
-            for e in face.edges:
-                mid_edge_co = (e.verts[0].co + e.verts[1].co) / 2
-                # Transform from object local space to world space for projection
-                mid_edge_co_world = matrix_world @ mid_edge_co
-                reg = view3d.location_3d_to_region_2d(
-                    region, rv3d, mid_edge_co_world, default=obj.location
-                )
-                if _is_near(region, mouse, reg):
-                    op.edit_mode = "ADD_VERT"
-                    op.edit_point = e.index
-                    op.highlight_type = "EDGE"
-                    break
-
-            for v in face.verts:
-                # Transform from object local space to world space for projection
-                v_co_world = matrix_world @ v.co
-                reg = view3d.location_3d_to_region_2d(
-                    region, rv3d, v_co_world, default=obj.location
-                )
-                if _is_near(region, mouse, reg):
-                    op.edit_mode = "MOVE"
-                    op.edit_point = v.index
-                    op.highlight_type = "VERTEX"
-                    break
+            kind, elem, _co = _hover(context, face, matrix_world, mouse)
+            if kind is not None:
+                op.edit_mode = "ADD_VERT" if kind == "EDGE" else "MOVE"
+                op.edit_point = elem.index
+                op.highlight_type = kind
 
     if op.edit_mode == "GET":
         op.edit_mode = "END"
@@ -294,31 +275,11 @@ def modal(op, context, event):
 
         if op.data.draw.faces:
             face = bm.faces[op.data.draw.faces[0]]
-
-            for e in face.edges:
-                mid_edge_co = (e.verts[0].co + e.verts[1].co) / 2
-                # Transform from object local space to world space for projection
-                mid_edge_co_world = matrix_world @ mid_edge_co
-                reg = view3d.location_3d_to_region_2d(
-                    region, rv3d, mid_edge_co_world, default=obj.location
-                )
-                if _is_near(region, mouse, reg):
-                    highlight = [mid_edge_co_world]
-                    op.highlight_type = "EDGE"
-                    op.highlight_index = e.index
-                    break
-
-            for v in face.verts:
-                # Transform from object local space to world space for projection
-                v_co_world = matrix_world @ v.co
-                reg = view3d.location_3d_to_region_2d(
-                    region, rv3d, v_co_world, default=obj.location
-                )
-                if _is_near(region, mouse, reg):
-                    highlight = [v_co_world]
-                    op.highlight_type = "VERTEX"
-                    op.highlight_index = v.index
-                    break
+            kind, elem, co = _hover(context, face, matrix_world, mouse)
+            if kind is not None:
+                highlight = [co]
+                op.highlight_type = kind
+                op.highlight_index = elem.index
 
             theme = addon.pref().theme.ops.block
             # Edge-midpoint hover is the "add vertex" hint (green); hovering an
@@ -326,10 +287,33 @@ def modal(op, context, event):
             color = theme.add if op.highlight_type == "EDGE" else theme.active
             op.ui.active.callback.update_batch(highlight, color=color)
 
-def _is_near(region, point1, point2):
-    """Check if point2 is within 'threshold' pixels of point1."""
-    height = region.height
-    width = region.width
-    threshold = 0.02 * max(width, height)
-    dist = math.hypot(point2[0] - point1[0], point2[1] - point1[1])
-    return dist < threshold
+def _hover(context, face, matrix_world, mouse):
+    """Find the vertex or edge midpoint of `face` under the mouse.
+
+    Projects all of them in one pass and takes the nearest within 2% of the
+    region size; a vertex wins over an edge midpoint.
+
+    Returns ``(kind, element, world location)`` with kind "VERTEX" or "EDGE",
+    or ``(None, None, None)`` when nothing is near.
+    """
+    region = context.region
+    threshold = 0.02 * max(region.width, region.height)
+
+    loops = face.loops
+    count = len(loops)
+    co = np.array([loop.vert.co for loop in loops], dtype=np.float64)
+    mids = (co + np.roll(co, -1, axis=0)) / 2
+    region_co, visible = view3d.locations_3d_to_region_2d(
+        region, context.region_data, np.concatenate((co, mids)), matrix=matrix_world
+    )
+
+    index, dist = view3d.nearest_region_2d(region_co[:count], visible[:count], mouse)
+    if dist < threshold:
+        vert = loops[index].vert
+        return "VERTEX", vert, matrix_world @ vert.co
+
+    index, dist = view3d.nearest_region_2d(region_co[count:], visible[count:], mouse)
+    if dist < threshold:
+        return "EDGE", loops[index].edge, matrix_world @ Vector(mids[index])
+
+    return None, None, None
@@ -4,6 +4,7 @@ from ...utils import view3d
 from ...utils.scene import ray_cast
 from ...utils.types import DrawVert
 from ...utilsbmesh import corner, facet
+from ...utilsbmesh.mesh import indexes, reindex
 from . import ui as block_ui
 from .data import ExtrudeEdge
 
@@ -36,18 +37,15 @@ def invoke(op, context, event):
     match shape:
         case "CORNER":
             op.data.extrude.value = 0.2
-            extruded_faces_indexes, mid_edge_index = corner.extrude(
+            extruded_faces, mid_edge = corner.extrude(
                 bm, draw_faces, direction, normal, rotations, op.data.extrude.value
             )
-            op.data.extrude.faces = extruded_faces_indexes
-            op.data.extrude.edges = [
-                ExtrudeEdge(index=mid_edge_index, position="MID")
-            ]
             # Only non-ADD modes use a cutter buffer; in ADD ``pref.offset`` is 0.
             if op.config.mode != "ADD":
-                corner.offset(
-                    bm, extruded_faces_indexes, direction, normal, rotations, offset
-                )
+                corner.offset(bm, extruded_faces, direction, normal, rotations, offset)
+
+            op.data.extrude.faces = indexes(bm, extruded_faces)
+            op.data.extrude.edges = [ExtrudeEdge(index=mid_edge.index, position="MID")]
 
             # Skip the snapshot when BEVEL will take over immediately —
             # the depth never changes again, so modal doesn't run.
@@ -57,28 +55,29 @@ def invoke(op, context, event):
                 # bake the per-vert direction so modal can play it back
                 # without recomputing the partition every frame.
                 n1, n2, avg, cos_half = corner.normals(direction, normal, rotations)
-                top_faces = [bm.faces[fi] for fi in extruded_faces_indexes[-2:]]
+                top_faces = extruded_faces[-2:]
                 v_dirs = corner.vert_dirs(top_faces, n1, n2, avg, cos_half)
                 initial_dz = op.data.extrude.value
                 op.data.extrude.verts = [
                     DrawVert(
-                        index=vi,
-                        co=(bm.verts[vi].co - v_dirs[vi] * initial_dz).copy(),
-                        direction=v_dirs[vi].copy(),
+                        index=v.index,
+                        co=(v.co - v_dir * initial_dz).copy(),
+                        direction=v_dir.copy(),
                     )
-                    for vi in v_dirs
+                    for v, v_dir in v_dirs.items()
                 ]
 
         case _:
-            extruded_faces_indexes = facet.extrude(bm, draw_face, plane, 0.0)
+            extruded_faces = facet.extrude(bm, draw_face, plane, 0.0)
+            reindex(bm)
 
-            op.data.extrude.faces = extruded_faces_indexes
-            op.data.draw.faces[0] = extruded_faces_indexes[0]
-            extrude_face = bm.faces[op.data.extrude.faces[-1]]
+            op.data.extrude.faces = [f.index for f in extruded_faces]
+            op.data.draw.faces[0] = extruded_faces[0].index
+            extrude_face = extruded_faces[-1]
             op.data.extrude.verts = [
                 DrawVert(index=v.index, co=v.co.copy()) for v in extrude_face.verts
             ]
-            draw_face = bm.faces[op.data.draw.faces[0]]
+            draw_face = extruded_faces[0]
             op.data.draw.verts = [
                 DrawVert(index=v.index, co=v.co.copy()) for v in draw_face.verts
             ]
@@ -362,11 +361,11 @@ def uniform(op, context):
 
         # Persist raw depth (without buffer) so F9 rebuild re-applies the buffer.
         op.data.extrude.value = -depth
-        op.data.extrude.faces = extruded_faces
+        op.data.extrude.faces = indexes(bm, extruded_faces)
         op.shape.data.extrusion = -depth
 
         if was_selected:
-            for face_idx in extruded_faces:
-                bm.faces[face_idx].select_set(True)
+            for extruded_face in extruded_faces:
+                extruded_face.select_set(True)
 
         op.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
@@ -0,0 +1,136 @@
+"""Freehand lasso drawing of NGON and NHEDRON cutters.
+
+With the tool's freehand option on, the drag that draws an NGON or NHEDRON
+traces its outline instead of placing the first point. Mouse samples closer
+than ``SAMPLE_PIXELS`` to the last kept one are dropped as they stream in,
+and only a preview line is redrawn while tracing; the bmesh is left alone.
+On release the stroke is simplified with Ramer-Douglas-Peucker at a
+screen-space tolerance and the kept points become the cutter face in one
+rebuild, which then drops into point editing.
+"""
+
+from ...utils import lazy, view3d
+from ...utilsbmesh import ngon
+from . import edit
+
+np = lazy.module("numpy")
+
+# Screen distance in pixels the mouse has to travel for a new sample
+SAMPLE_PIXELS = 4.0
+
+# Screen distance in pixels a dropped sample may lie off the simplified outline
+TOLERANCE_PIXELS = 2.0
+
+
+def active(op):
+    """True when the cutter being drawn is traced freehand."""
+    return op.config.form.lasso and op.config.shape in {"NGON", "NHEDRON"}
+
+
+def start(op, context):
+    """Begin the stroke at the point the drag started from."""
+    op.data.draw.stroke = []
+    _sample(op, context, op.mouse.init)
+
+
+def modal(op, context):
+    """Add the mouse position to the stroke and redraw the preview."""
+    if _sample(op, context, op.mouse.co):
+        _preview(op)
+
+
+def commit(op, context):
+    """Replace the placeholder face with the simplified stroke.
+
+    :return: False if the stroke is too short to make a face; the placeholder
+        is then kept for the regular point by point drawing.
+    """
+    stroke = op.data.draw.stroke
+    op.data.draw.stroke = []
+    op.ui.guid.callback.clear()
+    if len(stroke) < 3:
+        return False
+
+    region_co = np.array([co for co, _ in stroke], dtype=np.float64)
+    keep = simplify(region_co, TOLERANCE_PIXELS)
+    if len(keep) < 3:
+        return False
+
+    bm = op.data.bm
+    op.data.draw.faces[0] = ngon.trace(
+        bm, op.data.draw.faces[0], [stroke[i][1] for i in keep]
+    )
+    edit.enter_from_converted(op, context)
+    return True
+
+
+def simplify(points, tolerance):
+    """Ramer-Douglas-Peucker simplification of a polyline.
+
+    :param points: Polyline points.
+    :type points: :class:`numpy.ndarray` of shape (n, 2)
+    :param tolerance: Largest distance a dropped point may have from the
+        simplified polyline.
+    :type tolerance: float
+    :return: Sorted indices of the points kept, first and last included.
+    :rtype: list[int]
+    """
+    count = len(points)
+    if count < 3:
+        return list(range(count))
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    spans = [(0, count - 1)]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+        start = points[first]
+        chord = points[last] - start
+        offsets = points[first + 1 : last] - start
+        length = np.hypot(*chord)
+        if length > 0.0:
+            # Perpendicular distance from the chord
+            dist = np.abs(chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0])
+            dist /= length
+        else:
+            # A closed span; measure from its end points instead
+            dist = np.hypot(offsets[:, 0], offsets[:, 1])
+        index = int(np.argmax(dist))
+        if dist[index] <= tolerance:
+            continue
+        split = first + 1 + index
+        keep[split] = True
+        spans.append((first, split))
+        spans.append((split, last))
+
+    return np.flatnonzero(keep).tolist()
+
+
+def _sample(op, context, co):
+    """Append a screen point and its plane location to the stroke.
+
+    :return: True if the point was far enough from the last one to be kept.
+    """
+    stroke = op.data.draw.stroke
+    if stroke and (co - stroke[-1][0]).length < SAMPLE_PIXELS:
+        return False
+    point = view3d.region_2d_to_plane_3d(
+        context.region,
+        context.region_data,
+        co,
+        op.data.draw.matrix.plane,
+        matrix=op.data.obj.matrix_world,
+    )
+    if point is None:
+        return False
+    stroke.append((co.copy(), point))
+    return True
+
+
+def _preview(op):
+    """Draw the stroke, closed back to its start, as guide lines."""
+    matrix_world = op.data.obj.matrix_world
+    points = [matrix_world @ point for _, point in op.data.draw.stroke]
+    op.ui.guid.callback.update_batch(list(zip(points, points[1:] + points[:1])))
@@ -3,10 +3,8 @@ import math
 import bmesh
 import bpy
 
-from ...utils import addon, scene
+from ...utils import addon, scene, timing
 from ...utilsbmesh import (
-    bmeshedge,
-    bmeshface,
     circle,
     corner,
     cylinder,
@@ -16,8 +14,8 @@ from ...utilsbmesh import (
     sphere,
     triangle,
 )
-from ...utilsbmesh.mesh import get_copy, remove_doubles, set_copy
-from . import draw, extrude
+from ...utilsbmesh.mesh import get_copy, indexes, remove_doubles, set_copy
+from . import draw, extrude, resolution
 from .data import Config
 from .operator import Block
 
@@ -29,7 +27,9 @@ class BOUT_OT_BlockMeshTool(Block):
 
     @classmethod
     def poll(cls, context):
-        return context.area.type == "VIEW_3D" and context.mode == "EDIT_MESH"
+        # Headless runs have no area; only the execute path is used there
+        in_view = bpy.app.background or context.area.type == "VIEW_3D"
+        return in_view and context.mode == "EDIT_MESH"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -67,6 +67,7 @@ class BOUT_OT_BlockMeshTool(Block):
         bm = bmesh.from_edit_mesh(obj.data)
         return bm
 
+    @timing.timed("update_bmesh")
     def update_bmesh(self, obj, bm, loop_triangles=True, destructive=True):
         mesh = obj.data
         bm.normal_update()
@@ -74,6 +75,7 @@ class BOUT_OT_BlockMeshTool(Block):
             mesh, loop_triangles=loop_triangles, destructive=destructive
         )
 
+    @timing.timed("build_geometry")
     def build_geometry(self, obj, bm, ui=False, apply_boolean=True):
         """Build the block geometry into `bm` using current pref values.
 
@@ -115,8 +117,8 @@ class BOUT_OT_BlockMeshTool(Block):
 
         match shape:
             case "RECTANGLE":
-                faces_indexes = rectangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                faces = rectangle.create(bm, plane)
+                face = faces[0]
                 rectangle.set_xy(
                     face,
                     plane,
@@ -127,24 +129,21 @@ class BOUT_OT_BlockMeshTool(Block):
                 )
                 facet.set_z(face, normal, offset)
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         bevel_round_offset,
                         bevel_segments=bevel_round_segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
                 if mode != "ADD":
                     extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    faces[0] = extruded_faces[0]
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if mode != "ADD":
-                    if apply_boolean:
-
-                        self._boolean(self.pref.mode, obj, bm, ui)
             case "BOX":
-                faces_indexes = rectangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                faces = rectangle.create(bm, plane)
+                face = faces[0]
                 rectangle.set_xy(
                     face,
                     plane,
@@ -154,37 +153,30 @@ class BOUT_OT_BlockMeshTool(Block):
                     symmetry=symmetry_draw,
                 )
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         bevel_round_offset,
                         bevel_segments=bevel_round_segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
                 facet.set_z(face, normal, offset)
                 extruded_faces = facet.extrude(bm, face, plane, extrusion)
-                self._recalculate_normals(bm, extruded_faces)
+                bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                faces[0] = extruded_faces[0]
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, extruded_faces[0]), normal, -extrusion
-                    )
+                    facet.set_z(extruded_faces[0], normal, -extrusion)
                 if self.pref.bevel.fill.enable:
-                    face_index = extruded_faces[-1]
-                    face = bmeshface.from_index(bm, face_index)
-                    edges = face.edges
-                    verts_indicies = facet.bevel_edges(
+                    edges = extruded_faces[-1].edges
+                    verts = facet.bevel_edges(
                         bm, edges, bevel_fill_offset, bevel_segments=bevel_fill_segments
                     )
-                    remove_doubles(bm, verts_indicies)
+                    remove_doubles(bm, verts)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case "CIRCLE":
-                faces_indexes = circle.create(
-                    bm, plane, verts_number=self.shape.circle.verts
-                )
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                faces = circle.create(bm, plane, verts_number=resolution.current(self))
+                face = faces[0]
                 radius = self.shape.circle.radius
                 circle.set_xy(
                     face,
@@ -196,18 +188,15 @@ class BOUT_OT_BlockMeshTool(Block):
                 )
                 facet.set_z(face, normal, offset)
                 if mode != "ADD":
-                    cylinder_faces_indexes = facet.extrude(bm, face, plane, extrusion)
-                    self._recalculate_normals(bm, cylinder_faces_indexes)
+                    extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                    faces[0] = extruded_faces[0]
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if mode != "ADD":
-                    if apply_boolean:
-
-                        self._boolean(self.pref.mode, obj, bm, ui)
             case "CYLINDER":
-                faces_indexes = circle.create(
-                    bm, plane, verts_number=self.shape.cylinder.verts
+                faces = circle.create(
+                    bm, plane, verts_number=resolution.current(self)
                 )
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                face = faces[0]
                 circle.set_xy(
                     face,
                     plane,
@@ -217,43 +206,30 @@ class BOUT_OT_BlockMeshTool(Block):
                     local_space=True,
                 )
                 facet.set_z(face, normal, offset)
-                cylinder_faces_indexes = facet.extrude(bm, face, plane, extrusion)
-                self._recalculate_normals(bm, cylinder_faces_indexes)
+                extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                faces[0] = extruded_faces[0]
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, cylinder_faces_indexes[0]),
-                        normal,
-                        -extrusion,
-                    )
+                    facet.set_z(extruded_faces[0], normal, -extrusion)
                 if self.pref.bevel.fill.enable:
                     cylinder.bevel(
                         bm,
-                        cylinder_faces_indexes,
+                        extruded_faces,
                         bevel_fill_offset,
                         bevel_segments=bevel_fill_segments,
                     )
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case "SPHERE":
-                sphere.create(
+                faces = sphere.create(
                     bm,
                     plane,
                     direction,
                     radius=self.shape.sphere.radius,
-                    subdivisions=self.shape.sphere.subdivisions,
+                    subdivisions=resolution.current(self),
                 )
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case "CORNER":
-                faces_indexes = corner.create(bm, plane)
-                faces = [
-                    bmeshface.from_index(bm, faces_indexes[0]),
-                    bmeshface.from_index(bm, faces_indexes[1]),
-                ]
+                faces = corner.create(bm, plane)
                 corner.set_xy(
                     faces,
                     plane,
@@ -263,73 +239,65 @@ class BOUT_OT_BlockMeshTool(Block):
                     local_space=True,
                 )
                 rotations = (self.shape.corner.rotation_a, self.shape.corner.rotation_b)
-                extruded_face_indexes, edge_index = corner.extrude(
+                extruded_faces, edge = corner.extrude(
                     bm, faces, direction, normal, rotations, extrusion
                 )
-                corner.offset(
-                    bm, extruded_face_indexes, direction, normal, rotations, offset
-                )
+                corner.offset(bm, extruded_faces, direction, normal, rotations, offset)
                 if self.pref.bevel.round.enable:
-                    edge = bmeshedge.from_index(bm, edge_index)
-                    corner.bevel(
+                    verts = corner.bevel(
                         bm,
                         edge,
                         bevel_round_offset,
                         bevel_segments=bevel_round_segments,
                     )
+                    # The bevel rebuilds both draw faces around the mid edge
+                    if verts:
+                        faces = [verts[0].link_faces[0]]
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case "NGON":
                 face = ngon.new(bm, self.shape.ngon.points)
-                faces_indexes = [face.index]
+                faces = [face]
                 facet.set_z(face, normal, offset)
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         bevel_round_offset,
                         bevel_segments=bevel_round_segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
                 if mode != "ADD":
                     extruded_faces = facet.extrude(bm, face, plane, extrusion)
-                    self._recalculate_normals(bm, extruded_faces)
+                    bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                    faces[0] = extruded_faces[0]
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if mode != "ADD":
-                    if apply_boolean:
-                        self._boolean(self.pref.mode, obj, bm, ui)
             case "NHEDRON":
                 face = ngon.new(bm, self.shape.nhedron.points)
-                faces_indexes = [face.index]
+                faces = [face]
                 facet.set_z(face, normal, offset)
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         bevel_round_offset,
                         bevel_segments=bevel_round_segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
                 extruded_faces = facet.extrude(bm, face, plane, extrusion)
-                self._recalculate_normals(bm, extruded_faces)
+                bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                faces[0] = extruded_faces[0]
                 if self.pref.bevel.fill.enable:
-                    face_index = extruded_faces[-1]
-                    face = bmeshface.from_index(bm, face_index)
-                    edges = face.edges
-                    verts_indicies = facet.bevel_edges(
+                    edges = extruded_faces[-1].edges
+                    verts = facet.bevel_edges(
                         bm, edges, bevel_fill_offset, bevel_segments=bevel_fill_segments
                     )
-                    remove_doubles(bm, verts_indicies)
+                    remove_doubles(bm, verts)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case "TRIANGLE":
-                faces_indexes = triangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                faces = triangle.create(bm, plane)
+                face = faces[0]
                 x = self.shape.triangle.height * math.cos(self.shape.triangle.angle)
                 y = self.shape.triangle.height * math.sin(self.shape.triangle.angle)
                 triangle.set_xy(
@@ -343,27 +311,24 @@ class BOUT_OT_BlockMeshTool(Block):
                 )
                 facet.set_z(face, normal, offset)
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         self.pref.bevel.round.offset,
                         bevel_segments=self.pref.bevel.round.segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
 
                 if mode != "ADD":
                     extruded_faces = facet.extrude(bm, face, plane, extrusion)
-                    self._recalculate_normals(bm, extruded_faces)
+                    bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                    faces[0] = extruded_faces[0]
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if mode != "ADD":
-                    if apply_boolean:
-
-                        self._boolean(self.pref.mode, obj, bm, ui)
             case "PRISM":
                 pri = self.shape.prism
-                faces_indexes = triangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                faces = triangle.create(bm, plane)
+                face = faces[0]
                 x = pri.height * math.cos(pri.angle)
                 y = pri.height * math.sin(pri.angle)
                 triangle.set_xy(
@@ -376,36 +341,37 @@ class BOUT_OT_BlockMeshTool(Block):
                     flip=pri.flip,
                 )
                 if self.pref.bevel.round.enable:
-                    face_index = facet.bevel_verts(
+                    face = facet.bevel_verts(
                         bm,
                         face,
                         self.pref.bevel.round.offset,
                         bevel_segments=self.pref.bevel.round.segments,
                     )
-                    face = bmeshface.from_index(bm, face_index)
                     facet.remove_doubles(bm, face)
+                    faces[0] = face
 
                 facet.set_z(face, normal, offset)
                 extruded_faces = facet.extrude(bm, face, plane, extrusion)
-                self._recalculate_normals(bm, extruded_faces)
+                bmesh.ops.recalc_face_normals(bm, faces=extruded_faces)
+                faces[0] = extruded_faces[0]
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, extruded_faces[0]), normal, -extrusion
-                    )
+                    facet.set_z(extruded_faces[0], normal, -extrusion)
                 if self.pref.bevel.fill.enable:
-                    face_index = extruded_faces[-1]
-                    face = bmeshface.from_index(bm, face_index)
-                    edges = face.edges
-                    verts_indicies = facet.bevel_edges(
+                    edges = extruded_faces[-1].edges
+                    verts = facet.bevel_edges(
                         bm, edges, bevel_fill_offset, bevel_segments=bevel_fill_segments
                     )
-                    remove_doubles(bm, verts_indicies)
+                    remove_doubles(bm, verts)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
-                if apply_boolean:
-                    self._boolean(self.pref.mode, obj, bm, ui)
             case _:
                 raise ValueError(f"Unsupported shape: {self.shape.active}")
 
+        # The build's one reindex; it runs before the boolean, which can
+        # consume the cutter, and callers keep the indices across frames
+        faces_indexes = indexes(bm, faces)
+        if apply_boolean:
+            self._boolean(mode, obj, bm, ui)
+
         return faces_indexes
 
     def _draw_invoke(self, context, event):
@@ -417,11 +383,21 @@ class BOUT_OT_BlockMeshTool(Block):
     def _draw_modal(self, context, event):
         if self.config.mode != "ADD" and self.config.shape == "SPHERE":
             get_copy(self.data.obj, self.data.bm, self.data.copy.draw)
+            live = self.data.draw.resolution
             super()._draw_modal(context, event)
+            if self.data.draw.resolution != live:
+                # Resampled; restore the new cutter from now on
+                self._replace_draw_copy()
             self._boolean(self.config.mode, self.data.obj, self.data.bm)
         else:
             super()._draw_modal(context, event)
 
+    def _replace_draw_copy(self):
+        old = self.data.copy.draw
+        self.data.copy.draw = set_copy(self.data.obj, self.data.copy.all)
+        self.data.copy.all.remove(old)
+        bpy.data.meshes.remove(old)
+
     def _extrude_invoke(self, context, event):
         super()._extrude_invoke(context, event)
         if self.config.mode != "ADD":
@@ -433,6 +409,7 @@ class BOUT_OT_BlockMeshTool(Block):
         super()._extrude_modal(context, event)
         self._boolean(self.config.mode, self.data.obj, self.data.bm)
 
+    @timing.timed("boolean")
     def _boolean(self, mode, obj, bm, ui=False):
         if mode != "ADD":
             if ui:
@@ -555,6 +532,9 @@ class BOUT_OT_BlockMeshTool(Block):
                 self.pref.bisect.plane.normal,
                 self.pref.bisect.flip,
                 self.pref.bisect.mode,
+                self.pref.bisect.count,
+                self.pref.bisect.spacing,
+                self.pref.bisect.separate,
             )
             bisect_mod.execute(self, context, obj, bm, bisect_data)
             self.save_props()
@@ -676,6 +656,14 @@ class BOUT_OT_BlockMeshTool(Block):
 
     def _finish(self, context):
         if not self.state.is_bisect:
+            if self.is_3d and resolution.reduced(self):
+                # A sphere is 3D without an extrude, which restores the others;
+                # rebuild it at the configured resolution, as the F9 redo does
+                self.data.draw.resolution = 0
+                self._update_geometry()
+            else:
+                resolution.restore(self)
+
             if self.config.mode != "ADD":
                 # 2D-final shapes need a raycast-driven extrude here to
                 # turn the flat cutter into a 3D volume before booleaning.
@@ -4,10 +4,11 @@ import bmesh
 import bpy
 import mathutils
 
-from ...utils import addon, collection, infobar, modifier, scene
+from ...utils import addon, collection, infobar, modifier, scene, timing
+from ...utils import boolean as boolean_utils
+from ...utils import mesh as mesh_utils
 from ...utilsmath import geometry
 from ...utilsbmesh import (
-    bmeshface,
     circle,
     corner,
     facet,
@@ -16,7 +17,8 @@ from ...utilsbmesh import (
     sphere,
     triangle,
 )
-from . import bevel, boolean, draw, extrude, weld
+from ...utilsbmesh.mesh import indexes
+from . import bevel, boolean, draw, extrude, resolution, weld
 from .data import Config, Modifier
 from .operator import Block
 from .transform import common as transform_common
@@ -29,7 +31,8 @@ class BOUT_OT_BlockObjTool(Block):
 
     @classmethod
     def poll(cls, context):
-        return context.area.type == "VIEW_3D"
+        # Headless runs have no area; only the execute path is used there
+        return bpy.app.background or context.area.type == "VIEW_3D"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -107,6 +110,7 @@ class BOUT_OT_BlockObjTool(Block):
 
         return bm
 
+    @timing.timed("build_geometry")
     def build_geometry(self, obj, bm):
         mode = self.pref.mode
         offset = self.pref.offset
@@ -142,8 +146,7 @@ class BOUT_OT_BlockObjTool(Block):
 
         match shape:
             case "RECTANGLE":
-                faces_indexes = rectangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                face = rectangle.create(bm, plane)[0]
                 rectangle.set_xy(
                     face,
                     plane,
@@ -157,14 +160,14 @@ class BOUT_OT_BlockObjTool(Block):
                     bevel.mod.verts(obj, bevel_round)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 else:
-                    extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    extruded = facet.extrude(bm, face, plane, extrusion)
+                    extruded_faces = indexes(bm, extruded)
                     self._recalculate_normals(bm, extruded_faces)
                     bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                     self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "BOX":
-                faces_indexes = rectangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                face = rectangle.create(bm, plane)[0]
                 rectangle.set_xy(
                     face,
                     plane,
@@ -174,20 +177,18 @@ class BOUT_OT_BlockObjTool(Block):
                     symmetry=symmetry_draw,
                 )
                 facet.set_z(face, normal, offset)
-                extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                extruded = facet.extrude(bm, face, plane, extrusion)
+                extruded_faces = indexes(bm, extruded)
                 self._recalculate_normals(bm, extruded_faces)
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, extruded_faces[0]), normal, -extrusion
-                    )
+                    facet.set_z(extruded[0], normal, -extrusion)
                 bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "CIRCLE":
-                faces_indexes = circle.create(
+                face = circle.create(
                     bm, plane, verts_number=self.shape.circle.verts
-                )
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                )[0]
                 radius = self.shape.circle.radius
                 circle.set_xy(
                     face,
@@ -202,16 +203,16 @@ class BOUT_OT_BlockObjTool(Block):
                     bevel.mod.verts(obj, bevel_round)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 else:
-                    extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    extruded = facet.extrude(bm, face, plane, extrusion)
+                    extruded_faces = indexes(bm, extruded)
                     self._recalculate_normals(bm, extruded_faces)
                     bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                     self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "CYLINDER":
-                faces_indexes = circle.create(
+                face = circle.create(
                     bm, plane, verts_number=self.shape.cylinder.verts
-                )
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                )[0]
                 circle.set_xy(
                     face,
                     plane,
@@ -221,28 +222,27 @@ class BOUT_OT_BlockObjTool(Block):
                     local_space=True,
                 )
                 facet.set_z(face, normal, offset)
-                extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                extruded = facet.extrude(bm, face, plane, extrusion)
+                extruded_faces = indexes(bm, extruded)
                 self._recalculate_normals(bm, extruded_faces)
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, extruded_faces[0]), normal, -extrusion
-                    )
+                    facet.set_z(extruded[0], normal, -extrusion)
                 bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "SPHERE":
-                faces_indexes = sphere.create(
+                faces = sphere.create(
                     bm,
                     plane,
                     direction,
                     radius=self.shape.sphere.radius,
                     subdivisions=self.shape.sphere.subdivisions,
                 )
+                faces_indexes = indexes(bm, faces)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, faces_indexes[0])
             case "CORNER":
-                faces_indexes = corner.create(bm, plane)
-                faces = [bmeshface.from_index(bm, index) for index in faces_indexes]
+                faces = corner.create(bm, plane)
                 corner.set_xy(
                     faces,
                     plane,
@@ -252,13 +252,12 @@ class BOUT_OT_BlockObjTool(Block):
                     local_space=True,
                 )
                 rotations = (self.shape.corner.rotation_a, self.shape.corner.rotation_b)
-                extruded_face_indexes, edge_index = corner.extrude(
+                extruded_faces, edge = corner.extrude(
                     bm, faces, direction, normal, rotations, extrusion
                 )
-                corner.offset(
-                    bm, extruded_face_indexes, direction, normal, rotations, offset
-                )
-                bevel.mod.edges(bm, obj, [edge_index], bevel_round)
+                corner.offset(bm, extruded_faces, direction, normal, rotations, offset)
+                extruded_face_indexes = indexes(bm, extruded_faces)
+                bevel.mod.edges(bm, obj, [edge.index], bevel_round)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, extruded_face_indexes[0])
             case "NGON":
@@ -268,7 +267,8 @@ class BOUT_OT_BlockObjTool(Block):
                     bevel.mod.verts(obj, bevel_round)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 else:
-                    extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    extruded = facet.extrude(bm, face, plane, extrusion)
+                    extruded_faces = indexes(bm, extruded)
                     self._recalculate_normals(bm, extruded_faces)
                     bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
@@ -276,14 +276,14 @@ class BOUT_OT_BlockObjTool(Block):
             case "NHEDRON":
                 face = ngon.new(bm, self.shape.nhedron.points)
                 facet.set_z(face, normal, offset)
-                extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                extruded = facet.extrude(bm, face, plane, extrusion)
+                extruded_faces = indexes(bm, extruded)
                 self._recalculate_normals(bm, extruded_faces)
                 bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "TRIANGLE":
-                faces_indexes = triangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                face = triangle.create(bm, plane)[0]
                 x = self.shape.triangle.height * math.cos(self.shape.triangle.angle)
                 y = self.shape.triangle.height * math.sin(self.shape.triangle.angle)
                 triangle.set_xy(
@@ -300,15 +300,15 @@ class BOUT_OT_BlockObjTool(Block):
                     bevel.mod.verts(obj, bevel_round)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 else:
-                    extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                    extruded = facet.extrude(bm, face, plane, extrusion)
+                    extruded_faces = indexes(bm, extruded)
                     self._recalculate_normals(bm, extruded_faces)
                     bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                     self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                     self._add_boolean(obj, detected_obj, extruded_faces[0])
             case "PRISM":
                 pri = self.shape.prism
-                faces_indexes = triangle.create(bm, plane)
-                face = bmeshface.from_index(bm, faces_indexes[0])
+                face = triangle.create(bm, plane)[0]
                 x = pri.height * math.cos(pri.angle)
                 y = pri.height * math.sin(pri.angle)
                 triangle.set_xy(
@@ -321,12 +321,11 @@ class BOUT_OT_BlockObjTool(Block):
                     flip=pri.flip,
                 )
                 facet.set_z(face, normal, offset)
-                extruded_faces = facet.extrude(bm, face, plane, extrusion)
+                extruded = facet.extrude(bm, face, plane, extrusion)
+                extruded_faces = indexes(bm, extruded)
                 self._recalculate_normals(bm, extruded_faces)
                 if symmetry_extrude:
-                    facet.set_z(
-                        bmeshface.from_index(bm, extruded_faces[0]), normal, -extrusion
-                    )
+                    facet.set_z(extruded[0], normal, -extrusion)
                 bevel.mod.faces(bm, obj, bevel_round, bevel_fill, extruded_faces)
                 self.update_bmesh(obj, bm, loop_triangles=True, destructive=True)
                 self._add_boolean(obj, detected_obj, extruded_faces[0])
@@ -336,6 +335,7 @@ class BOUT_OT_BlockObjTool(Block):
         if self.pref.reveal:
             self._reveal_objects(bpy.context, obj)
 
+    @timing.timed("update_bmesh")
     def update_bmesh(self, obj, bm, loop_triangles=False, destructive=False):
         mesh = obj.data
         bm.to_mesh(mesh)
@@ -529,14 +529,38 @@ class BOUT_OT_BlockObjTool(Block):
             objs_to_duplicate.append(obj)
 
         for o in objs_to_duplicate:
-            new_obj = o.copy()
-            new_obj.data = o.data.copy()
-            context.collection.objects.link(new_obj)
+            new_obj = self._slice_duplicate(context, o)
             duplicated.append(new_obj)
             self._set_parent(new_obj, o)
 
         return duplicated
 
+    def _slice_duplicate(self, context, obj):
+        """Duplicate a SLICE target for the intersect part. In single pass
+        mode it shares the target mesh until ``boolean_utils.bake`` commits
+        the part, so no full mesh copy is made."""
+        if addon.pref().tools.block.align.single_pass:
+            new_obj = boolean_utils.linked_duplicate(obj, context.collection, obj.name)
+        else:
+            new_obj = obj.copy()
+            new_obj.data = obj.data.copy()
+            context.collection.objects.link(new_obj)
+            boolean_utils.isolate(new_obj)
+        self.objects.sources[new_obj] = obj
+        return new_obj
+
+    def _bake_slices(self, context, duplicated):
+        """Commit the SLICE parts from one evaluation of their intersect
+        booleans. Only the parts are baked; the DIFFERENCE on the targets
+        stays live, and the baked parts no longer follow the cutter."""
+        baked = set(duplicated)
+        self.modifiers.booleans = [
+            m for m in self.modifiers.booleans if m.obj not in baked
+        ]
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in duplicated:
+            boolean_utils.bake(obj, depsgraph)
+
     def _add_boolean(self, obj, detected_obj, face_index):
         if self.pref.mode != "ADD":
             context = bpy.context
@@ -544,6 +568,18 @@ class BOUT_OT_BlockObjTool(Block):
                 o for o in context.selected_objects if o.type == "MESH"
             ]
 
+            parent = detected_obj
+            if self._is_cullable(self.pref.mode):
+                targets = list({*selected_objs, detected_obj} - {None})
+                depsgraph = context.evaluated_depsgraph_get()
+                kept, skipped = scene.overlap.cull(
+                    obj, targets, depsgraph, evaluated=False
+                )
+                if skipped:
+                    selected_objs = kept
+                    detected_obj = detected_obj if detected_obj in kept else None
+                    self._report_skipped(skipped)
+
             if self.pref.mode == "CARVE":
                 self._add_carve_obj(
                     bpy.context,
@@ -554,28 +590,24 @@ class BOUT_OT_BlockObjTool(Block):
                 )
 
             if self.pref.mode == "SLICE":
-                _selected = selected_objs[:]
-                _selected_set = set(_selected + [detected_obj])
-                selected = list(_selected_set)
-
-                created_objs = []
-                for o in selected:
-                    new_obj = o.copy()
-                    new_obj.data = o.data.copy()
-                    context.collection.objects.link(new_obj)
-                    created_objs.append(new_obj)
+                selected = list({*selected_objs, detected_obj} - {None})
+
+                created_objs = [self._slice_duplicate(context, o) for o in selected]
                 self._create_boolean_modifiers(obj, None, created_objs, "INTERSECT")
+                if addon.pref().tools.block.align.single_pass:
+                    self._bake_slices(context, created_objs)
 
             self._create_boolean_modifiers(
                 obj, detected_obj, selected_objs, self.pref.mode
             )
-            self._set_parent(obj, detected_obj)
+            self._set_parent(obj, parent)
 
             # Move cutter object to Cutters collection before hiding
             collection.append([obj], "Cutters")
             obj.hide_set(True)
             obj.data.shade_smooth()
 
+    @timing.timed("boolean")
     def _boolean(self, mode, obj):
         if mode != "ADD":
             if not self.modifiers.booleans:
@@ -617,6 +649,51 @@ class BOUT_OT_BlockObjTool(Block):
             if append:
                 self.modifiers.booleans.append(Modifier(obj=sel_obj, mod=mod))
 
+    def _is_cullable(self, mode):
+        """Only DIFFERENCE-based modes leave a target the cutter misses unchanged"""
+        return mode in {"CUT", "CARVE", "SLICE"} and addon.pref().tools.block.align.cull
+
+    def _cull_booleans(self, context):
+        """Drop the modal's booleans from targets the finished cutter misses"""
+        obj = self.data.obj
+        duplicated = self.objects.duplicated
+        targets = [
+            m.obj for m in self.modifiers.booleans if m.obj not in duplicated
+        ]
+        depsgraph = context.evaluated_depsgraph_get()
+        _kept, skipped = scene.overlap.cull(obj, targets, depsgraph, evaluated=False)
+        if not skipped:
+            return
+
+        # Drop the SLICE duplicates whose source is skipped, since their
+        # intersection would be empty.
+        skipped_duplicates = [
+            dup for dup in duplicated if self.objects.sources.get(dup) in skipped
+        ]
+
+        for m in self.modifiers.booleans[:]:
+            if m.obj in skipped or m.obj in skipped_duplicates:
+                boolean.remove_modifier(m, obj)
+                self.modifiers.booleans.remove(m)
+
+        for dup in skipped_duplicates:
+            boolean_utils.discard(dup)
+            mesh_data = dup.data
+            duplicated.remove(dup)
+            self.objects.sources.pop(dup, None)
+            bpy.data.objects.remove(dup, do_unlink=True)
+            if mesh_data and mesh_data.users == 0:
+                bpy.data.meshes.remove(mesh_data)
+
+        self._report_skipped(skipped)
+
+    def _report_skipped(self, skipped):
+        self.report(
+            {"INFO"},
+            f"Skipped {len(skipped)} untouched object(s): "
+            + ", ".join(o.name for o in skipped),
+        )
+
     def _add_carve_obj(self, context, obj, face_index, offset, normal):
         new_obj = obj.copy()
         new_obj.data = obj.data.copy()
@@ -624,14 +701,10 @@ class BOUT_OT_BlockObjTool(Block):
         new_obj.hide_render = False
         context.collection.objects.link(new_obj)
 
-        bm = bmesh.new()
-        bm.from_mesh(new_obj.data)
-        bm.faces.ensure_lookup_table()
-        face = bm.faces[face_index]
-        for v in face.verts:
-            v.co -= normal * offset
-        bm.to_mesh(new_obj.data)
-        bm.free()
+        face = new_obj.data.polygons[face_index]
+        mesh_utils.offset(
+            new_obj.data, offset, direction=normal, indices=face.vertices
+        )
 
     def _reveal_objects(self, context, obj):
         """Reveal the created objects"""
@@ -643,6 +716,10 @@ class BOUT_OT_BlockObjTool(Block):
     def _finish(self, context):
 
         if not self.state.is_bisect:
+            if resolution.restore(self):
+                self.update_bmesh(
+                    self.data.obj, self.data.bm, loop_triangles=True, destructive=True
+                )
             if self.config.mode != "ADD":
                 if not self.is_3d:
                     extrude.uniform(self, context)
@@ -668,6 +745,13 @@ class BOUT_OT_BlockObjTool(Block):
                 )
 
             self._bevel_cleanup(context)
+            if self._is_cullable(self.config.mode):
+                self._cull_booleans(context)
+            if (
+                self.config.mode == "SLICE"
+                and addon.pref().tools.block.align.single_pass
+            ):
+                self._bake_slices(context, self.objects.duplicated)
             if self.config.mode != "ADD":
                 # Ensure cutter object is in Cutters collection
                 collection.append([self.data.obj], "Cutters")
@@ -734,6 +818,7 @@ class BOUT_OT_BlockObjTool(Block):
         boolean.clear_modifiers(self.modifiers)
 
         for obj in self.objects.duplicated:
+            boolean_utils.discard(obj)
             mesh_data = obj.data
             bpy.data.objects.remove(obj, do_unlink=True)
             if mesh_data and mesh_data.users == 0:
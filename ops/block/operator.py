@@ -4,7 +4,7 @@ import bmesh
 import bpy
 from mathutils import Matrix, Vector
 
-from ...utils import addon, infobar, scene, view3d
+from ...utils import addon, infobar, record, scene, timing, view3d
 from ...utils.operator import safe
 from ...utilsbmesh import facet, ngon
 from . import (
@@ -13,8 +13,10 @@ from . import (
     draw,
     edit,
     extrude,
+    lasso,
     numeric_input,
     orientation,
+    resolution,
     ui,
 )
 from .data import (
@@ -138,6 +140,10 @@ class Block(bpy.types.Operator):
             col.prop(self.pref.bisect.plane, "normal", text="Normal")
             layout.prop(self.pref.bisect, "mode", text="Mode")
             layout.prop(self.pref.bisect, "flip", text="Flip")
+            col = layout.column(align=True)
+            col.prop(self.pref.bisect, "count")
+            col.prop(self.pref.bisect, "spacing")
+            layout.prop(self.pref.bisect, "separate")
             return
 
         shape = self.shape.active
@@ -287,6 +293,10 @@ class Block(bpy.types.Operator):
             col = layout.column(align=True)
             align = addon.pref().tools.block.align
             col.prop(align, "solver", text="Boolean Solver")
+            col.prop(align, "collection", text="Collection Operand")
+            col.prop(align, "cull", text="Skip Untouched")
+            if self.pref.mode == "SLICE":
+                col.prop(align, "single_pass", text="Single Pass Slice")
 
     def _hide_transform_gizmo(self, context):
         self.pref.transform_gizmo = context.space_data.show_gizmo_context
@@ -311,6 +321,9 @@ class Block(bpy.types.Operator):
         self.pref.bisect.plane.normal = self.data.bisect.plane[1]
         self.pref.bisect.flip = self.data.bisect.flip
         self.pref.bisect.mode = self.data.bisect.mode
+        self.pref.bisect.count = self.data.bisect.count
+        self.pref.bisect.spacing = self.data.bisect.spacing
+        self.pref.bisect.separate = self.data.bisect.separate
         self.pref.plane.origin = self.data.draw.matrix.location
         self.pref.plane.normal = self.data.draw.matrix.normal
         self.pref.direction = self.data.draw.matrix.direction
@@ -385,9 +398,16 @@ class Block(bpy.types.Operator):
         self._lmb_advance_fired = False
         self._last_phase = ""
 
+        timing.enabled = addon.pref().timing
+        timing.reset()
+
         self._hide_transform_gizmo(context)
         self.config = self.set_config(context)
         self.shape.active = self.config.shape
+
+        record.enabled = addon.pref().record
+        if record.enabled:
+            record.start(context, event, self.config)
         self.pref.type = self.config.type
         self.get_tool_prpoerties()
 
@@ -423,6 +443,9 @@ class Block(bpy.types.Operator):
             if not context.scene.bout.align.mode == "CUSTOM" and not self.ray.hit:
                 self.state.phase = "BISECT"
                 self.pref.bisect.running = True
+                # Spacing and separation carry over from the last batch bisect
+                self.data.bisect.spacing = self.pref.bisect.spacing
+                self.data.bisect.separate = self.pref.bisect.separate
         else:
             if not self.ray.hit:
                 if self.config.mode != "ADD":
@@ -478,6 +501,9 @@ class Block(bpy.types.Operator):
                 self.pref.bisect.plane.normal,
                 self.pref.bisect.flip,
                 self.pref.bisect.mode,
+                self.pref.bisect.count,
+                self.pref.bisect.spacing,
+                self.pref.bisect.separate,
             )
             bisect.execute(self, context, obj, bm, bisect_data)
         else:
@@ -587,6 +613,9 @@ class Block(bpy.types.Operator):
 
     @safe
     def modal(self, context, event):
+        if record.enabled:
+            record.record(event, self.state.phase)
+
         if event.type == "MIDDLEMOUSE":
             return {"PASS_THROUGH"}
 
@@ -616,25 +645,28 @@ class Block(bpy.types.Operator):
         if event.type == "MOUSEMOVE" and not ni.active:
             self.mouse.co = Vector((event.mouse_region_x, event.mouse_region_y))
 
-            match self.state.phase:
-                case "DRAW":
-                    self._draw_modal(context, event)
-                case "EDIT":
-                    edit.modal(self, context, event)
-                case "EXTRUDE":
-                    self._extrude_modal(context, event)
-                case "BEVEL":
-                    self._bevel_modal(context, event)
-                case "TRANSLATE":
-                    self._translate_modal(context, event)
-                case "ROTATE":
-                    self._rotate_modal(context, event)
-                case "SCALE":
-                    self._scale_modal(context, event)
-                case "BISECT":
-                    bisect.modal(self, context, event)
+            with timing.span("phase"):
+                match self.state.phase:
+                    case "DRAW":
+                        self._draw_modal(context, event)
+                    case "EDIT":
+                        edit.modal(self, context, event)
+                    case "EXTRUDE":
+                        self._extrude_modal(context, event)
+                    case "BEVEL":
+                        self._bevel_modal(context, event)
+                    case "TRANSLATE":
+                        self._translate_modal(context, event)
+                    case "ROTATE":
+                        self._rotate_modal(context, event)
+                    case "SCALE":
+                        self._scale_modal(context, event)
+                    case "BISECT":
+                        bisect.modal(self, context, event)
 
             self._header(context)
+            if timing.enabled:
+                ui.update_timing(self)
 
         elif event.type in {"LEFTMOUSE", "SPACE", "RET", "NUMPAD_ENTER"}:
             # Suppress the trailing release of the click that accepted a
@@ -710,7 +742,11 @@ class Block(bpy.types.Operator):
 
         elif event.type == "WHEELUPMOUSE":
             if event.value == "PRESS":
-                if self.state.phase == "BEVEL":
+                if self.state.is_bisect:
+                    self.data.bisect.count = min(256, self.data.bisect.count + 1)
+                    bisect.preview(self, context)
+                    self._header(context)
+                elif self.state.phase == "BEVEL":
                     if self.data.bevel.mode != "SEGMENTS":
                         if self.data.bevel.type == "ROUND":
                             self.data.bevel.round.segments = min(
@@ -724,7 +760,11 @@ class Block(bpy.types.Operator):
 
         elif event.type == "WHEELDOWNMOUSE":
             if event.value == "PRESS":
-                if self.state.phase == "BEVEL":
+                if self.state.is_bisect:
+                    self.data.bisect.count = max(1, self.data.bisect.count - 1)
+                    bisect.preview(self, context)
+                    self._header(context)
+                elif self.state.phase == "BEVEL":
                     if self.data.bevel.mode != "SEGMENTS":
                         if self.data.bevel.type == "ROUND":
                             self.data.bevel.round.segments = max(
@@ -948,6 +988,9 @@ class Block(bpy.types.Operator):
         if ni.active:
             ni.stop()
 
+        # The converted points are final; take them at the configured resolution
+        resolution.restore(self)
+
         # config.shape is the live mirror; shape.active is the registered truth
         # that drives build_geometry/F9. Leave the tool pref untouched.
         self.config.shape = target
@@ -1015,6 +1058,9 @@ class Block(bpy.types.Operator):
                 self.data.bisect.plane[1],
                 self.data.bisect.flip,
                 self.data.bisect.mode,
+                self.data.bisect.count,
+                self.data.bisect.spacing,
+                self.data.bisect.separate,
             )
             bisect.execute(self, context, self.data.obj, self.data.bm, bisect_data)
             return self._finalize(context)
@@ -1100,7 +1146,8 @@ class Block(bpy.types.Operator):
             return self._finalize(context)
 
         if next_sub == "EDIT":
-            edit.invoke(self, context)
+            if not (lasso.active(self) and lasso.commit(self, context)):
+                edit.invoke(self, context)
         elif next_sub == "EXTRUDE":
             self._extrude_invoke(context, event)
             # Fixed-depth extrude: skip straight to BEVEL so the user can
@@ -1152,6 +1199,8 @@ class Block(bpy.types.Operator):
         context.area.header_text_set(text=None)
         infobar.remove(context)
 
+        record.stop()
+
     def _set_parent(self, child_obj, parent_obj):
         parent_world = parent_obj.matrix_world.copy()
         child_obj.parent = parent_obj
@@ -1162,9 +1211,10 @@ class Block(bpy.types.Operator):
 
     def _header(self, context):
         if self.state.is_bisect:
-            header = (
-                f"Bisec: mode:{self.data.bisect.mode}, flip:{self.data.bisect.flip}"
-            )
+            bd = self.data.bisect
+            header = f"Bisec: mode:{bd.mode}, flip:{bd.flip}"
+            if bd.count > 1:
+                header += f", planes:{bd.count}"
             context.area.header_text_set(text=header)
             return
 
@@ -1322,6 +1372,8 @@ class Block(bpy.types.Operator):
         draw.modal(self, context, event)
 
     def _extrude_invoke(self, context, event):
+        # The extruded cutter is final; give it its configured resolution
+        resolution.restore(self)
         extrude.invoke(self, context, event)
 
     def _extrude_modal(self, context, event):
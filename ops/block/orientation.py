@@ -1,10 +1,10 @@
 import math
 
-import bmesh
 import bpy
 from mathutils import Vector
 
 from ...utils import view3d
+from ...utils.scene import evaluated
 from ...utils.types import DrawMatrix
 from ...utilsbmesh import orientation
 
@@ -20,7 +20,7 @@ def _apply_axis_snap(op, detected_axis):
         sd.symmetry_x, sd.symmetry_y = detected_axis
 
 
-def _resolve_face_index(op, hit_bm, hit_obj_eval, hit_data):
+def _resolve_face_index(op, hit_bm):
     """Safely get face or return fallback orientation for instanced objects"""
 
     # Check if the face index is valid for this mesh (important for instanced objects)
@@ -30,10 +30,6 @@ def _resolve_face_index(op, hit_bm, hit_obj_eval, hit_data):
         direction_world = orientation.direction_from_normal(op.ray.normal)
         plane_world = (op.ray.location, op.ray.normal)
 
-        hit_bm.free()
-        del hit_obj_eval
-        del hit_data
-
         op.report({"INFO"}, "Fallback: Geometry is not real")
         return None, direction_world, plane_world
 
@@ -80,17 +76,10 @@ def face_orientation(op, context):
     depsgraph.update()
     hit_obj = op.ray.obj
 
-    # Get the evaluated data
-    hit_obj_eval = hit_obj.evaluated_get(depsgraph)
-    hit_data = hit_obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
-
-    hit_bm = bmesh.new()
-    hit_bm.from_mesh(hit_data)
-    hit_bm.faces.ensure_lookup_table()
+    # Shared evaluated mesh; cached until the object's geometry changes
+    hit_bm = evaluated.get(hit_obj, depsgraph)
 
-    hit_face, fallback_direction, fallback_plane = _resolve_face_index(
-        op, hit_bm, hit_obj_eval, hit_data
-    )
+    hit_face, fallback_direction, fallback_plane = _resolve_face_index(op, hit_bm)
 
     if hit_face is None:
         return fallback_direction, fallback_plane
@@ -109,10 +98,6 @@ def face_orientation(op, context):
     direction_world = op.ray.obj.matrix_world.to_3x3() @ direction_local
     plane_world = (op.ray.location, op.ray.normal)
 
-    hit_bm.free()
-    del hit_obj_eval
-    del hit_data
-
     return direction_world, plane_world
 
 
@@ -123,16 +108,9 @@ def edge_orientation(op, context):
     depsgraph.update()
     hit_obj = op.ray.obj
 
-    hit_obj_eval = hit_obj.evaluated_get(depsgraph)
-    hit_data = hit_obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+    hit_bm = evaluated.get(hit_obj, depsgraph)
 
-    hit_bm = bmesh.new()
-    hit_bm.from_mesh(hit_data)
-    hit_bm.faces.ensure_lookup_table()
-
-    hit_face, fallback_direction, fallback_plane = _resolve_face_index(
-        op, hit_bm, hit_obj_eval, hit_data
-    )
+    hit_face, fallback_direction, fallback_plane = _resolve_face_index(op, hit_bm)
 
     if hit_face is None:
         op.shape.corner.rotation_a = 0.0
@@ -194,10 +172,6 @@ def edge_orientation(op, context):
 
     op.shape.corner.rotation_b = angle
 
-    hit_bm.free()
-    del hit_obj_eval
-    del hit_data
-
     return direction_world, plane_world
 
 
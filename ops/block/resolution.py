@@ -0,0 +1,135 @@
+"""Screen-size adaptive resolution of round cutters.
+
+With the tool's adaptive option on, circles, cylinders and spheres are built
+with only as many segments as their size on screen needs while they are
+drawn. The live resolution is kept in ``op.data.draw.resolution``. Both
+Block tools regenerate the cutter at the configured resolution when the
+extrude starts, or on finish for a cutter that is never extruded, so the
+extrude drag and the result match the F9 redo, which always builds at the
+configured one. Only the DRAW drag is adaptive: the extrude drag changes
+depth, not the outline's size on screen.
+"""
+
+import math
+
+from ...utils import view3d
+from ...utilsbmesh import circle, sphere
+from ...utilsbmesh.mesh import indexes
+
+# Screen length in pixels one segment of a round cutter should cover
+SEGMENT_PIXELS = 8.0
+
+# Fewest verts an adaptive circle is built with
+MIN_VERTS = 8
+
+
+def configured(op):
+    """The configured verts or subdivisions of the active shape, or None."""
+    match op.shape.active:
+        case "CIRCLE":
+            return op.shape.circle.verts
+        case "CYLINDER":
+            return op.shape.cylinder.verts
+        case "SPHERE":
+            return op.shape.sphere.subdivisions
+    return None
+
+
+def current(op):
+    """The resolution to build the active shape with."""
+    if op.data is not None and op.data.draw.resolution:
+        return op.data.draw.resolution
+    return configured(op)
+
+
+def reduced(op):
+    """True when the live cutter is built below its configured resolution."""
+    live = op.data.draw.resolution
+    return bool(live) and live != configured(op)
+
+
+def start(op):
+    """The resolution to create the cutter with; it becomes the live one."""
+    full = configured(op)
+    if not op.config.form.adaptive:
+        return full
+    resolution = 1 if op.shape.active == "SPHERE" else min(full, MIN_VERTS)
+    op.data.draw.resolution = resolution
+    return resolution
+
+
+def _pixels(op, context, radius):
+    """Screen length of the cutter's radius, or None when off screen."""
+    matrix_world = op.data.obj.matrix_world
+    location = matrix_world @ op.data.draw.matrix.location
+    direction = matrix_world.to_3x3() @ op.data.draw.matrix.direction.normalized()
+    region = context.region
+    rv3d = context.region_data
+
+    center = view3d.location_3d_to_region_2d(region, rv3d, location)
+    rim = location + direction * radius
+    rim = view3d.location_3d_to_region_2d(region, rv3d, rim)
+    if center is None or rim is None:
+        return None
+    return (rim - center).length
+
+
+def _pick(op, pixels):
+    """Resolution for a cutter whose radius covers `pixels` on screen.
+
+    Levels step in powers of two, so a drag rebuilds the cutter only a few
+    times.
+    """
+    full = configured(op)
+    segments = 2 * math.pi * pixels / SEGMENT_PIXELS
+    if op.shape.active == "SPHERE":
+        # A cube sphere has 4 * (subdivisions + 1) segments around
+        level = max(math.ceil(segments / 4) - 1, 1)
+        return min(full, 2 ** math.ceil(math.log2(level)))
+    verts = max(segments, MIN_VERTS)
+    return min(full, 2 ** math.ceil(math.log2(verts)))
+
+
+def _resample(op, faces, resolution):
+    """Replace the round cutter at `resolution` and record its faces."""
+    bm = op.data.bm
+    if op.shape.active == "SPHERE":
+        faces = sphere.resample(bm, faces, resolution)
+    else:
+        faces = [circle.resample(bm, faces[0], resolution)]
+    op.data.draw.faces = indexes(bm, faces)
+    op.data.draw.resolution = resolution
+    return faces
+
+
+def update(op, context, faces, radius):
+    """Resample the cutter being drawn to suit its size on screen.
+
+    :return: The cutter's faces, new ones if it was resampled.
+    """
+    if not op.data.draw.resolution:
+        return faces
+    pixels = _pixels(op, context, radius)
+    if pixels is None:
+        return faces
+    resolution = _pick(op, pixels)
+    if resolution == op.data.draw.resolution:
+        return faces
+    return _resample(op, faces, resolution)
+
+
+def restore(op):
+    """Resample a reduced cutter at its configured resolution.
+
+    For a circle face or a sphere that has not been extruded or cut; its
+    placement and transforms are kept.
+
+    :return: True if the cutter was resampled.
+    """
+    if not reduced(op):
+        return False
+    bm = op.data.bm
+    bm.faces.ensure_lookup_table()
+    faces = [bm.faces[index] for index in op.data.draw.faces]
+    _resample(op, faces, configured(op))
+    return True
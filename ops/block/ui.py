@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 import bpy
 
 from ...shaders import handle
-from ...utils import addon, infobar
+from ...utils import addon, infobar, timing
 from .data import CONVERTABLE
 
 @dataclass
@@ -21,8 +21,10 @@ class DrawUI(handle.Common):
     bisect_polyline: handle.Polyline = field(default_factory=handle.Polyline)
     bisect_gradient: handle.Gradient = field(default_factory=handle.Gradient)
     bisect_gradient_flip: handle.Gradient = field(default_factory=handle.Gradient)
+    bisect_section: handle.Segments = field(default_factory=handle.Segments)
 
     interface: handle.Interface = field(default_factory=handle.Interface)
+    hud: handle.Interface = field(default_factory=handle.Interface)
 
     def __post_init__(self):
         self.clear_all()
@@ -79,6 +81,7 @@ def setup(self, context):
     bisec_color = color.cut
     self.ui.bisect_line.create(context, width=1.6, color=bisec_color, depth=True)
     self.ui.bisect_polyline.create(context, width=1.6, color=color.guid)
+    self.ui.bisect_section.create(context, width=2.0, color=bisec_color)
     self.ui.bisect_gradient.create(
         context,
         colors=[bisec_color, bisec_color, (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0)],
@@ -90,10 +93,27 @@ def setup(self, context):
 
     lines = []
     self.ui.interface.create(context, lines=lines)
+    if timing.enabled:
+        self.ui.hud.create(context, lines=[])
 
 def update(self, context, event):
     infobar.draw(context, event, self._infobar, blank=True)
 
+
+def update_timing(self):
+    """Show the per-stage timings in the bottom left corner of the region"""
+    if not self.ui.hud.callback:
+        return
+
+    lines = [
+        {
+            "point": (20, 20 + i * 30),
+            "text_tuple": (name, f"{stats['last']:.2f} ms", f"avg {stats['mean']:.2f}"),
+        }
+        for i, (name, stats) in enumerate(timing.summary().items())
+    ]
+    self.ui.hud.callback.update_batch(lines)
+
 _PHASE_LABEL = {
     "DRAW": "Draw",
     "EDIT": "Edit",
@@ -155,9 +175,11 @@ def hotkeys(self, layout, _context, _event):
     _hk(row, factor, "Cancel", "MOUSE_RMB")
     _hk(row, factor, "Snap", "EVENT_CTRL")
 
-    # BISECT is its own branch — only flip applies, and G/R/S are blocked.
+    # BISECT is its own branch — only flip and the plane count apply, and
+    # G/R/S are blocked.
     if name == "BISECT":
         _hk(row, factor, "Flip", "EVENT_F")
+        _hk(row, factor, "Planes", "MOUSE_MMB")
         return
 
     # Phase-specific keys (X/Y/Z/F/S used for non-transform purposes).
@@ -0,0 +1,48 @@
+import bpy
+from bpy_extras.io_utils import ExportHelper
+
+from ..utils import record, timing
+
+
+class BOUT_OT_TimingDump(bpy.types.Operator, ExportHelper):
+    bl_idname = "wm.bout_timing_dump"
+    bl_label = "Save Timings"
+    bl_description = "Save the recorded Block tool timings to a JSON file"
+    bl_options = {"REGISTER"}
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        return bool(timing.summary())
+
+    def execute(self, context):
+        timing.dump(self.filepath)
+        self.report({"INFO"}, f"Saved timings to {self.filepath}")
+        return {"FINISHED"}
+
+
+class BOUT_OT_RecordDump(bpy.types.Operator, ExportHelper):
+    bl_idname = "wm.bout_record_dump"
+    bl_label = "Save Session"
+    bl_description = "Save the last recorded Block tool session to a JSON file"
+    bl_options = {"REGISTER"}
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        return record.last is not None
+
+    def execute(self, context):
+        record.dump(self.filepath)
+        self.report({"INFO"}, f"Saved session to {self.filepath}")
+        return {"FINISHED"}
+
+
+classes = (
+    BOUT_OT_TimingDump,
+    BOUT_OT_RecordDump,
+)
@@ -5,6 +5,7 @@ from . import custom_plane
 from . import veil
 from . import apply_modifiers
 from . import clean_cutter
+from . import profile
 
 
 class Theme(bpy.types.PropertyGroup):
@@ -13,11 +14,13 @@ class Theme(bpy.types.PropertyGroup):
 
 class Scene(bpy.types.PropertyGroup):
     bevel: bpy.props.PointerProperty(type=bevel.Scene)
+    profile: bpy.props.PointerProperty(type=profile.Scene)
 
 
 types_classes = (
     *bevel.types_classes,
     *apply_modifiers.types_classes,
+    *profile.types_classes,
     Theme,
     Scene,
 )
@@ -30,4 +33,5 @@ classes = (
     *veil.classes,
     *apply_modifiers.classes,
     *clean_cutter.classes,
+    *profile.classes,
 )
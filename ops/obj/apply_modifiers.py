@@ -2,6 +2,8 @@ import bpy
 from bpy.props import BoolProperty, CollectionProperty, StringProperty, IntProperty
 from bpy.types import Operator, PropertyGroup, UIList
 
+from ...utils import relations
+
 
 class BOUT_PT_ApplyModifiersObjectItem(PropertyGroup):
     """Property group for object items in the list"""
@@ -225,34 +227,7 @@ class BOUT_OT_ApplyModifiers(Operator):
 
     def _get_modifier_referenced_objects(self, modifier):
         """Get all objects referenced by a modifier"""
-        referenced_objects = set()
-
-        # Dictionary mapping modifier types to their object properties
-        modifier_object_props = {
-            "BOOLEAN": ["object"],
-            "ARRAY": ["start_cap", "end_cap", "offset_object"],
-            "MIRROR": ["mirror_object"],
-            "SHRINKWRAP": ["target"],
-            "CAST": ["object"],
-            "CURVE": ["object"],
-            "HOOK": ["object"],
-            "LATTICE": ["object"],
-            "MESH_DEFORM": ["object"],
-            "SURFACE_DEFORM": ["target"],
-            "ARMATURE": ["object"],
-        }
-
-        # Get the properties for this modifier type
-        props = modifier_object_props.get(modifier.type, [])
-
-        # Check each property and add referenced objects
-        for prop_name in props:
-            if hasattr(modifier, prop_name):
-                obj_ref = getattr(modifier, prop_name)
-                if obj_ref:
-                    referenced_objects.add(obj_ref)
-
-        return referenced_objects
+        return relations.operands(modifier)
 
     def _cleanup_unused_objects(self, objects_to_check):
         """Remove objects that are no longer used by any other data"""
@@ -264,6 +239,8 @@ class BOUT_OT_ApplyModifiers(Operator):
 
             if self._is_object_unused(obj):
                 try:
+                    relations.forget(obj)
+
                     # Remove from all collections first
                     for collection in obj.users_collection:
                         collection.objects.unlink(obj)
@@ -298,14 +275,7 @@ class BOUT_OT_ApplyModifiers(Operator):
 
     def _check_modifier_usage(self, obj):
         """Check if object is used by any modifiers"""
-        for other_obj in bpy.data.objects:
-            if other_obj == obj:
-                continue
-            for modifier in other_obj.modifiers:
-                referenced_objects = self._get_modifier_referenced_objects(modifier)
-                if obj in referenced_objects:
-                    return True
-        return False
+        return bool(relations.targets(obj, types=None))
 
     def _check_constraint_usage(self, obj):
         """Check if object is used by any constraints"""
@@ -493,6 +463,9 @@ class BOUT_OT_ApplyModifiers(Operator):
                             f"Failed to apply {modifier_name} on {obj_name}: {str(e)}",
                         )
 
+            # Keep the registry in step before checking what is still in use
+            relations.refresh(obj)
+
         # Clean up unused objects after all modifiers are applied, if enabled
         removed_count = 0
         if self.remove_used_objects:
@@ -7,6 +7,9 @@ from ....utils.input import NumericInput
 from . import numeric_input, utils
 from .data import Distance, DrawUI, Mouse
 
+# Modifier types muted below the edited bevel while simplifying
+EXPENSIVE_MODIFIERS = {"BOOLEAN", "NODES", "WEIGHTED_NORMAL", "SUBSURF", "REMESH"}
+
 
 class BevelOperatorBase(bpy.types.Operator):
     """Base class for bevel operators with shared functionality"""
@@ -65,6 +68,11 @@ class BevelOperatorBase(bpy.types.Operator):
     edge_weight: bpy.props.StringProperty(
         name="Edge Weight", default="bevel_weight_edge"
     )
+    simplify: bpy.props.BoolProperty(
+        name="Simplify While Dragging",
+        description="Hide expensive modifiers after the bevel in the viewport while the mouse adjusts it",
+        default=False,
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -76,6 +84,7 @@ class BevelOperatorBase(bpy.types.Operator):
         self.ui: DrawUI = DrawUI()
 
         self.bevels: list = []
+        self.muted: list = []
         self.numeric_input = NumericInput()
 
         self.saved_segments: int = 1
@@ -190,6 +199,8 @@ class BevelOperatorBase(bpy.types.Operator):
 
             if intersect_point:
                 self.mouse.co = intersect_point
+                if self.simplify:
+                    self._simplify_stack()
                 if self.mode == "OFFSET":
                     self._set_width()
                 elif self.mode == "SEGMENTS":
@@ -304,6 +315,28 @@ class BevelOperatorBase(bpy.types.Operator):
 
         return {"RUNNING_MODAL"}
 
+    def _simplify_stack(self):
+        """Hide expensive modifiers after the edited bevels in the viewport"""
+        if self.muted:
+            return
+
+        for b in self.bevels:
+            index = b.obj.modifiers.find(b.mod.name)
+            for mod in b.obj.modifiers[index + 1 :]:
+                if mod.type in EXPENSIVE_MODIFIERS and mod.show_viewport:
+                    mod.show_viewport = False
+                    self.muted.append(mod)
+
+    def _restore_stack(self):
+        """Show the modifiers hidden by _simplify_stack again"""
+        for mod in self.muted:
+            try:
+                mod.show_viewport = True
+            except ReferenceError:
+                # Modifier was removed with its object
+                pass
+        self.muted.clear()
+
     def _calculate_distance(self):
         """Calculate the distance based on the initial and current mouse position"""
         return utils.calculate_distance(
@@ -397,10 +430,13 @@ class BevelOperatorBase(bpy.types.Operator):
             col = body.column()
             col.prop(self, "harden_normals")
 
+        layout.prop(self, "simplify")
+
         layout.separator(factor=2)
 
     def _cancel(self, context):
         """Cancel the operator"""
+        self._restore_stack()
         for b in self.bevels:
             if b.new:
                 modifier.remove(b.obj, b.mod)
@@ -409,6 +445,7 @@ class BevelOperatorBase(bpy.types.Operator):
 
     def _end(self, context):
         """Cleanup and finish the operator"""
+        self._restore_stack()
         infobar.remove(context)
         context.area.header_text_set(text=None)
         context.window.cursor_set("CROSSHAIR")
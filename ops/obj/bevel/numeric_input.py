@@ -93,6 +93,8 @@ def modal(op, context, event):
 def _start(op, context, event):
     """Start numeric input mode."""
     ni = op.numeric_input
+    # Typed values are previewed at full quality
+    op._restore_stack()
     ni.start(_get_current_value(op), _get_initial_index(op))
     infobar.draw(context, event, op._infobar_hotkeys, blank=True)
 
@@ -576,6 +576,7 @@ class BOUT_OT_ModBevel(BevelOperatorBase):
                 # since both modes now use the same list structure
                 target_index = old_index
 
+            self._restore_stack()
             self._setup_bevel(selected_objects, active_object, target_index)
 
             # Reset distance calculation after mode switch for both modes
@@ -1,8 +1,8 @@
 import bpy
-import bmesh
-from mathutils import Vector
 
-from ...utils import modifier, collection
+from ...utils import modifier, collection, relations, scene
+from ...utils import boolean as boolean_utils
+from ...utils import mesh as mesh_utils
 
 
 def get_solver_items(self, context):
@@ -50,8 +50,12 @@ def update_selection(context, objects_to_select, objects_to_deselect=None):
                 continue
 
 
-def set_smooth(obj):
+def set_smooth(obj, bake_sharp=False):
     """Set smooth shading on object"""
+    if bake_sharp:
+        mesh_utils.sharp_by_angle(obj.data)
+        return
+
     mesh = obj.data
     values = [True] * len(mesh.polygons)
     mesh.polygons.foreach_set("use_smooth", values)
@@ -67,11 +71,38 @@ def get_boolean_properties(solver):
     return attributes
 
 
-def prepare_boolean_object(obj):
+def add_boolean_modifier(obj, cutter, operation, solver, use_collection=False):
+    """Add a boolean modifier, or route the cutter into a collection operand"""
+    if use_collection:
+        return boolean_utils.add(obj, cutter, operation, solver)
+
+    mod = modifier.add(obj, "Boolean", "BOOLEAN")
+    mod.operation = operation
+    mod.object = cutter
+
+    attributes = get_boolean_properties(solver)
+    for key, value in attributes:
+        setattr(mod, key, value)
+
+    relations.refresh(obj)
+    return mod
+
+
+def duplicate_object(context, obj, suffix):
+    """Duplicate an object with its mesh data, keeping cutter collections separate"""
+    duplicate = obj.copy()
+    duplicate.data = obj.data.copy()
+    context.collection.objects.link(duplicate)
+    duplicate.name = obj.name + suffix
+    boolean_utils.isolate(duplicate)
+    return duplicate
+
+
+def prepare_boolean_object(obj, bake_sharp=False):
     """Prepare object as boolean source (wireframe, hide render, smooth, move to Cutters collection)"""
     obj.display_type = "WIRE"
     obj.hide_render = True
-    set_smooth(obj)
+    set_smooth(obj, bake_sharp)
     # Append to Cutters collection
     collection.append([obj], "Cutters")
 
@@ -85,6 +116,24 @@ class BooleanOperatorBase(bpy.types.Operator):
 
     flip: bpy.props.BoolProperty(name="Flip", default=False)
 
+    use_collection: bpy.props.BoolProperty(
+        name="Collection",
+        description="Route cutters into a per-target collection used by a single boolean modifier",
+        default=False,
+    )
+
+    cull: bpy.props.BoolProperty(
+        name="Skip Untouched",
+        description="Only add modifiers where the cutter overlaps the target",
+        default=True,
+    )
+
+    bake_sharp: bpy.props.BoolProperty(
+        name="Bake Sharp Edges",
+        description="Write sharp edges into the cutter mesh instead of adding a Smooth by Angle modifier",
+        default=False,
+    )
+
     @classmethod
     def poll(cls, context):
         return context.area.type == "VIEW_3D" and context.mode in {
@@ -111,6 +160,15 @@ class BooleanOperatorBase(bpy.types.Operator):
         if validation_result:
             return validation_result
 
+        skipped = []
+        if self.cull and self.is_cullable():
+            selected_objects, skipped = self.cull_objects(
+                context, selected_objects, active_object
+            )
+            if not selected_objects:
+                self.report({"WARNING"}, "Cutter does not touch any target")
+                return {"CANCELLED"}
+
         if self.flip:
             self.apply_operation_active_to_selected(
                 context, selected_objects, active_object
@@ -126,8 +184,36 @@ class BooleanOperatorBase(bpy.types.Operator):
                 context, active_object, selected_objects
             )
 
+        if skipped:
+            self.report(
+                {"INFO"},
+                f"Skipped {len(skipped)} untouched object(s): "
+                + ", ".join(obj.name for obj in skipped),
+            )
+
         return {"FINISHED"}
 
+    def is_cullable(self):
+        """Whether untouched targets can be skipped; only DIFFERENCE is a no-op on a miss"""
+        return False
+
+    def cull_objects(self, context, selected_objects, active_object):
+        """Drop selected objects the cutter(s) and target(s) do not overlap"""
+        depsgraph = context.evaluated_depsgraph_get()
+
+        if self.flip:
+            # Active is the cutter, selected are the targets
+            return scene.overlap.cull(active_object, selected_objects, depsgraph)
+
+        # Selected are the cutters, active is the target
+        kept, skipped = [], []
+        for obj in selected_objects:
+            if scene.overlap.touches(obj, active_object, depsgraph):
+                kept.append(obj)
+            else:
+                skipped.append(obj)
+        return kept, skipped
+
     def validate_selection(self, selected_objects):
         """Validate that we have enough objects for boolean operation"""
         if len(selected_objects) < 1:
@@ -169,6 +255,9 @@ class BOUT_OT_ModBoolean(BooleanOperatorBase):
         default="DIFFERENCE",
     )
 
+    def is_cullable(self):
+        return self.operation == "DIFFERENCE"
+
     def update_selection_after_operation(
         self, context, active_object, selected_objects
     ):
@@ -184,31 +273,22 @@ class BOUT_OT_ModBoolean(BooleanOperatorBase):
         self, context, selected_objects, active_object
     ):
         """Apply boolean from active object to selected objects"""
-        prepare_boolean_object(active_object)
+        prepare_boolean_object(active_object, self.bake_sharp)
 
         for obj in selected_objects:
-            mod = modifier.add(obj, "Boolean", "BOOLEAN")
-            mod.operation = self.operation
-            mod.object = active_object
-
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod, key, value)
+            add_boolean_modifier(
+                obj, active_object, self.operation, self.solver, self.use_collection
+            )
 
     def apply_operation_selected_to_active(
         self, context, selected_objects, active_object
     ):
         """Apply boolean from selected objects to active object"""
         for obj in selected_objects:
-            prepare_boolean_object(obj)
-
-            mod = modifier.add(active_object, "Boolean", "BOOLEAN")
-            mod.operation = self.operation
-            mod.object = obj
-
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod, key, value)
+            prepare_boolean_object(obj, self.bake_sharp)
+            add_boolean_modifier(
+                active_object, obj, self.operation, self.solver, self.use_collection
+            )
 
     def draw(self, context):
         """Draw the operator options"""
@@ -217,6 +297,10 @@ class BOUT_OT_ModBoolean(BooleanOperatorBase):
 
         layout.prop(self, "operation")
         layout.prop(self, "solver")
+        layout.prop(self, "use_collection")
+        layout.prop(self, "bake_sharp")
+        if self.is_cullable():
+            layout.prop(self, "cull")
 
         layout.separator()
         layout.prop(self, "flip")
@@ -227,10 +311,38 @@ class BOUT_OT_ModBooleanSlice(BooleanOperatorBase):
     bl_label = "Boolean Slice"
     bl_description = "Slice objects into two parts using boolean operations"
 
+    single_pass: bpy.props.BoolProperty(
+        name="Single Pass",
+        description="Bake the slice part to a mesh from one evaluation of its intersect boolean, instead of keeping a live boolean on a full mesh copy. The baked part no longer follows its cutter; the cut in the original stays a live boolean",
+        default=False,
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.objects_with_modifiers: list = []
 
+    def is_cullable(self):
+        return True
+
+    def _duplicate(self, context, obj):
+        """Create the object holding the intersect part"""
+        if self.single_pass:
+            # Shares the target mesh until the part is baked
+            return boolean_utils.linked_duplicate(
+                obj, context.collection, obj.name + "_slice"
+            )
+        return duplicate_object(context, obj, "_slice")
+
+    def _commit(self, context, duplicates):
+        """Bake the intersect parts, evaluating each once. The difference on
+        the originals stays a live boolean; the baked parts no longer follow
+        the cutter."""
+        if not self.single_pass:
+            return
+        depsgraph = context.evaluated_depsgraph_get()
+        for duplicate in duplicates:
+            boolean_utils.bake(duplicate, depsgraph)
+
     def update_selection_after_operation(
         self, context, active_object, selected_objects
     ):
@@ -247,61 +359,48 @@ class BOUT_OT_ModBooleanSlice(BooleanOperatorBase):
     def apply_operation_active_to_selected(
         self, context, selected_objects, active_object
     ):
-        prepare_boolean_object(active_object)
+        prepare_boolean_object(active_object, self.bake_sharp)
+        use_collection = self.use_collection and not self.single_pass
 
+        duplicates = []
         for obj in selected_objects:
             # Create duplicate for the intersect part
-            duplicate = obj.copy()
-            duplicate.data = obj.data.copy()
-            context.collection.objects.link(duplicate)
+            duplicate = self._duplicate(context, obj)
             duplicate.location = obj.location
-            duplicate.name = obj.name + "_slice"
-
-            # Apply difference to original
-            mod_diff = modifier.add(obj, "Boolean", "BOOLEAN")
-            mod_diff.operation = "DIFFERENCE"
-            mod_diff.object = active_object
+            duplicates.append(duplicate)
 
-            # Apply intersect to duplicate
-            mod_int = modifier.add(duplicate, "Boolean", "BOOLEAN")
-            mod_int.operation = "INTERSECT"
-            mod_int.object = active_object
-
-            # Apply properties to both modifiers
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod_diff, key, value)
-                setattr(mod_int, key, value)
+            # Apply difference to original, intersect to duplicate
+            add_boolean_modifier(
+                obj, active_object, "DIFFERENCE", self.solver, self.use_collection
+            )
+            add_boolean_modifier(
+                duplicate, active_object, "INTERSECT", self.solver, use_collection
+            )
 
             self.objects_with_modifiers.extend([obj, duplicate])
 
+        self._commit(context, duplicates)
+
     def apply_operation_selected_to_active(
         self, context, selected_objects, active_object
     ):
         # Create duplicate of active object for the intersect part
-        active_duplicate = active_object.copy()
-        active_duplicate.data = active_object.data.copy()
-        context.collection.objects.link(active_duplicate)
+        active_duplicate = self._duplicate(context, active_object)
         active_duplicate.location = active_object.location
-        active_duplicate.name = active_object.name + "_slice"
+        use_collection = self.use_collection and not self.single_pass
 
         for obj in selected_objects:
-            prepare_boolean_object(obj)
+            prepare_boolean_object(obj, self.bake_sharp)
 
-            # Apply difference to original active
-            mod_diff = modifier.add(active_object, "Boolean", "BOOLEAN")
-            mod_diff.operation = "DIFFERENCE"
-            mod_diff.object = obj
-
-            # Apply intersect to duplicate active
-            mod_int = modifier.add(active_duplicate, "Boolean", "BOOLEAN")
-            mod_int.operation = "INTERSECT"
-            mod_int.object = obj
+            # Apply difference to original active, intersect to duplicate active
+            add_boolean_modifier(
+                active_object, obj, "DIFFERENCE", self.solver, self.use_collection
+            )
+            add_boolean_modifier(
+                active_duplicate, obj, "INTERSECT", self.solver, use_collection
+            )
 
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod_diff, key, value)
-                setattr(mod_int, key, value)
+        self._commit(context, [active_duplicate])
 
         # Track objects with modifiers outside the loop
         self.objects_with_modifiers.extend([active_object, active_duplicate])
@@ -312,6 +411,10 @@ class BOUT_OT_ModBooleanSlice(BooleanOperatorBase):
         layout.use_property_split = True
 
         layout.prop(self, "solver")
+        layout.prop(self, "use_collection")
+        layout.prop(self, "bake_sharp")
+        layout.prop(self, "cull")
+        layout.prop(self, "single_pass")
         layout.separator()
         layout.prop(self, "flip")
 
@@ -333,6 +436,9 @@ class BOUT_OT_ModBooleanCarve(BooleanOperatorBase):
         super().__init__(*args, **kwargs)
         self.carved_objects: list = []
 
+    def is_cullable(self):
+        return True
+
     def update_selection_after_operation(
         self, context, active_object, selected_objects
     ):
@@ -356,23 +462,9 @@ class BOUT_OT_ModBooleanCarve(BooleanOperatorBase):
         new_obj.name = obj.name + "_carve"
         context.collection.objects.link(new_obj)
 
-        # Move faces inward by offset
+        # Move vertices inward along their normals
         if self.offset > 0:
-            bm = bmesh.new()
-            bm.from_mesh(new_obj.data)
-
-            # Move all vertices inward along their normals
-            for vert in bm.verts:
-                # Calculate vertex normal as average of connected face normals
-                vert_normal = sum(
-                    (f.normal for f in vert.link_faces), start=Vector((0, 0, 0))
-                )
-                if vert_normal.length > 0:
-                    vert_normal.normalize()
-                    vert.co -= vert_normal * self.offset
-
-            bm.to_mesh(new_obj.data)
-            bm.free()
+            mesh_utils.offset(new_obj.data, self.offset)
 
         return new_obj
 
@@ -388,16 +480,12 @@ class BOUT_OT_ModBooleanCarve(BooleanOperatorBase):
             self.carved_objects.append(carve_obj)
 
         # Setup original object for boolean
-        prepare_boolean_object(active_object)
+        prepare_boolean_object(active_object, self.bake_sharp)
 
         for obj in selected_objects:
-            mod = modifier.add(obj, "Boolean", "BOOLEAN")
-            mod.operation = "DIFFERENCE"
-            mod.object = active_object
-
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod, key, value)
+            add_boolean_modifier(
+                obj, active_object, "DIFFERENCE", self.solver, self.use_collection
+            )
 
     def apply_operation_selected_to_active(
         self, context, selected_objects, active_object
@@ -412,15 +500,10 @@ class BOUT_OT_ModBooleanCarve(BooleanOperatorBase):
                 self.carved_objects.append(carve_obj)
 
             # Setup original object for boolean
-            prepare_boolean_object(obj)
-
-            mod = modifier.add(active_object, "Boolean", "BOOLEAN")
-            mod.operation = "DIFFERENCE"
-            mod.object = obj
-
-            attributes = get_boolean_properties(self.solver)
-            for key, value in attributes:
-                setattr(mod, key, value)
+            prepare_boolean_object(obj, self.bake_sharp)
+            add_boolean_modifier(
+                active_object, obj, "DIFFERENCE", self.solver, self.use_collection
+            )
 
     def draw(self, context):
         """Draw the operator options"""
@@ -429,12 +512,50 @@ class BOUT_OT_ModBooleanCarve(BooleanOperatorBase):
 
         layout.prop(self, "offset")
         layout.prop(self, "solver")
+        layout.prop(self, "use_collection")
+        layout.prop(self, "bake_sharp")
+        layout.prop(self, "cull")
         layout.separator()
         layout.prop(self, "flip")
 
 
+class BOUT_OT_ModBooleanFold(bpy.types.Operator):
+    bl_idname = "object.bout_mod_boolean_fold"
+    bl_label = "Fold Booleans"
+    bl_description = "Fold stacks of per-cutter boolean modifiers into collection-operand booleans"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects and context.mode == "OBJECT"
+
+    def execute(self, context):
+        folded_count = 0
+        objects_count = 0
+
+        for obj in context.selected_objects:
+            if obj.type != "MESH":
+                continue
+
+            folded = boolean_utils.fold(obj)
+            if folded > 0:
+                folded_count += folded
+                objects_count += 1
+
+        if folded_count == 0:
+            self.report({"INFO"}, "No boolean stacks to fold")
+            return {"CANCELLED"}
+
+        self.report(
+            {"INFO"},
+            f"Folded {folded_count} boolean modifier(s) on {objects_count} object(s)",
+        )
+        return {"FINISHED"}
+
+
 classes = (
     BOUT_OT_ModBoolean,
     BOUT_OT_ModBooleanSlice,
     BOUT_OT_ModBooleanCarve,
+    BOUT_OT_ModBooleanFold,
 )
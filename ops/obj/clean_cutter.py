@@ -1,5 +1,7 @@
 import bpy
 
+from ...utils import relations
+
 
 class BOUT_OT_CleanCutter(bpy.types.Operator):
     bl_idname = "object.bout_clean_cutter"
@@ -13,12 +15,9 @@ class BOUT_OT_CleanCutter(bpy.types.Operator):
 
     def check_modifier_usage(self, obj):
         """Check if object is used by any modifier in the scene"""
-        for scene_obj in bpy.data.objects:
-            if scene_obj.type == "MESH" and scene_obj != obj:
-                for modifier in scene_obj.modifiers:
-                    # Check if modifier references this object
-                    if hasattr(modifier, "object") and modifier.object == obj:
-                        return True, scene_obj
+        for user in relations.targets(obj, types=None):
+            if user.type == "MESH":
+                return True, user
         return False, None
 
     def invoke(self, context, event):
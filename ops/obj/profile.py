@@ -0,0 +1,251 @@
+import time
+
+import bpy
+
+from ...utils import lazy, relations
+from .boolean import get_solver_items
+
+np = lazy.module("numpy")
+
+ACTIONS = (
+    ("SOLVER", "Switch Solver", "Switch the boolean to the next solver"),
+    ("DISABLE", "Disable", "Disable the modifier in the viewport"),
+    ("APPLY", "Apply", "Apply the modifier"),
+)
+
+
+class ProfileItem(bpy.types.PropertyGroup):
+    """Measured evaluation cost of one modifier"""
+
+    obj_name: bpy.props.StringProperty(name="Object")
+    mod_name: bpy.props.StringProperty(name="Modifier")
+    mod_type: bpy.props.StringProperty(name="Type")
+    operand: bpy.props.StringProperty(name="Operand")
+    solver: bpy.props.StringProperty(name="Solver")
+    triangles: bpy.props.IntProperty(name="Triangles")
+    cost: bpy.props.FloatProperty(name="Cost", description="Evaluation time in ms")
+
+
+class ProfileObject(bpy.types.PropertyGroup):
+    """Measured evaluation cost of one object's modifier stack"""
+
+    obj_name: bpy.props.StringProperty(name="Object")
+    modifiers: bpy.props.IntProperty(name="Modifiers")
+    cost: bpy.props.FloatProperty(name="Cost", description="Evaluation time in ms")
+
+
+class Scene(bpy.types.PropertyGroup):
+    """Last profiling result"""
+
+    items: bpy.props.CollectionProperty(type=ProfileItem)
+    objects: bpy.props.CollectionProperty(type=ProfileObject)
+    total: bpy.props.FloatProperty(name="Total", description="Total time in ms")
+    limit: bpy.props.IntProperty(
+        name="Show",
+        description="Number of most expensive modifiers to list",
+        default=10,
+        min=1,
+        max=100,
+    )
+
+
+def _triangles(operand, depsgraph):
+    """Triangle count of an operand's evaluated mesh, or meshes."""
+    if isinstance(operand, bpy.types.Collection):
+        return sum(_triangles(obj, depsgraph) for obj in operand.all_objects)
+
+    obj = operand
+    if not obj or obj.type != "MESH":
+        return 0
+
+    mesh = obj.evaluated_get(depsgraph).data
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+    return int(totals.sum() - 2 * len(totals))
+
+
+def _evaluate(obj, depsgraph, samples):
+    """Fastest of several forced evaluations of an object, in ms."""
+    best = float("inf")
+    for _ in range(samples):
+        obj.update_tag(refresh={"DATA"})
+        start = time.perf_counter()
+        depsgraph.update()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def _operand(mod):
+    """The cutter, or cutter collection, of a boolean modifier."""
+    if mod.type != "BOOLEAN":
+        return None
+    if mod.operand_type == "COLLECTION":
+        return mod.collection
+    return mod.object
+
+
+class BOUT_OT_Profile(bpy.types.Operator):
+    bl_idname = "object.bout_profile"
+    bl_label = "Profile Modifiers"
+    bl_description = "Measure evaluation time per modifier on selected objects, or on all visible objects with booleans"
+    bl_options = {"REGISTER"}
+
+    samples: bpy.props.IntProperty(
+        name="Samples",
+        description="Evaluations per measurement; the fastest one is kept",
+        default=3,
+        min=1,
+        max=20,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT"
+
+    def _targets(self, context):
+        objects = context.selected_objects or context.visible_objects
+        return [
+            obj
+            for obj in objects
+            if obj.type == "MESH" and any(m.type == "BOOLEAN" for m in obj.modifiers)
+        ]
+
+    def execute(self, context):
+        result = context.scene.bout.ops.obj.profile
+        result.items.clear()
+        result.objects.clear()
+        result.total = 0.0
+
+        targets = self._targets(context)
+        if not targets:
+            self.report({"WARNING"}, "No objects with boolean modifiers")
+            return {"CANCELLED"}
+
+        depsgraph = context.evaluated_depsgraph_get()
+        measured = []
+        stacks = []
+
+        for obj in targets:
+            full = _evaluate(obj, depsgraph, self.samples)
+            result.total += full
+            enabled = sum(m.show_viewport for m in obj.modifiers)
+            stacks.append((full, obj.name, enabled))
+
+            # Cost of a modifier is what the stack saves without it
+            for mod in obj.modifiers:
+                if not mod.show_viewport:
+                    continue
+                mod.show_viewport = False
+                try:
+                    cost = full - _evaluate(obj, depsgraph, self.samples)
+                finally:
+                    mod.show_viewport = True
+
+                operand = _operand(mod)
+                measured.append(
+                    (
+                        max(cost, 0.0),
+                        obj.name,
+                        mod.name,
+                        mod.type,
+                        operand.name if operand else "",
+                        getattr(mod, "solver", ""),
+                        _triangles(operand, depsgraph),
+                    )
+                )
+
+        depsgraph.update()
+
+        for cost, obj_name, mod_name, mod_type, operand, solver, tris in sorted(
+            measured, reverse=True
+        ):
+            item = result.items.add()
+            item.cost = cost
+            item.obj_name = obj_name
+            item.mod_name = mod_name
+            item.mod_type = mod_type
+            item.operand = operand
+            item.solver = solver
+            item.triangles = tris
+
+        for cost, obj_name, modifiers in sorted(stacks, reverse=True):
+            item = result.objects.add()
+            item.cost = cost
+            item.obj_name = obj_name
+            item.modifiers = modifiers
+
+        self.report(
+            {"INFO"},
+            f"Profiled {len(measured)} modifier(s) on {len(targets)} object(s): "
+            f"{result.total:.1f} ms",
+        )
+        return {"FINISHED"}
+
+
+class BOUT_OT_ProfileAction(bpy.types.Operator):
+    bl_idname = "object.bout_profile_action"
+    bl_label = "Profile Action"
+    bl_description = "Act on a profiled modifier"
+    bl_options = {"REGISTER", "UNDO", "INTERNAL"}
+
+    obj_name: bpy.props.StringProperty(options={"HIDDEN"})
+    mod_name: bpy.props.StringProperty(options={"HIDDEN"})
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=ACTIONS,
+        options={"HIDDEN"},
+    )
+
+    @classmethod
+    def description(cls, _context, properties):
+        return next(d for a, _n, d in ACTIONS if a == properties.action)
+
+    def execute(self, context):
+        obj = bpy.data.objects.get(self.obj_name)
+        mod = obj.modifiers.get(self.mod_name) if obj else None
+        if not mod:
+            self.report({"WARNING"}, f"Modifier {self.mod_name} not found")
+            return {"CANCELLED"}
+
+        result = context.scene.bout.ops.obj.profile
+        index = next(
+            (
+                i
+                for i, item in enumerate(result.items)
+                if item.obj_name == self.obj_name and item.mod_name == self.mod_name
+            ),
+            -1,
+        )
+
+        if self.action == "SOLVER":
+            if mod.type != "BOOLEAN":
+                return {"CANCELLED"}
+            solvers = [s[0] for s in get_solver_items(None, context)]
+            current = solvers.index(mod.solver) if mod.solver in solvers else -1
+            mod.solver = solvers[(current + 1) % len(solvers)]
+            if index >= 0:
+                result.items[index].solver = mod.solver
+            return {"FINISHED"}
+
+        if self.action == "DISABLE":
+            mod.show_viewport = False
+        else:
+            with context.temp_override(object=obj, active_object=obj):
+                bpy.ops.object.modifier_apply(modifier=mod.name)
+            relations.refresh(obj)
+
+        if index >= 0:
+            result.items.remove(index)
+        return {"FINISHED"}
+
+
+types_classes = (
+    ProfileItem,
+    ProfileObject,
+    Scene,
+)
+
+classes = (
+    BOUT_OT_Profile,
+    BOUT_OT_ProfileAction,
+)
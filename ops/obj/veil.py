@@ -1,12 +1,19 @@
 import bpy
 
+from ...utils import boolean, relations
+
 
 class BOUT_OT_Veil(bpy.types.Operator):
-    """Hide all mesh objects that are set to wire visibility"""
+    """Hide all mesh objects that are set to wire visibility.
+
+    Per-target cutter collections, made in collection operand mode, are
+    hidden through their layer collections in one step each. Cutters used as
+    object operands, the default, are still hidden one object at a time.
+    """
 
     bl_idname = "object.bout_veil"
     bl_label = "Veil Objects"
-    bl_description = "Hide all mesh objects that are set to wire visibility"
+    bl_description = "Hide all mesh objects that are set to wire visibility. Cutter collections of collection operand booleans are hidden as a whole, other cutters one by one"
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
@@ -15,12 +22,18 @@ class BOUT_OT_Veil(bpy.types.Operator):
         space = context.space_data
         in_local_view = space and hasattr(space, "local_view") and space.local_view
 
-        # Hide all non-selected wire mesh objects
+        # Hide per-target cutter collections in one go, keeping the ones
+        # holding selected objects visible
+        keep = {c for obj in context.selected_objects for c in obj.users_collection}
+        veiled = boolean.veil(context.view_layer, keep)
+
+        # Hide all remaining non-selected wire mesh objects
         for obj in context.visible_objects:
             if (
                 obj.type == "MESH"
                 and obj.display_type == "WIRE"
                 and not obj.select_get()
+                and obj not in veiled
             ):
                 # If in local view, first remove from local view
                 if in_local_view:
@@ -32,11 +45,15 @@ class BOUT_OT_Veil(bpy.types.Operator):
 
 
 class BOUT_OT_Unveil(bpy.types.Operator):
-    """Unhide all objects used as booleans in selected objects"""
+    """Unhide all objects used as booleans in selected objects.
+
+    Per-target cutter collections are shown through their layer collections;
+    cutters used as object operands are shown one object at a time.
+    """
 
     bl_idname = "object.bout_unveil"
     bl_label = "Unveil Objects"
-    bl_description = "Unhide all objects used as booleans in selected objects"
+    bl_description = "Unhide all objects used as booleans in selected objects. Cutter collections of collection operand booleans are shown as a whole, other cutters one by one"
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
@@ -49,16 +66,14 @@ class BOUT_OT_Unveil(bpy.types.Operator):
 
         for obj in selected_objects:
             if obj.type == "MESH":
-                for mod in obj.modifiers:
-                    if (
-                        mod.type == "BOOLEAN"
-                        and mod.object
-                        and mod.object.name in bpy.data.objects
-                    ):
-                        boolean_objects.add(mod.object)
+                boolean_objects.update(relations.cutters(obj))
+
+        # Show per-target cutter collections in one go
+        unveiled = boolean.unveil(context.view_layer, selected_objects)
 
         for obj in boolean_objects:
-            obj.hide_set(False)
+            if obj not in unveiled or obj.hide_get():
+                obj.hide_set(False)
             # If in local view, also add the object to local view
             if in_local_view and not obj.local_view_get(space):
                 obj.local_view_set(space, True)
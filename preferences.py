@@ -24,6 +24,18 @@ class BOUT_Preference(bpy.types.AddonPreferences):
         default=False,
     )
 
+    timing: bpy.props.BoolProperty(
+        name="Timing",
+        description="Time the Block tool's stages and show them in the viewport",
+        default=False,
+    )
+
+    record: bpy.props.BoolProperty(
+        name="Record",
+        description="Record the Block tool's sessions for replay",
+        default=False,
+    )
+
     theme: bpy.props.PointerProperty(type=btypes.Theme)
     tools: bpy.props.PointerProperty(type=btypes.Tools)
 
@@ -56,6 +68,10 @@ class BOUT_Preference(bpy.types.AddonPreferences):
 
         elif self.settings == "DEBUG":
             col.prop(self, "debug")
+            col.prop(self, "timing")
+            col.operator("wm.bout_timing_dump", icon="EXPORT")
+            col.prop(self, "record")
+            col.operator("wm.bout_record_dump", icon="EXPORT")
 
     def draw_info(self, layout):
         box = layout.box()
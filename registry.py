@@ -1,35 +1,87 @@
+import bpy
 from bpy.utils import register_class, unregister_class, register_tool, unregister_tool
-from . import btypes, ops, ui, preferences, tools, gizmo, keymap
+from . import btypes, ops, preferences
+from .utils import relations
+from .utils.scene import evaluated
 
 
 classes = (
     *btypes.classes,
     *preferences.classes,
     *ops.classes,
-    *tools.classes,
-    *gizmo.classes,
-    *ui.classes,
 )
 
+_interactive = False
+
+
+def _interactive_classes():
+    """Tools, panels, menus and gizmos.
+
+    Imported on first call; in background mode they are never registered, so
+    their modules are not imported either. Only the operators and their data
+    are of use to scripts there.
+    """
+    from . import gizmo, ui
+    from .tools.block import mesh, obj
+
+    return (
+        *obj.classes,
+        *mesh.classes,
+        *gizmo.classes,
+        *ui.classes,
+    )
+
 
 def register():
+    global _interactive
+
     for cls in classes:
         register_class(cls)
 
-    register_tool(tools.block.mesh.BOUT_MT_Block, group=False, separator=True)
-    register_tool(tools.block.obj.BOUT_MT_BlockObj, group=False, separator=True)
-
     btypes.register()
+    # Scripted booleans rely on the operand registry following edits, so its
+    # handlers are kept in background mode too
+    relations.register()
+
+    _interactive = not bpy.app.background
+    if not _interactive:
+        return
+
+    from . import keymap, ui
+    from .tools.block import mesh, obj, warmup
+
+    # Only the modal tools read evaluated meshes through the cache
+    evaluated.register()
+
+    for cls in _interactive_classes():
+        register_class(cls)
+
+    register_tool(mesh.BOUT_MT_Block, group=False, separator=True)
+    register_tool(obj.BOUT_MT_BlockObj, group=False, separator=True)
+
     keymap.register()
     ui.register()
+    warmup.register()
 
 
 def unregister():
-    ui.unregister()
-    keymap.unregister()
+    if _interactive:
+        from . import keymap, ui
+        from .tools.block import mesh, obj, warmup
+
+        warmup.unregister()
+        ui.unregister()
+        keymap.unregister()
+
+        unregister_tool(obj.BOUT_MT_BlockObj)
+        unregister_tool(mesh.BOUT_MT_Block)
+
+        for cls in reversed(_interactive_classes()):
+            unregister_class(cls)
+
+        evaluated.unregister()
 
-    unregister_tool(tools.block.obj.BOUT_MT_BlockObj)
-    unregister_tool(tools.block.mesh.BOUT_MT_Block)
+    relations.unregister()
 
     for cls in reversed(classes):
         unregister_class(cls)
@@ -4,6 +4,8 @@ from mathutils import Vector
 import mathutils.geometry
 from gpu_extras.batch import batch_for_shader
 
+from ..utils import timing
+
 
 class DrawBase:
     """Base class for GPU drawing with common functionality."""
@@ -13,6 +15,12 @@ class DrawBase:
     color = None
     width = 1
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time overlay batch rebuilds of every drawing class
+        if "create_batch" in cls.__dict__:
+            cls.create_batch = timing.timed("batch")(cls.create_batch)
+
     def create_batch(self):
         raise NotImplementedError
 
@@ -230,6 +238,46 @@ class DrawPolyline(DrawBase):
         gpu.state.blend_set("ALPHA")
 
 
+class DrawSegments(DrawBase):
+    """Line segments in one color, from an (n, 2, 3) float32 numpy.ndarray.
+
+    The array goes to the GPU as a single buffer, without a Python loop over
+    the points, so sections with many segments can be rebuilt every frame.
+    """
+
+    def __init__(self, segments, width, color):
+        self.shader = gpu.shader.from_builtin("POLYLINE_UNIFORM_COLOR")
+        self.width = width
+        self.color = color
+        self.segments = segments
+        self.batch = None
+
+    def is_valid(self):
+        return self.segments is not None and len(self.segments) >= 1
+
+    def create_batch(self):
+        if not self.is_valid():
+            return batch_for_shader(self.shader, "LINES", {"pos": []})
+        return batch_for_shader(
+            self.shader, "LINES", {"pos": self.segments.reshape(-1, 3)}
+        )
+
+    def update_batch(self, segments, color=None):
+        self.segments = segments
+        if color is not None:
+            self.color = color
+        self.batch = self.create_batch()
+
+    def clear(self):
+        self.update_batch(segments=None)
+
+    def setup_draw_state(self, context):
+        super().setup_draw_state(context)
+        vp_width, vp_height = self.get_viewport_size(context)
+        self.shader.uniform_float("viewportSize", (vp_width, vp_height))
+        self.shader.uniform_float("lineWidth", self.width)
+
+
 class DrawPlane(DrawBase):
     def __init__(self, plane_co, plane_no, size=1.0, color=(1.0, 1.0, 1.0, 1.0)):
         self.shader = gpu.shader.from_builtin("FLAT_COLOR")
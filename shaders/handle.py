@@ -4,6 +4,7 @@ from .draw import (
     DrawLine,
     DrawGradient,
     DrawPolyline,
+    DrawSegments,
     DrawPlane,
     DrawFace,
     DrawGrid,
@@ -75,6 +76,21 @@ class Polyline(Handle):
         draw_handlers.append(self.handle)
 
 
+@dataclass
+class Segments(Handle):
+    """Dataclass for the line segments data."""
+
+    callback: DrawSegments | None = None
+
+    def create(self, context, segments=None, width=1.6, color=(0, 0, 0, 1)):
+        """Create a line segments draw handler."""
+        self.callback = DrawSegments(segments=segments, width=width, color=color)
+        self.handle = bpy.types.SpaceView3D.draw_handler_add(
+            self.callback.draw, (context,), "WINDOW", "POST_VIEW"
+        )
+        draw_handlers.append(self.handle)
+
+
 @dataclass
 class Points(Handle):
     """Dataclass for the points data."""
@@ -5,6 +5,8 @@ from mathutils import Vector
 import blf
 import math
 
+from ..utils import timing
+
 
 class InterfaceDraw:
     def __init__(self, lines, text_size=10, padding=14, text_padding=12, segments=16):
@@ -39,6 +41,7 @@ class InterfaceDraw:
 
         return vertices
 
+    @timing.timed("batch")
     def create_batch(self, dpi):
         """Create a batch for the shader"""
         # Set font size with DPI and UI scale compensation
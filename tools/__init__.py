@@ -2,6 +2,3 @@ from . import block
 
 
 types_classes = (*block.types_classes,)
-
-
-classes = (*block.classes,)
@@ -1,6 +1,4 @@
 import bpy
-from . import mesh
-from . import obj
 from . import data
 
 
@@ -19,8 +17,3 @@ types_classes = (
     *data.types_classes,
     Pref,
 )
-
-classes = (
-    *obj.classes,
-    *mesh.classes,
-)
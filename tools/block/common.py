@@ -23,6 +23,9 @@ def draw_align(layout, context, block):
 
     layout.separator()
     layout.prop(block.align, "solver")
+    layout.prop(block.align, "collection")
+    layout.prop(block.align, "cull")
+    layout.prop(block.align, "single_pass")
 
 
 def draw_type(layout, block):
@@ -71,3 +74,8 @@ def draw_shape(layout, block):
     col_3d.scale_y = 1.6
     for shape, icon in shapes_3d:
         col_3d.prop_enum(block, "shape", shape, icon=icon)
+
+    layout.separator()
+    layout.use_property_split = True
+    layout.prop(block.form, "adaptive")
+    layout.prop(block.form, "lasso")
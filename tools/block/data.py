@@ -84,6 +84,21 @@ class Align(bpy.types.PropertyGroup):
     solver: bpy.props.EnumProperty(
         name="Solver", description="Boolean Solver", items=get_solver_items, default=0
     )
+    collection: bpy.props.BoolProperty(
+        name="Collection",
+        description="Route cutters into a per-target collection used by a single boolean modifier",
+        default=False,
+    )
+    cull: bpy.props.BoolProperty(
+        name="Skip Untouched",
+        description="Only add cut modifiers to selected objects the cutter overlaps",
+        default=True,
+    )
+    single_pass: bpy.props.BoolProperty(
+        name="Single Pass Slice",
+        description="Bake the slice part to a mesh from one evaluation of its intersect boolean, instead of keeping a live boolean on a full mesh copy. The baked part no longer follows its cutter; the cut in the original stays a live boolean",
+        default=False,
+    )
 
 
 class Form(bpy.types.PropertyGroup):
@@ -97,6 +112,16 @@ class Form(bpy.types.PropertyGroup):
     circle_verts: bpy.props.IntProperty(
         name="Verts", description="Circle Verts", default=32, min=3, max=256
     )
+    adaptive: bpy.props.BoolProperty(
+        name="Adaptive Resolution",
+        description="Build circles, cylinders and spheres with fewer vertices while they are small on screen; the finished cutter has the full resolution",
+        default=False,
+    )
+    lasso: bpy.props.BoolProperty(
+        name="Freehand",
+        description="Trace NGON and NHEDRON outlines in one drag; the stroke is simplified into the face's points",
+        default=False,
+    )
 
 
 types_classes = (
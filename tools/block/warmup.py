@@ -0,0 +1,129 @@
+"""Pre-build the Block tool's caches when the tool becomes active.
+
+The first click otherwise pays for the depsgraph evaluation, the ray-cast
+BVH of each target and its evaluated mesh for orientation. A message bus
+subscription on the workspace tools starts a timer that builds them for the
+selected, or edited, objects one step at a time, keeping the UI responsive.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+from mathutils import Vector
+
+from ...utils import modifier
+from ...utils.scene import evaluated
+
+TOOLS = {"object.bout_block_obj", "object.bout_block_mesh"}
+
+# Seconds between steps
+INTERVAL = 0.01
+
+_owner = object()
+_steps = None
+
+
+def _targets(context):
+    """Names of the objects the tool will draw on, active first.
+
+    Capped at the evaluated mesh cache size; warming more would evict the
+    meshes warmed first, the active object's among them.
+    """
+    if context.mode == "EDIT_MESH":
+        objects = context.objects_in_mode_unique_data
+    else:
+        objects = context.selected_objects
+    active = context.active_object
+    objects = sorted(objects, key=lambda obj: obj != active)
+    return [obj.name for obj in objects if obj.type == "MESH"][: evaluated.SIZE]
+
+
+def _warm(context, names):
+    """Build the caches, one object per step."""
+    context.evaluated_depsgraph_get()
+    yield
+
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        depsgraph = context.evaluated_depsgraph_get()
+
+        # Any ray builds the BVH the tool's ray casts reuse
+        try:
+            obj.evaluated_get(depsgraph).ray_cast(Vector(), Vector((0.0, 0.0, 1.0)))
+        except RuntimeError:
+            pass
+        yield
+
+        evaluated.get(obj, depsgraph)
+        yield
+
+    if context.mode == "OBJECT":
+        modifier.load_auto_smooth()
+
+
+def _step():
+    global _steps
+    if _steps is None:
+        return None
+    try:
+        next(_steps)
+    except StopIteration:
+        _steps = None
+        return None
+    return INTERVAL
+
+
+def _active_tool(context):
+    workspace = context.workspace
+    if workspace is None:
+        return None
+    tool = workspace.tools.from_space_view3d_mode(context.mode, create=False)
+    return tool.idname if tool else None
+
+
+def _on_tool_change():
+    global _steps
+    context = bpy.context
+    if _active_tool(context) not in TOOLS:
+        _steps = None
+        return
+
+    names = _targets(context)
+    if not names:
+        return
+
+    _steps = _warm(context, names)
+    if not bpy.app.timers.is_registered(_step):
+        bpy.app.timers.register(_step, first_interval=INTERVAL)
+
+
+def _subscribe():
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.WorkSpace, "tools"),
+        owner=_owner,
+        args=(),
+        notify=_on_tool_change,
+    )
+
+
+@persistent
+def _on_load(*_args):
+    # Subscriptions are cleared when a file loads
+    _subscribe()
+
+
+def register():
+    _subscribe()
+    if _on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    global _steps
+    _steps = None
+    if bpy.app.timers.is_registered(_step):
+        bpy.app.timers.unregister(_step)
+    if _on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load)
+    bpy.msgbus.clear_by_owner(_owner)
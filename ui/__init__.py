@@ -1,9 +1,11 @@
 from . import menus
+from . import panels
 from . import popups
 
 
 classes = (
     *menus.classes,
+    *panels.classes,
     *popups.classes,
 )
 
@@ -26,6 +26,7 @@ class BOUT_MT_ObjectMode(bpy.types.Menu):
         # Special boolean operations
         layout.operator("object.bout_mod_boolean_slice", text="Slice")
         layout.operator("object.bout_mod_boolean_carve", text="Carve")
+        layout.operator("object.bout_mod_boolean_fold", text="Fold Booleans")
 
         layout.separator()
         layout.operator("object.bout_clean_cutter")
@@ -0,0 +1,4 @@
+from . import profile
+
+
+classes = (*profile.classes,)
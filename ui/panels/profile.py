@@ -0,0 +1,63 @@
+import bpy
+
+
+class BOUT_PT_Profile(bpy.types.Panel):
+    bl_idname = "BOUT_PT_Profile"
+    bl_label = "Profiler"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Blockout"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT"
+
+    def draw(self, context):
+        layout = self.layout
+        result = context.scene.bout.ops.obj.profile
+
+        row = layout.row(align=True)
+        row.operator("object.bout_profile", icon="TIME")
+        row.prop(result, "limit", text="")
+
+        if not result.items:
+            return
+
+        layout.label(text=f"Total: {result.total:.1f} ms")
+
+        col = layout.column(align=True)
+        for item in result.objects[: result.limit]:
+            row = col.row(align=True)
+            row.label(text=f"{item.cost:.1f} ms")
+            row.label(text=item.obj_name, icon="OBJECT_DATA")
+            row.label(text=f"{item.modifiers} mods")
+
+        layout.separator()
+
+        col = layout.column(align=True)
+        for item in result.items[: result.limit]:
+            box = col.box()
+            row = box.row(align=True)
+            row.label(text=f"{item.cost:.1f} ms")
+            row.label(text=item.operand or item.mod_name)
+
+            _action(row, item, "DISABLE", text="", icon="HIDE_ON")
+            _action(row, item, "APPLY", text="", icon="CHECKMARK")
+
+            row = box.row(align=True)
+            row.label(text=f"{item.obj_name}: {item.mod_name}", icon="MODIFIER")
+            if item.mod_type == "BOOLEAN":
+                row.label(text=f"{item.triangles} tris")
+                _action(row, item, "SOLVER", text=item.solver.title())
+
+
+def _action(layout, item, action, **kwargs):
+    """Draw a profile action button for a profiled modifier"""
+    op = layout.operator("object.bout_profile_action", **kwargs)
+    op.obj_name = item.obj_name
+    op.mod_name = item.mod_name
+    op.action = action
+
+
+classes = (BOUT_PT_Profile,)
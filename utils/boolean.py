@@ -0,0 +1,434 @@
+"""Collection-operand boolean utilities.
+
+Routes cutters into a per-target cutter collection that is referenced by a
+single boolean modifier (``operand_type = "COLLECTION"``), so new cuts grow
+the collection instead of the target's modifier stack.
+"""
+
+import math
+
+import bpy
+
+from . import collection, modifier, relations
+
+CUTTERS = "Cutters"
+
+# Settings a collection-operand boolean is created with; cutters are only
+# routed into an existing boolean that still carries them
+DEFAULTS = {
+    "use_self": False,
+    "use_hole_tolerant": False,
+    "show_render": True,
+    "double_threshold": 1e-6,
+}
+
+
+def is_cutter_collection(coll):
+    """Check if a collection is a per-target cutter collection.
+
+    :param coll: The collection to check.
+    :type coll: bpy.types.Collection | None
+    :return: True if the collection is a direct child of the Cutters collection.
+    :rtype: bool
+    """
+    root = collection.get(CUTTERS)
+    return bool(coll and root and coll.name in root.children)
+
+
+def settings(mod):
+    """Settings boolean modifiers must share to be evaluated as one.
+
+    :param mod: Boolean modifier.
+    :type mod: bpy.types.BooleanModifier
+    :return: Operation, solver and the ``DEFAULTS`` settings, threshold last.
+    :rtype: tuple
+    """
+    return (mod.operation, mod.solver) + tuple(getattr(mod, k) for k in DEFAULTS)
+
+
+def compatible(a, b):
+    """Compare two ``settings`` tuples, allowing float noise in the threshold.
+
+    :param a: Settings of one modifier.
+    :type a: tuple
+    :param b: Settings of another modifier.
+    :type b: tuple
+    :return: True if cutters of both modifiers can share one boolean.
+    :rtype: bool
+    """
+    return a[:-1] == b[:-1] and math.isclose(a[-1], b[-1], rel_tol=1e-5)
+
+
+def find(obj, operation, solver):
+    """Find the collection-operand boolean owned by Blockout for an operation.
+
+    Only a boolean that still has the solver and the ``DEFAULTS`` settings
+    is returned, so a new cutter is never evaluated with settings that were
+    changed by hand for the cutters already in the collection.
+
+    :param obj: Target object to search.
+    :type obj: bpy.types.Object
+    :param operation: Boolean operation ('DIFFERENCE', 'UNION', 'INTERSECT').
+    :type operation: str
+    :param solver: Boolean solver.
+    :type solver: str
+    :return: The modifier, or None if the target has none.
+    :rtype: bpy.types.BooleanModifier | None
+    """
+    key = (operation, solver) + tuple(DEFAULTS.values())
+    for mod in obj.modifiers:
+        if (
+            mod.type == "BOOLEAN"
+            and mod.operand_type == "COLLECTION"
+            and is_cutter_collection(mod.collection)
+            and compatible(settings(mod), key)
+        ):
+            return mod
+    return None
+
+
+def new(obj, operation, solver):
+    """Create a cutter collection and the boolean modifier that references it.
+
+    :param obj: Target object to add the modifier to.
+    :type obj: bpy.types.Object
+    :param operation: Boolean operation.
+    :type operation: str
+    :param solver: Boolean solver.
+    :type solver: str
+    :return: The created modifier, or None if object is not a mesh.
+    :rtype: bpy.types.BooleanModifier | None
+    """
+    mod = modifier.add(obj, "Boolean", "BOOLEAN")
+    if not mod:
+        return None
+
+    root = collection.get(CUTTERS) or collection.create(CUTTERS)
+    coll = collection.create_child(root, f"{obj.name} {operation.capitalize()}")
+
+    mod.operand_type = "COLLECTION"
+    mod.collection = coll
+    mod.operation = operation
+    mod.solver = solver
+    mod.show_in_editmode = True
+    for key, value in DEFAULTS.items():
+        setattr(mod, key, value)
+
+    return mod
+
+
+def link(cutter, coll):
+    """Link a cutter into a cutter collection.
+
+    The cutter is unlinked from the root Cutters collection, since the
+    per-target collection already keeps it in the Cutters hierarchy.
+
+    :param cutter: Cutter object to link.
+    :type cutter: bpy.types.Object
+    :param coll: Per-target cutter collection.
+    :type coll: bpy.types.Collection
+    """
+    if cutter.name not in coll.objects:
+        coll.objects.link(cutter)
+
+    root = collection.get(CUTTERS)
+    if root and cutter.name in root.objects:
+        root.objects.unlink(cutter)
+
+
+def unlink(cutter, coll):
+    """Unlink a cutter from a cutter collection.
+
+    Falls back to the root Cutters collection so the cutter never ends up
+    without a collection.
+
+    :param cutter: Cutter object to unlink.
+    :type cutter: bpy.types.Object
+    :param coll: Per-target cutter collection.
+    :type coll: bpy.types.Collection
+    """
+    if cutter.name in coll.objects:
+        coll.objects.unlink(cutter)
+
+    if not cutter.users_collection:
+        root = collection.get(CUTTERS) or collection.create(CUTTERS)
+        root.objects.link(cutter)
+
+
+def add(obj, cutter, operation, solver):
+    """Append a cutter to the target's collection-operand boolean.
+
+    Reuses the existing modifier for the operation and solver, or creates
+    one.
+
+    :param obj: Target object.
+    :type obj: bpy.types.Object
+    :param cutter: Cutter object.
+    :type cutter: bpy.types.Object
+    :param operation: Boolean operation.
+    :type operation: str
+    :param solver: Boolean solver.
+    :type solver: str
+    :return: The modifier the cutter was routed into.
+    :rtype: bpy.types.BooleanModifier | None
+    """
+    mod = find(obj, operation, solver) or new(obj, operation, solver)
+    if mod:
+        link(cutter, mod.collection)
+        relations.refresh(obj)
+    return mod
+
+
+def release(obj, mod):
+    """Remove a collection-operand boolean once its collection is empty.
+
+    :param obj: Target object owning the modifier.
+    :type obj: bpy.types.Object
+    :param mod: Collection-operand boolean modifier.
+    :type mod: bpy.types.BooleanModifier
+    """
+    coll = mod.collection
+    if coll and coll.all_objects:
+        relations.refresh(obj)
+        return
+
+    modifier.remove(obj, mod)
+    if coll and coll.users <= 1:
+        bpy.data.collections.remove(coll)
+    relations.refresh(obj)
+
+
+def isolate(obj):
+    """Give a duplicated target its own copies of shared cutter collections.
+
+    ``Object.copy`` keeps modifiers pointing at the original's collections,
+    so cuts added to the original would leak into the duplicate.
+
+    :param obj: The duplicated target object.
+    :type obj: bpy.types.Object
+    """
+    for mod in obj.modifiers:
+        if (
+            mod.type == "BOOLEAN"
+            and mod.operand_type == "COLLECTION"
+            and is_cutter_collection(mod.collection)
+        ):
+            source = mod.collection
+            root = collection.get(CUTTERS)
+            coll = collection.create_child(
+                root, f"{obj.name} {mod.operation.capitalize()}"
+            )
+            for cutter in source.objects:
+                coll.objects.link(cutter)
+            mod.collection = coll
+
+    relations.refresh(obj)
+
+
+def fold(obj):
+    """Fold runs of adjacent boolean modifiers into collection operands.
+
+    A run is a sequence of consecutive, enabled boolean modifiers sharing
+    operation, solver and the ``DEFAULTS`` settings, so folding never changes
+    how a cutter is evaluated. Each run of two or more modifiers is replaced by a
+    single collection-operand boolean placed where the run started.
+
+    :param obj: Target object whose stack is folded.
+    :type obj: bpy.types.Object
+    :return: Number of modifiers the stack shrank by.
+    :rtype: int
+    """
+    runs = []
+    run = []
+    for mod in obj.modifiers:
+        foldable = mod.type == "BOOLEAN" and mod.show_viewport and (
+            (mod.operand_type == "OBJECT" and mod.object)
+            or (mod.operand_type == "COLLECTION" and is_cutter_collection(mod.collection))
+        )
+        if run and (
+            not foldable or not compatible(settings(mod), settings(run[0]))
+        ):
+            runs.append(run)
+            run = []
+        if foldable:
+            run.append(mod)
+    if run:
+        runs.append(run)
+
+    removed = 0
+    for run in runs:
+        if len(run) < 2:
+            continue
+
+        first = run[0]
+        index = obj.modifiers.find(first.name)
+        target = next((m for m in run if m.operand_type == "COLLECTION"), None)
+        if target is None:
+            target = new(obj, first.operation, first.solver)
+            for key in DEFAULTS:
+                setattr(target, key, getattr(first, key))
+            obj.modifiers.move(obj.modifiers.find(target.name), index)
+            removed -= 1
+
+        for mod in run:
+            if mod == target:
+                continue
+            if mod.operand_type == "OBJECT":
+                link(mod.object, target.collection)
+            else:
+                for cutter in mod.collection.objects:
+                    link(cutter, target.collection)
+            coll = mod.collection if mod.operand_type == "COLLECTION" else None
+            modifier.remove(obj, mod)
+            if coll and coll.users <= 1:
+                bpy.data.collections.remove(coll)
+            removed += 1
+
+    relations.refresh(obj)
+    return removed
+
+
+def discard(obj):
+    """Drop an object's collection-operand booleans and unshared collections.
+
+    Used before removing a target, so its cutter collections are not left
+    behind under the Cutters collection.
+
+    :param obj: The target object about to be removed.
+    :type obj: bpy.types.Object
+    """
+    for mod in obj.modifiers[:]:
+        if (
+            mod.type == "BOOLEAN"
+            and mod.operand_type == "COLLECTION"
+            and is_cutter_collection(mod.collection)
+        ):
+            coll = mod.collection
+            modifier.remove(obj, mod)
+            if coll.users <= 1:
+                bpy.data.collections.remove(coll)
+
+    relations.refresh(obj)
+
+
+def linked_duplicate(obj, coll, name):
+    """Duplicate an object that shares the source mesh instead of copying it.
+
+    :param obj: Object to duplicate.
+    :type obj: bpy.types.Object
+    :param coll: Collection to link the duplicate into.
+    :type coll: bpy.types.Collection
+    :param name: Name for the duplicate.
+    :type name: str
+    :return: The duplicate object.
+    :rtype: bpy.types.Object
+    """
+    duplicate = obj.copy()
+    duplicate.name = name
+    coll.objects.link(duplicate)
+    isolate(duplicate)
+    return duplicate
+
+
+def bake(obj, depsgraph):
+    """Commit an object's evaluated result as its own mesh.
+
+    The stack is evaluated once; the object then owns a mesh holding only
+    the result and carries no modifiers. A mesh it shared with its source
+    stays with the source.
+
+    :param obj: Object to bake.
+    :type obj: bpy.types.Object
+    :param depsgraph: Evaluated depsgraph holding the object's result.
+    :type depsgraph: bpy.types.Depsgraph
+    """
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+    source = obj.data
+
+    discard(obj)
+    obj.modifiers.clear()
+    obj.data = mesh
+    mesh.name = obj.name
+
+    if source.users == 0:
+        bpy.data.meshes.remove(source)
+
+    relations.refresh(obj)
+
+
+def _layer(view_layer):
+    """Layer collection of the Cutters collection, if any."""
+    root = collection.get(CUTTERS)
+    if not root:
+        return None
+    return collection.find_layer(view_layer.layer_collection, root)
+
+
+def veil(view_layer, keep=()):
+    """Hide per-target cutter collections in a view layer.
+
+    Toggles one layer collection per target instead of hiding every cutter.
+    Cutters linked directly into the Cutters collection are left alone.
+
+    :param view_layer: View layer to hide the collections in.
+    :type view_layer: bpy.types.ViewLayer
+    :param keep: Collections to leave visible.
+    :type keep: Container[bpy.types.Collection]
+    :return: Cutters in the hidden collections.
+    :rtype: set[bpy.types.Object]
+    """
+    layer = _layer(view_layer)
+    if not layer:
+        return set()
+
+    hidden = set()
+    for child in layer.children:
+        if child.collection in keep or not is_cutter_collection(child.collection):
+            continue
+        if not child.hide_viewport:
+            child.hide_viewport = True
+        hidden.update(child.collection.all_objects)
+
+    return hidden
+
+
+def unveil(view_layer, targets):
+    """Show the cutter collections used by targets in a view layer.
+
+    :param view_layer: View layer to show the collections in.
+    :type view_layer: bpy.types.ViewLayer
+    :param targets: Objects whose cutter collections are shown.
+    :type targets: Iterable[bpy.types.Object]
+    :return: Cutters in the shown collections.
+    :rtype: set[bpy.types.Object]
+    """
+    layer = _layer(view_layer)
+    if not layer:
+        return set()
+
+    colls = {
+        mod.collection
+        for obj in targets
+        for mod in obj.modifiers
+        if mod.type == "BOOLEAN"
+        and mod.operand_type == "COLLECTION"
+        and is_cutter_collection(mod.collection)
+    }
+    if not colls:
+        return set()
+
+    if layer.exclude:
+        layer.exclude = False
+    if layer.hide_viewport:
+        layer.hide_viewport = False
+
+    shown = set()
+    for child in layer.children:
+        if child.collection in colls:
+            if child.exclude:
+                child.exclude = False
+            if child.hide_viewport:
+                child.hide_viewport = False
+            shown.update(child.collection.all_objects)
+
+    return shown
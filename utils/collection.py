@@ -33,10 +33,30 @@ def create(name, color_tag="COLOR_01"):
     return coll
 
 
+def create_child(parent, name, color_tag="COLOR_01"):
+    """Create a new collection nested under a parent collection.
+
+    :param parent: The collection to link the new collection into.
+    :type parent: bpy.types.Collection
+    :param name: The name for the new collection.
+    :type name: str
+    :param color_tag: The color tag for the collection.
+    :type color_tag: str
+    :return: The newly created collection.
+    :rtype: bpy.types.Collection
+    """
+    coll = bpy.data.collections.new(name)
+    parent.children.link(coll)
+    coll.color_tag = color_tag
+    return coll
+
+
 def append(objs, name, color_tag="COLOR_01"):
     """Move objects to a collection, creating it if needed.
 
     Unlinks objects from their current collections before linking to the target.
+    Objects already inside the target's child collections stay there, and are
+    only unlinked from collections outside the target.
 
     :param objs: Iterable of objects to move.
     :type objs: Iterable[bpy.types.Object]
@@ -49,9 +69,38 @@ def append(objs, name, color_tag="COLOR_01"):
     """
     coll = get(name) or create(name, color_tag)
 
+    nested = set(coll.children_recursive)
+
     for obj in objs:
+        if any(c in nested for c in obj.users_collection):
+            for c in obj.users_collection:
+                if c not in nested:
+                    c.objects.unlink(obj)
+            continue
         for c in obj.users_collection:
             c.objects.unlink(obj)
         coll.objects.link(obj)
 
     return coll
+
+
+def find_layer(layer_collection, coll):
+    """Find the layer collection of a collection in a view layer tree.
+
+    :param layer_collection: Layer collection to search from, usually
+        ``view_layer.layer_collection``.
+    :type layer_collection: bpy.types.LayerCollection
+    :param coll: The collection to look for.
+    :type coll: bpy.types.Collection
+    :return: The layer collection, or None if not in the tree.
+    :rtype: bpy.types.LayerCollection | None
+    """
+    if layer_collection.collection == coll:
+        return layer_collection
+
+    for child in layer_collection.children:
+        found = find_layer(child, coll)
+        if found:
+            return found
+
+    return None
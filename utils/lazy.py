@@ -0,0 +1,30 @@
+"""Deferred imports of heavy modules.
+
+``np = lazy.module("numpy")`` binds a stand-in that imports the real module
+the first time one of its attributes is used, keeping the import off the
+add-on's enable path.
+"""
+
+import importlib
+import sys
+import types
+
+
+class _Module(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute use."""
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def module(name):
+    """Get a module, importing it only when it is first used.
+
+    :param name: Absolute module name, e.g. ``numpy``.
+    :type name: str
+    :return: The module if already imported, otherwise a stand-in for it.
+    :rtype: types.ModuleType
+    """
+    return sys.modules.get(name) or _Module(name)
@@ -94,6 +94,34 @@ def _auto_smooth_file_path():
     return asset_file
 
 
+def load_auto_smooth():
+    """Get the Smooth by Angle node group.
+
+    Loads the node group from Blender's assets if not already loaded.
+
+    :return: The node group, or None if it could not be loaded.
+    :rtype: bpy.types.GeometryNodeTree | None
+    """
+    node_group_name = "Smooth by Angle"
+
+    # Check if the node group is already loaded
+    node_group = bpy.data.node_groups.get(node_group_name)
+    if node_group:
+        return node_group
+
+    # Get the path to the default asset file
+    asset_file = _auto_smooth_file_path()
+    if not asset_file:
+        print("Asset file could not be located.")
+        return None
+
+    # Load the node group from the file
+    node_group = load_from_file(asset_file, node_group_name)
+    if not node_group:
+        print(f"Node group '{node_group_name}' could not be loaded.")
+    return node_group
+
+
 def auto_smooth(obj):
     """Add Smooth by Angle geometry nodes modifier to the object.
 
@@ -105,22 +133,10 @@ def auto_smooth(obj):
     :return: The created modifier, or None if skipped or failed.
     :rtype: bpy.types.NodesModifier | None
     """
-    node_group_name = "Smooth by Angle"
-
-    # Check if the node group is already loaded
-    node_group = bpy.data.node_groups.get(node_group_name)
+    node_group = load_auto_smooth()
     if not node_group:
-        # Get the path to the default asset file
-        asset_file = _auto_smooth_file_path()
-        if not asset_file:
-            print("Asset file could not be located.")
-            return None
-
-        # Load the node group from the file
-        node_group = load_from_file(asset_file, node_group_name)
-        if not node_group:
-            print(f"Node group '{node_group_name}' could not be loaded.")
-            return None
+        return None
+    node_group_name = node_group.name
 
     for modifier in obj.modifiers:
         if modifier.type == "NODES":
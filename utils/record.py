@@ -0,0 +1,144 @@
+"""Opt-in recording of Block tool modal sessions.
+
+A session holds the view and tool state the Block tool started from and every
+event its modal received, so ``benchmarks/replay.py`` can feed the same stream
+back through Blender's event simulation. Enable from the add-on preferences
+(Debug > Record); the Block tool picks the setting up when it starts.
+"""
+
+import json
+import time
+
+import bpy
+
+from .view3d import get_mouse_region_prev
+
+# Bumped when the session layout changes
+VERSION = 1
+
+enabled = False
+
+# The last finished session
+last = None
+
+_session = None
+_start = 0.0
+
+
+def _props(pg):
+    """Plain property values of a property group.
+
+    :param pg: Property group to read.
+    :type pg: bpy.types.PropertyGroup
+    :return: Mapping of property identifier to value; pointer and collection
+        properties are left out.
+    :rtype: dict
+    """
+    values = {}
+    for prop in pg.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type in {"POINTER", "COLLECTION"}:
+            continue
+        value = getattr(pg, prop.identifier)
+        if getattr(prop, "is_array", False):
+            value = list(value)
+        elif isinstance(value, set):
+            value = sorted(value)
+        values[prop.identifier] = value
+    return values
+
+
+def _skipped(event):
+    """Events no user produced; the replay gets its own."""
+    return event.type == "NONE" or event.type.startswith("TIMER")
+
+
+def start(context, event, config):
+    """Begin recording a session.
+
+    :param context: Context of the invoke.
+    :type context: bpy.types.Context
+    :param event: The event that invoked the tool.
+    :type event: bpy.types.Event
+    :param config: The tool configuration of the session.
+    :type config: ops.block.data.Config
+    """
+    global _session, _start
+
+    region = context.region
+    rv3d = context.region_data
+    space = context.space_data
+
+    _start = time.perf_counter()
+    _session = {
+        "version": VERSION,
+        "blender": bpy.app.version_string,
+        "file": bpy.data.filepath,
+        "type": config.type,
+        "shape": config.shape,
+        "mode": config.mode,
+        "snap": config.snap,
+        "align": _props(config.align),
+        "form": _props(config.form),
+        "scene_align": _props(context.scene.bout.align),
+        "selected": [obj.name for obj in context.selected_objects],
+        "active": context.active_object.name if context.active_object else "",
+        "region": {"width": region.width, "height": region.height},
+        "view": {
+            "location": list(rv3d.view_location),
+            "rotation": list(rv3d.view_rotation),
+            "distance": rv3d.view_distance,
+            "perspective": rv3d.view_perspective,
+            "lens": space.lens,
+            "clip_start": space.clip_start,
+            "clip_end": space.clip_end,
+        },
+        "press": list(get_mouse_region_prev(event)),
+        "events": [],
+    }
+    record(event, "INVOKE")
+
+
+def record(event, phase):
+    """Add an event to the session being recorded.
+
+    :param event: Event received by the modal.
+    :type event: bpy.types.Event
+    :param phase: Phase of the tool when the event arrived.
+    :type phase: str
+    """
+    if _session is None or _skipped(event):
+        return
+
+    _session["events"].append(
+        {
+            "time": time.perf_counter() - _start,
+            "type": event.type,
+            "value": event.value,
+            "unicode": event.unicode,
+            "x": event.mouse_region_x,
+            "y": event.mouse_region_y,
+            "ctrl": event.ctrl,
+            "shift": event.shift,
+            "alt": event.alt,
+            "oskey": event.oskey,
+            "phase": phase,
+        }
+    )
+
+
+def stop():
+    """Finish the session being recorded and keep it as the last one."""
+    global _session, last
+    if _session is not None:
+        last = _session
+        _session = None
+
+
+def dump(path):
+    """Write the last session to a JSON file.
+
+    :param path: File path to write.
+    :type path: str
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(last, f, indent=2)
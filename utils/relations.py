@@ -0,0 +1,276 @@
+"""Modifier operand registry.
+
+Maps objects to the objects their modifiers reference and back, so cutter
+and target lookups touch only the objects involved instead of scanning
+``bpy.data.objects``. Entries are keyed by ``session_uid``, which survives
+renames; the name each object had when it was indexed is kept to find it
+again, and an object found under another name drops the registry.
+
+Blockout refreshes entries when it adds or removes boolean modifiers.
+Changes made elsewhere are picked up from ``depsgraph_update_post``, which
+refreshes only the targets of an updated object or operand collection;
+loading a file, undo and redo drop the registry so the next lookup rebuilds
+it.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Modifier properties holding an object operand, by modifier type.
+OBJECT_PROPS = {
+    "BOOLEAN": ("object",),
+    "ARRAY": ("start_cap", "end_cap", "offset_object"),
+    "MIRROR": ("mirror_object",),
+    "SHRINKWRAP": ("target",),
+    "CAST": ("object",),
+    "CURVE": ("object",),
+    "HOOK": ("object",),
+    "LATTICE": ("object",),
+    "MESH_DEFORM": ("object",),
+    "SURFACE_DEFORM": ("target",),
+    "ARMATURE": ("object",),
+}
+
+_operands = {}  # target uid -> {operand uid: set of modifier types}
+_users = {}  # operand uid -> set of target uids
+_names = {}  # uid -> object name when indexed
+_collections = {}  # collection uid -> uids of targets using it as an operand
+_valid = False
+
+
+def operands(mod):
+    """Get the objects a modifier references.
+
+    :param mod: The modifier.
+    :type mod: bpy.types.Modifier
+    :return: Referenced objects, including the objects of a boolean
+        collection operand.
+    :rtype: set[bpy.types.Object]
+    """
+    referenced = set()
+
+    if mod.type == "BOOLEAN" and mod.operand_type == "COLLECTION":
+        if mod.collection:
+            referenced.update(mod.collection.all_objects)
+        return referenced
+
+    for prop in OBJECT_PROPS.get(mod.type, ()):
+        obj = getattr(mod, prop, None)
+        if obj:
+            referenced.add(obj)
+
+    return referenced
+
+
+def _discard(index, key, uid):
+    """Remove a target uid from an index entry, dropping the entry if empty."""
+    uids = index.get(key)
+    if uids:
+        uids.discard(uid)
+        if not uids:
+            del index[key]
+
+
+def _forget(uid):
+    """Drop the entries of a target."""
+    for operand in _operands.pop(uid, {}):
+        _discard(_users, operand, uid)
+    for coll in [c for c, uids in _collections.items() if uid in uids]:
+        _discard(_collections, coll, uid)
+
+
+def _index(obj):
+    """Record the operands of an object's modifiers."""
+    uid = obj.session_uid
+    _names[uid] = obj.name
+
+    edges = {}
+    for mod in obj.modifiers:
+        if mod.type == "BOOLEAN" and mod.operand_type == "COLLECTION":
+            # Nested collections feed all_objects too
+            if mod.collection:
+                for coll in (mod.collection, *mod.collection.children_recursive):
+                    _collections.setdefault(coll.session_uid, set()).add(uid)
+        for operand in operands(mod):
+            if operand != obj:
+                _names[operand.session_uid] = operand.name
+                edges.setdefault(operand.session_uid, set()).add(mod.type)
+
+    if edges:
+        _operands[uid] = edges
+        for operand in edges:
+            _users.setdefault(operand, set()).add(uid)
+
+
+def _renamed(obj):
+    """True if an object was indexed under another name."""
+    name = _names.get(obj.session_uid)
+    return name is not None and name != obj.name
+
+
+def invalidate():
+    """Drop the registry; the next lookup rebuilds it."""
+    global _valid
+    _valid = False
+    _operands.clear()
+    _users.clear()
+    _names.clear()
+    _collections.clear()
+
+
+def rebuild():
+    """Rebuild the registry from every object in the file."""
+    global _valid
+    invalidate()
+    for obj in bpy.data.objects:
+        if obj.modifiers:
+            _index(obj)
+        else:
+            _names[obj.session_uid] = obj.name
+    _valid = True
+
+
+def refresh(obj):
+    """Update the entries of a target after its modifiers changed.
+
+    :param obj: The target object.
+    :type obj: bpy.types.Object
+    """
+    if not _valid:
+        return
+    if _renamed(obj):
+        invalidate()
+        return
+
+    _forget(obj.session_uid)
+    _index(obj)
+
+
+def forget(obj):
+    """Drop the entries of a target that is about to be removed.
+
+    :param obj: The target object.
+    :type obj: bpy.types.Object
+    """
+    if _valid:
+        _forget(obj.session_uid)
+        _names.pop(obj.session_uid, None)
+
+
+def _resolve(uids):
+    """Objects for a set of uids; one missing or renamed means a stale registry."""
+    objects = []
+    for uid in uids:
+        obj = bpy.data.objects.get(_names.get(uid, ""))
+        if obj is None or obj.session_uid != uid:
+            invalidate()
+            return None
+        objects.append(obj)
+    return objects
+
+
+def _lookup(obj, collect):
+    """Resolve uids collected from the registry, rebuilding it once if stale.
+
+    An object the registry has not seen under its current name, renamed or
+    created since it was built, rebuilds it first; its entries would
+    otherwise come back empty and read as "no users".
+    """
+    for _attempt in range(2):
+        if _valid and (obj.session_uid not in _names or _renamed(obj)):
+            invalidate()
+        if not _valid:
+            rebuild()
+        objects = _resolve(collect())
+        if objects is not None:
+            return objects
+    return []
+
+
+def cutters(obj):
+    """Get the cutters used by a target's boolean modifiers.
+
+    :param obj: The target object.
+    :type obj: bpy.types.Object
+    :return: Cutter objects.
+    :rtype: list[bpy.types.Object]
+    """
+    return _lookup(
+        obj,
+        lambda: [
+            uid
+            for uid, kinds in _operands.get(obj.session_uid, {}).items()
+            if "BOOLEAN" in kinds
+        ],
+    )
+
+
+def targets(obj, types=frozenset({"BOOLEAN"})):
+    """Get the objects whose modifiers reference an object.
+
+    :param obj: The referenced object, usually a cutter.
+    :type obj: bpy.types.Object
+    :param types: Modifier types to consider, or None for any modifier.
+    :type types: set[str] | None
+    :return: Objects referencing it.
+    :rtype: list[bpy.types.Object]
+    """
+    uid = obj.session_uid
+    return _lookup(
+        obj,
+        lambda: [
+            user
+            for user in _users.get(uid, ())
+            if types is None or _operands[user][uid] & types
+        ],
+    )
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    if not _valid:
+        return
+
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Collection):
+            # Membership of a collection operand may have changed
+            uids = _collections.get(id_data.session_uid)
+            targets = _resolve(list(uids)) if uids else None
+            for target in targets or ():
+                refresh(target)
+            if not _valid:
+                return
+        elif isinstance(id_data, bpy.types.Object):
+            if _renamed(id_data):
+                invalidate()
+                return
+            # Transform-only updates, such as drags, leave modifiers alone
+            if update.is_updated_geometry:
+                refresh(id_data)
+
+
+@persistent
+def _on_reload(*_args):
+    invalidate()
+
+
+_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_reload),
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+)
+
+
+def register():
+    for handlers, handler in _handlers:
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unregister():
+    for handlers, handler in _handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    invalidate()
@@ -4,7 +4,7 @@ Provides functions for interacting with scene objects through ray casting.
 """
 
 import bpy
-from . import ray_cast
+from . import evaluated, overlap, ray_cast
 
 
 def set_active_object(context, mouse_pos):
@@ -0,0 +1,104 @@
+"""Cache of evaluated object meshes as BMesh.
+
+Orientation lookups read the face under the cursor from the evaluated mesh of
+the hit object. Converting a heavy evaluated mesh to BMesh dominates the first
+click, so the result is kept per object until its geometry changes.
+"""
+
+import bmesh
+import bpy
+from bpy.app.handlers import persistent
+
+# Cached objects; the least recently used entry is dropped past this
+SIZE = 8
+
+# Keyed by session UID, which survives renames
+_cache: dict[int, bmesh.types.BMesh] = {}
+
+
+def get(obj, depsgraph):
+    """Get the evaluated mesh of an object as BMesh.
+
+    The BMesh is shared; read it, don't edit or free it.
+
+    :param obj: Mesh object.
+    :type obj: bpy.types.Object
+    :param depsgraph: Depsgraph the object is evaluated in.
+    :type depsgraph: bpy.types.Depsgraph
+    :return: The evaluated mesh, with a face lookup table.
+    :rtype: bmesh.types.BMesh
+    """
+    key = obj.original.session_uid
+    bm = _cache.pop(key, None)
+    if bm is not None and bm.is_valid:
+        _cache[key] = bm
+        return bm
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    obj_eval.to_mesh_clear()
+
+    if len(_cache) >= SIZE:
+        _drop(next(iter(_cache)))
+    _cache[key] = bm
+    return bm
+
+
+def discard(obj):
+    """Drop the cached mesh of an object.
+
+    :param obj: The object.
+    :type obj: bpy.types.Object
+    """
+    _drop(obj.original.session_uid)
+
+
+def _drop(key):
+    bm = _cache.pop(key, None)
+    if bm is not None:
+        bm.free()
+
+
+def clear():
+    """Drop all cached meshes."""
+    for key in list(_cache):
+        _drop(key)
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    if not _cache:
+        return
+
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            discard(update.id)
+
+
+@persistent
+def _on_reload(*_args):
+    clear()
+
+
+_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_reload),
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+)
+
+
+def register():
+    for handlers, handler in _handlers:
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unregister():
+    for handlers, handler in _handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    clear()
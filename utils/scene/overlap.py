@@ -0,0 +1,200 @@
+"""Cutter/target overlap tests used to cull boolean modifiers.
+
+A cutter only changes a target through a DIFFERENCE boolean when the two
+volumes share space. World-space bounding boxes reject far misses cheaply;
+boxes that overlap without proving contact get an exact BVH test.
+"""
+
+from __future__ import annotations
+
+from bpy.types import Depsgraph, Object
+from mathutils import Matrix, Vector
+from mathutils.bvhtree import BVHTree
+
+from .. import lazy
+
+np = lazy.module("numpy")
+
+# Distance below which a target vertex counts as lying on the cutter surface.
+_EPSILON = 1e-5
+
+# Cutter vertices tested for lying inside the target.
+_INSIDE_SAMPLES = 3
+
+# Fixed ray directions of the inside test, skewed off the axes; a ray that
+# grazes an edge or vertex is caught by the other one disagreeing.
+_RAY_DIRECTIONS = (
+    Vector((0.5377, 0.6121, 0.5798)).normalized(),
+    Vector((-0.4143, 0.3017, -0.8588)).normalized(),
+)
+
+# Surface crossings followed along one ray before giving up.
+_RAY_MAX_HITS = 256
+
+
+def _box(coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Axis-aligned box of an (N, 3) coordinate array."""
+    return coords.min(axis=0), coords.max(axis=0)
+
+
+def _transform(coords: np.ndarray, matrix: Matrix) -> np.ndarray:
+    """Apply a 4x4 matrix to an (N, 3) coordinate array."""
+    m = np.array(matrix, dtype=np.float64)
+    return coords @ m[:3, :3].T + m[:3, 3]
+
+
+def _mesh_coords(mesh) -> np.ndarray:
+    """Vertex coordinates of a mesh as an (N, 3) array."""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+def _boxes_overlap(a, b, margin=_EPSILON) -> bool:
+    """True if two (lo, hi) boxes share space, grown by ``margin``."""
+    return bool(np.all(a[0] <= b[1] + margin) and np.all(b[0] <= a[1] + margin))
+
+
+def _box_contains(outer, inner) -> bool:
+    """True if ``inner`` lies entirely within ``outer``."""
+    return bool(np.all(outer[0] <= inner[0]) and np.all(inner[1] <= outer[1]))
+
+
+def _crossings(bvh: BVHTree, origin: Vector, direction: Vector) -> int | None:
+    """Times a ray crosses the surface of ``bvh``, or None past the limit."""
+    for count in range(_RAY_MAX_HITS):
+        location, _normal, _index, _distance = bvh.ray_cast(origin, direction)
+        if location is None:
+            return count
+        origin = location + direction * _EPSILON
+    return None
+
+
+def _inside(bvh: BVHTree, coords: np.ndarray) -> bool:
+    """True unless sample points provably lie outside the surface of ``bvh``.
+
+    Ray parity on a few points, each along two directions. Flipped normals
+    do not matter; an odd count, directions that disagree or a ray past the
+    hit limit all count as inside, so open or nested shells keep the cut.
+    """
+    picks = np.linspace(0, len(coords) - 1, min(_INSIDE_SAMPLES, len(coords)))
+    for co in coords[picks.astype(int)]:
+        origin = Vector(co)
+        for direction in _RAY_DIRECTIONS:
+            count = _crossings(bvh, origin, direction)
+            if count is None or count % 2:
+                return True
+    return False
+
+
+def bounds(obj: Object, depsgraph: Depsgraph) -> tuple[np.ndarray, np.ndarray]:
+    """World-space bounding box of an evaluated object.
+
+    :param obj: The object.
+    :type obj: bpy.types.Object
+    :param depsgraph: Depsgraph used to get the evaluated bounds.
+    :type depsgraph: bpy.types.Depsgraph
+    :return: Tuple of (min, max) corners.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    obj_eval = obj.evaluated_get(depsgraph)
+    corners = np.array([tuple(c) for c in obj_eval.bound_box], dtype=np.float64)
+    return _box(_transform(corners, obj_eval.matrix_world))
+
+
+def touches(
+    cutter: Object, target: Object, depsgraph: Depsgraph, evaluated: bool = True
+) -> bool:
+    """Check if a cutter can change a target through a DIFFERENCE boolean.
+
+    Compares the cutter's mesh against the target's evaluated mesh. The
+    exact test accepts triangle crossings, a cutter enclosed by the target,
+    and target vertices lying on the cutter surface, which is what a target
+    already cut by this cutter looks like.
+
+    :param cutter: The cutter object.
+    :type cutter: bpy.types.Object
+    :param target: The object the boolean modifier would be added to.
+    :type target: bpy.types.Object
+    :param depsgraph: Depsgraph used to get the evaluated target.
+    :type depsgraph: bpy.types.Depsgraph
+    :param evaluated: Use the evaluated cutter; pass False for a cutter whose
+        mesh was just written and is not evaluated yet.
+    :type evaluated: bool
+    :return: False only when the cutter provably misses the target.
+    :rtype: bool
+    """
+    mesh = cutter.evaluated_get(depsgraph).data if evaluated else cutter.data
+    if not mesh.vertices or not mesh.polygons:
+        return False
+
+    # Cheap reject on world-space boxes before touching the target's verts.
+    cutter_world = _transform(_mesh_coords(mesh), cutter.matrix_world)
+    if not _boxes_overlap(_box(cutter_world), bounds(target, depsgraph)):
+        return False
+
+    target_eval = target.evaluated_get(depsgraph)
+    target_mesh = target_eval.data
+    if not target_mesh.vertices:
+        # Nothing left to compare against; the cutter may have consumed it.
+        return True
+
+    # Work in the target's local space; only the small cutter is transformed.
+    cutter_coords = _transform(cutter_world, target_eval.matrix_world.inverted_safe())
+    cutter_box = _box(cutter_coords)
+    target_coords = _mesh_coords(target_mesh)
+    target_box = _box(target_coords)
+
+    if not _boxes_overlap(cutter_box, target_box):
+        return False
+    if _box_contains(cutter_box, target_box):
+        return True
+
+    cutter_bvh = BVHTree.FromPolygons(
+        [Vector(co) for co in cutter_coords],
+        [tuple(p.vertices) for p in mesh.polygons],
+    )
+    target_bvh = BVHTree.FromObject(target, depsgraph)
+
+    if target_bvh.overlap(cutter_bvh):
+        return True
+
+    # Cutter enclosed by the target; with no crossings, its verts lie inside.
+    if _inside(target_bvh, cutter_coords):
+        return True
+
+    # Already-cut targets keep vertices on the cutter surface.
+    lo, hi = cutter_box[0] - _EPSILON, cutter_box[1] + _EPSILON
+    near = target_coords[np.all((target_coords >= lo) & (target_coords <= hi), axis=1)]
+    for co in near:
+        location, _normal, _index, distance = cutter_bvh.find_nearest(Vector(co))
+        if location is not None and distance <= _EPSILON:
+            return True
+
+    return False
+
+
+def cull(
+    cutter: Object, targets: list[Object], depsgraph: Depsgraph, evaluated: bool = True
+) -> tuple[list[Object], list[Object]]:
+    """Split targets into those a cutter can change and those it misses.
+
+    :param cutter: The cutter object.
+    :type cutter: bpy.types.Object
+    :param targets: Candidate target objects.
+    :type targets: list[bpy.types.Object]
+    :param depsgraph: Depsgraph used to get the evaluated targets.
+    :type depsgraph: bpy.types.Depsgraph
+    :param evaluated: Use the evaluated cutter, see :func:`touches`.
+    :type evaluated: bool
+    :return: Tuple of (kept, skipped) targets, in input order.
+    :rtype: tuple[list[bpy.types.Object], list[bpy.types.Object]]
+    """
+    kept: list[Object] = []
+    skipped: list[Object] = []
+    for target in targets:
+        if touches(cutter, target, depsgraph, evaluated):
+            kept.append(target)
+        else:
+            skipped.append(target)
+    return kept, skipped
@@ -10,6 +10,7 @@ import bpy
 from bpy.types import Context, Object, Region, RegionView3D, SpaceView3D
 from mathutils import Matrix, Vector
 
+from .. import timing
 from ..view3d import region_2d_to_origin_3d, region_2d_to_vector_3d
 
 
@@ -33,6 +34,7 @@ def _prepare_ray_cast(
     return origin, direction
 
 
+@timing.timed("ray_cast")
 def _ray_cast(
     context: Context, origin: Vector, direction: Vector, objects: set[Object]
 ) -> "Ray":
@@ -0,0 +1,125 @@
+"""Opt-in timing of the Block tool's hot paths.
+
+Stages are timed with :func:`timed` or :func:`span` and kept in a fixed-size
+ring buffer per stage. While disabled, both cost one flag check per call.
+Enable from the add-on preferences (Debug > Timing); the Block tool picks the
+setting up when it starts.
+"""
+
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+# Samples kept per stage.
+SIZE = 120
+
+enabled = False
+
+_stages: dict[str, deque] = {}
+_idle = nullcontext()
+
+
+def record(name, seconds):
+    """Add a sample to a stage's ring buffer.
+
+    :param name: Stage name.
+    :type name: str
+    :param seconds: Measured duration in seconds.
+    :type seconds: float
+    """
+    samples = _stages.get(name)
+    if samples is None:
+        samples = _stages[name] = deque(maxlen=SIZE)
+    samples.append(seconds)
+
+
+class _Span:
+    """Context manager recording the time spent inside it."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_exc):
+        record(self.name, time.perf_counter() - self.start)
+
+
+def span(name):
+    """Time a block of code.
+
+    :param name: Stage name.
+    :type name: str
+    :return: A context manager; a shared no-op one while disabled.
+    :rtype: contextlib.AbstractContextManager
+    """
+    return _Span(name) if enabled else _idle
+
+
+def timed(name):
+    """Decorator timing every call of a function as a stage.
+
+    :param name: Stage name.
+    :type name: str
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def summary():
+    """Statistics of every stage, in milliseconds.
+
+    :return: Mapping of stage name to last, mean and max time and the sample
+        count, ordered by mean time, slowest first.
+    :rtype: dict[str, dict[str, float]]
+    """
+    stats = {
+        name: {
+            "last": samples[-1] * 1000.0,
+            "mean": sum(samples) / len(samples) * 1000.0,
+            "max": max(samples) * 1000.0,
+            "count": len(samples),
+        }
+        for name, samples in _stages.items()
+        if samples
+    }
+    return dict(sorted(stats.items(), key=lambda item: -item[1]["mean"]))
+
+
+def dump(path):
+    """Write the stage statistics and raw samples to a JSON file.
+
+    :param path: File path to write.
+    :type path: str
+    """
+    data = {
+        "summary": summary(),
+        "samples": {
+            name: [s * 1000.0 for s in samples] for name, samples in _stages.items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def reset():
+    """Drop all recorded samples."""
+    _stages.clear()
@@ -13,6 +13,10 @@ from bpy_extras.view3d_utils import (
 )
 from mathutils import geometry
 
+from . import lazy
+
+np = lazy.module("numpy")
+
 
 def region_2d_to_plane_3d(region, re3d, point, plane, matrix=None):
     """
@@ -142,8 +146,63 @@ def region_2d_to_line_3d(region, rv3d, point, line_origin, line_direction, matri
         return None, None
 
 
+def locations_3d_to_region_2d(region, rv3d, coords, matrix=None):
+    """Project many 3D points to 2D region coordinates at once.
+
+    The vectorized counterpart of :func:`location_3d_to_region_2d`: one
+    multiply by the view's perspective matrix for all points. Points behind
+    the view have no region location; they are flagged in the mask and
+    their coordinates are meaningless.
+
+    :param region: The region of the area.
+    :type region: bpy.types.Region
+    :param rv3d: The 3D region view.
+    :type rv3d: bpy.types.RegionView3D
+    :param coords: The points, in world space or in the space of ``matrix``.
+    :type coords: numpy.ndarray
+    :param matrix: Optional matrix taking the points to world space.
+    :type matrix: mathutils.Matrix | None
+    :return: Tuple of (N, 2) region coordinates and an (N,) visibility mask.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    persp = np.array(rv3d.perspective_matrix, dtype=np.float64)
+    if matrix is not None:
+        persp = persp @ np.array(matrix, dtype=np.float64)
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    clip = coords @ persp[:, :3].T + persp[:, 3]
+    w = clip[:, 3]
+    visible = w > 0.0
+
+    half = np.array((region.width / 2.0, region.height / 2.0))
+    ndc = clip[:, :2] / np.where(visible, w, 1.0)[:, None]
+    return half + half * ndc, visible
+
+
+def nearest_region_2d(coords, visible, point):
+    """Find the visible region point closest to a 2D point.
+
+    :param coords: (N, 2) region coordinates.
+    :type coords: numpy.ndarray
+    :param visible: (N,) mask of the points that have a region location.
+    :type visible: numpy.ndarray
+    :param point: The 2D point to measure from.
+    :type point: tuple[float, float]
+    :return: Tuple of (index, distance), or (None, inf) if none is visible.
+    :rtype: tuple[int | None, float]
+    """
+    if not visible.any():
+        return None, float("inf")
+    distances = np.hypot(coords[:, 0] - point[0], coords[:, 1] - point[1])
+    distances[~visible] = np.inf
+    index = int(np.argmin(distances))
+    return index, float(distances[index])
+
+
 __all__ = [
     "location_3d_to_region_2d",
+    "locations_3d_to_region_2d",
+    "nearest_region_2d",
     "region_2d_to_location_3d",
     "region_2d_to_origin_3d",
     "region_2d_to_vector_3d",
@@ -2,12 +2,11 @@ import bmesh
 
 
 def bevel(bm, box_faces, bevel_offset=0.0, bevel_segments=5):
-    extrude_faces = [bm.faces[index] for index in box_faces]
-    bmesh.ops.recalc_face_normals(bm, faces=extrude_faces)
+    bmesh.ops.recalc_face_normals(bm, faces=box_faces)
 
     if bevel_offset != 0.0:
-        box_edges = [e for f in extrude_faces for e in f.edges]
-        face = bm.faces[box_faces[0]]
+        box_edges = [e for f in box_faces for e in f.edges]
+        face = box_faces[0]
         bevel_edges = set(box_edges) - set(face.edges)
         edges = list(bevel_edges)
 
@@ -28,10 +27,3 @@ def bevel(bm, box_faces, bevel_offset=0.0, bevel_segments=5):
         for f in result["faces"]:
             f.select = True
         bm.select_flush(True)
-
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
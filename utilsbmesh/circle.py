@@ -1,7 +1,28 @@
+from functools import lru_cache
 from mathutils import Matrix, Vector
 import math
+
 import bmesh
 
+from ..utils import lazy
+from .mesh import place, refit
+
+np = lazy.module("numpy")
+
+
+@lru_cache(maxsize=16)
+def template(segments):
+    """
+    Unit circle in the XY plane, counter-clockwise from the X axis
+
+    :param segments: Number of vertices in the circle
+    :return: Read-only (segments, 3) numpy.ndarray of coordinates
+    """
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    coords = np.column_stack((np.cos(angles), np.sin(angles), np.zeros(segments)))
+    coords.setflags(write=False)
+    return coords
+
 
 def create(bm, plane, verts_number, direction=None):
     """
@@ -11,6 +32,7 @@ def create(bm, plane, verts_number, direction=None):
     :param plane: A tuple (location, normal) defining the orientation and center
     :param verts_number: Number of vertices in the circle
     :param direction: Optional direction vector to define orientation. If None, one will be generated
+    :return: The circle face, in a list
     """
     location, normal = plane
     normal = normal.normalized()
@@ -33,28 +55,38 @@ def create(bm, plane, verts_number, direction=None):
     matrix = rotation_matrix.to_4x4()
     matrix.translation = location
 
-    # Create circle with a small initial diameter
-    result = bmesh.ops.create_circle(
-        bm,
-        cap_ends=True,
-        radius=0.0,  # Small initial diameter
-        segments=verts_number,
-        matrix=matrix,
-    )
-
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
-    vert = result["verts"][0]
-    face = vert.link_faces[0]
+    # Create the circle collapsed to its center, in template order
+    verts = [bm.verts.new() for _ in range(verts_number)]
+    place(verts, template(verts_number), matrix, scale=0.0)
+    face = bm.faces.new(verts)
     face.normal_update()
     face.select_set(True)
     bm.select_flush(True)
 
-    return [face.index]
+    return [face]
+
+
+def resample(bm, face, verts_number):
+    """
+    Replace a circle face with one of a different vertex count, in place
+
+    The face's vertices must still be in the order create made them; any
+    affine transform applied to them since is kept.
+
+    :param bm: The bmesh object to modify
+    :param face: The circle face to replace
+    :param verts_number: Number of vertices in the new circle
+    :return: The new circle face
+    """
+    old_verts = list(face.verts)
+    coords = refit(old_verts, template(len(old_verts)), template(verts_number))
+    verts = [bm.verts.new(co) for co in coords]
+    new_face = bm.faces.new(verts, face)
+    new_face.select_set(face.select)
+    bmesh.ops.delete(bm, geom=old_verts, context="VERTS")
+    new_face.normal_update()
+
+    return new_face
 
 
 def set_xy(face, plane, loc, direction, radius=None, local_space=False, snap_value=0):
@@ -106,15 +138,7 @@ def set_xy(face, plane, loc, direction, radius=None, local_space=False, snap_val
 
     # Update the positions of the face's vertices
     verts = face.verts
-    num_verts = len(verts)
-    angle_step = (2 * math.pi) / num_verts
-
-    for i, v in enumerate(verts):
-        angle = i * angle_step
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        v_local = Vector((x, y, 0))
-        v.co = matrix @ v_local
+    place(verts, template(len(verts)), matrix, scale=radius)
 
     # Transform point_local to object local space
     point_3d = matrix @ point_local
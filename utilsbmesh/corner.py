@@ -1,6 +1,5 @@
 import bmesh
 from mathutils import Matrix, Vector
-from . import bmeshface
 
 
 def normals(direction, base_normal, rotations):
@@ -15,26 +14,26 @@ def normals(direction, base_normal, rotations):
 
 
 def vert_dirs(faces, n1, n2, avg, cos_half):
-    """Per-vert displacement direction keyed by vert index: face1-unique
+    """Per-vert displacement direction keyed by vert: face1-unique
     -> ``n1``, face2-unique -> ``n2``, shared mid-edge -> ``avg /
     cos(half_angle)`` so the result stays at uniform perpendicular
     distance from each face. Falls back to ``avg`` when the corner is
     degenerate (~180°)."""
-    s1 = {v.index for v in faces[0].verts}
-    s2 = {v.index for v in faces[1].verts} if len(faces) >= 2 else set()
+    s1 = set(faces[0].verts)
+    s2 = set(faces[1].verts) if len(faces) >= 2 else set()
     shared = s1 & s2
     shared_dir = avg / cos_half if cos_half > 1e-6 else avg
     face_n = (n1, n2)
-    dirs = {vi: shared_dir for vi in shared}
+    dirs = {v: shared_dir for v in shared}
     for fi, face in enumerate(faces[:2]):
         for v in face.verts:
-            if v.index not in dirs:
-                dirs[v.index] = face_n[fi]
+            if v not in dirs:
+                dirs[v] = face_n[fi]
     return dirs
 
 
 def create(bm, plane):
-    """Create a corner shape with two connected faces"""
+    """Create a corner shape with two connected faces; returns both"""
     location, normal = plane
 
     # Create 6 vertices at the initial location
@@ -45,9 +44,6 @@ def create(bm, plane):
     v5 = bm.verts.new(location)
     v6 = bm.verts.new(location)
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-
     # Create two connected faces
     face1 = bm.faces.new((v1, v2, v3, v4))
     face2 = bm.faces.new((v6, v5, v4, v3))
@@ -57,10 +53,7 @@ def create(bm, plane):
     face2.select_set(True)
     bm.select_flush(True)
 
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
-    return [face1.index, face2.index]
+    return [face1, face2]
 
 
 def set_xy(faces, plane, loc, direction, rotations, local_space=False, snap_value=0):
@@ -192,109 +185,64 @@ def extrude(bm, faces, direction, base_normal, rotations, dz):
         rotations: Tuple of (min_rotation, max_rotation) in radians
         dz: Distance to extrude along the normals
     Returns:
-        Tuple of (ordered_faces, mid_edge): List of face indices in the order [old_faces, mid_faces, new_faces] and mid edge index
+        Tuple of (ordered_faces, mid_edge): List of faces in the order [old_faces, mid_faces, new_faces] and the mid edge
     """
-    # Initialize variables. Hold *references* to created faces — their
-    # ``.index`` is invalid until ``bm.faces.index_update()`` is called at
-    # the end, so we resolve to indices then.
-    old_face_refs = []
-    mid_face_refs = []
-    new_face_refs = []
+    mid_faces = []
+    new_faces = []
     mid_edge = None
 
     n1, n2, avg, cos_half = normals(direction, base_normal, rotations)
 
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-
     for face in faces:
         face.normal_flip()
 
-    old_face_refs = list(faces)
+    old_faces = list(faces)
     vert_dir = vert_dirs(faces, n1, n2, avg, cos_half)
 
-    # Store old vertices and create new vertices (copied and offset)
-    new_verts_map = {}  # Maps old vertex index to new vertex
-    edge_map = {}  # Maps (v1_idx, v2_idx) pairs to new edge
+    # Keyed by element: the new verts have no index until the caller reindexes
+    new_verts_map = {}  # Maps old vertex to new vertex
+    edge_map = set()  # Old edges that already have a side face
 
     # Create new vertices, each displaced along its own assigned normal
     for face in faces:
         for v in face.verts:
-            if v.index not in new_verts_map:
-                new_vert = bm.verts.new(v.co + vert_dir[v.index] * dz)
-                new_verts_map[v.index] = new_vert
-
-    # Update tables after creating new vertices
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
+            if v not in new_verts_map:
+                new_verts_map[v] = bm.verts.new(v.co + vert_dir[v] * dz)
 
     # Find the shared edge between the two faces (if there are at least two faces)
     shared_edges = set()
     if len(faces) >= 2:
-        # Get all edges from the first face
-        face1_edges = set(faces[0].edges)
-        # Find edges that are also in the second face
-        for edge in faces[1].edges:
-            if edge in face1_edges:
-                shared_edges.add(edge)
+        shared_edges = set(faces[0].edges) & set(faces[1].edges)
 
     # Create side faces (mid faces) connecting old and new vertices, but skip shared edges
     for face in faces:
-        # For each edge in the face
         for edge in face.edges:
             # Skip the edge if it's a shared edge (the middle edge)
-            if edge in shared_edges:
+            if edge in shared_edges or edge in edge_map:
                 continue
 
             v1, v2 = edge.verts
-            new_v1 = new_verts_map[v1.index]
-            new_v2 = new_verts_map[v2.index]
-
-            # Create a face connecting old and new vertices
             # Order is important for correct normal
-            edge_key = tuple(sorted([v1.index, v2.index]))
-            if edge_key not in edge_map:
-                new_face = bm.faces.new([v1, v2, new_v2, new_v1])
-                new_face.select = True
-                mid_face_refs.append(new_face)
-                edge_map[edge_key] = True
+            new_face = bm.faces.new([v1, v2, new_verts_map[v2], new_verts_map[v1]])
+            new_face.select = True
+            mid_faces.append(new_face)
+            edge_map.add(edge)
 
     # Create top faces (equivalent to the extruded faces)
     for face in faces:
-        # Get vertices in the correct order
-        old_verts = [v for v in face.verts]
-        # Create new face with new vertices in the same order
-        new_verts = [new_verts_map[v.index] for v in old_verts]
+        new_verts = [new_verts_map[v] for v in face.verts]
         # Reverse order for correct normal direction
         new_verts.reverse()
 
         new_face = bm.faces.new(new_verts)
         new_face.select = True
-        new_face_refs.append(new_face)
+        new_faces.append(new_face)
 
-    # Update all indices and ensure lookup tables
     bm.normal_update()
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.index_update()
-    bm.faces.index_update()
-
-    # Resolve face indices NOW — newly-created BMFaces have ``.index = -1``
-    # until ``index_update`` runs above. Capturing earlier would slot every
-    # mid/new face in as -1, collapsing downstream lookups onto a single
-    # face.
-    old_faces = [f.index for f in old_face_refs]
-    mid_faces = [f.index for f in mid_face_refs]
-    new_faces = [f.index for f in new_face_refs]
 
     # Find the mid edge (edge shared by both original faces)
-    for e in faces[0].edges:
-        if e in faces[1].edges:
-            mid_edge = e.index
-            break
+    if shared_edges:
+        mid_edge = next(e for e in faces[0].edges if e in shared_edges)
 
     # Combine all faces in the order: old_faces + mid_faces + new_faces
     ordered_faces = old_faces + mid_faces + new_faces
@@ -302,14 +250,14 @@ def extrude(bm, faces, direction, base_normal, rotations, dz):
     return ordered_faces, mid_edge
 
 
-def offset(bm, faces_indexes, direction, base_normal, rotations, dz):
+def offset(bm, faces, direction, base_normal, rotations, dz):
     """
     Offset each face along its corresponding normal by dz, with shared
     mid-edge verts displaced along ``avg / cos(half_angle)`` so the
     offset stays at uniform perpendicular distance from each face.
     Args:
         bm: The BMesh object
-        faces_indexes: List of face indices to offset
+        faces: List of faces to offset; only the first two are used
         direction: Direction vector for the rotation axis
         base_normal: Base normal vector (0 degrees rotation)
         rotations: Tuple of (min_rotation, max_rotation) in radians
@@ -318,20 +266,14 @@ def offset(bm, faces_indexes, direction, base_normal, rotations, dz):
         None
     """
     n1, n2, avg, cos_half = normals(direction, base_normal, rotations)
-    faces = [bmeshface.from_index(bm, index) for index in faces_indexes[:2]]
-    vert_dir = vert_dirs(faces, n1, n2, avg, cos_half)
+    vert_dir = vert_dirs(faces[:2], n1, n2, avg, cos_half)
 
-    moved = set()
-    for face in faces:
-        for v in face.verts:
-            if v.index in moved:
-                continue
-            moved.add(v.index)
-            v.co += vert_dir[v.index] * dz
+    for v, vert_direction in vert_dir.items():
+        v.co += vert_direction * dz
 
 
 def bevel(bm, edge, bevel_offset=0.0, bevel_segments=1):
-    """Bevel the edges"""
+    """Bevel the edge; returns the new vertices"""
 
     if bevel_offset != 0.0:
         result = bmesh.ops.bevel(
@@ -369,13 +311,6 @@ def bevel(bm, edge, bevel_offset=0.0, bevel_segments=1):
             f.select = True
         bm.select_flush(True)
 
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
-
-        return [v.index for v in result["verts"]]
+        return result["verts"]
 
     return []
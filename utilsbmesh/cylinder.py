@@ -2,11 +2,10 @@ import bmesh
 
 
 def bevel(bm, cylinder_faces, bevel_offset=0.0, bevel_segments=5):
-    extrude_faces = [bm.faces[index] for index in cylinder_faces]
-    bmesh.ops.recalc_face_normals(bm, faces=extrude_faces)
+    bmesh.ops.recalc_face_normals(bm, faces=cylinder_faces)
 
     if bevel_offset != 0.0:
-        face = bm.faces[cylinder_faces[-1]]
+        face = cylinder_faces[-1]
         bevel_edges = set(face.edges)
         edges = list(bevel_edges)
 
@@ -27,10 +26,3 @@ def bevel(bm, cylinder_faces, bevel_offset=0.0, bevel_segments=5):
         for f in result["faces"]:
             f.select = True
         bm.select_flush(True)
-
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
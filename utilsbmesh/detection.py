@@ -1,13 +1,15 @@
 from dataclasses import dataclass
-import numpy as np
 from mathutils import Vector
 from mathutils.bvhtree import BVHTree
 from bpy_extras.view3d_utils import (
     region_2d_to_origin_3d,
     region_2d_to_vector_3d,
-    location_3d_to_region_2d,
 )
 
+from ..utils import lazy, view3d
+
+np = lazy.module("numpy")
+
 
 @dataclass
 class _Vert:
@@ -110,14 +112,11 @@ class Closest:
     def _detect_closest_vertex(self, context, point, face):
         """Detect the closest vertex on the given face."""
         verts = [v for v in face.verts]
-        verts_2d, valid_indices = self._verts_to_2darray(context, verts)
-        closest_vert, closest_vert_2d = self._get_closest_vert(
-            point, verts, verts_2d, valid_indices
-        )
+        verts_2d, visible = self._verts_to_2darray(context, verts)
+        index, dist = view3d.nearest_region_2d(verts_2d, visible, point)
 
-        if closest_vert and self._is_within_radius(
-            point, closest_vert_2d, self.radius.vert
-        ):
+        if index is not None and dist <= self.radius.vert:
+            closest_vert = verts[index]
             return _Vert(
                 index=closest_vert.index, co=closest_vert.co, radius=self.radius.vert
             )
@@ -129,75 +128,41 @@ class Closest:
         region = context.region
         rv3d = context.region_data
         matrix = context.edit_object.matrix_world
-        closest_edge = None
-        min_dist = float("inf")
-        hit_loc_2d = location_3d_to_region_2d(region, rv3d, matrix @ hit_loc)
-        if hit_loc_2d is None:
-            return None
-
-        for edge in face.edges:
-            p1 = edge.verts[0].co
-            p2 = edge.verts[1].co
+        edges = list(face.edges)
 
-            closest_point = self._closest_point_on_edge(p1, p2, hit_loc)
-            closest_point_2d = location_3d_to_region_2d(
-                region, rv3d, matrix @ closest_point
-            )
-
-            if closest_point_2d is not None and self._is_within_radius(
-                hit_loc_2d, closest_point_2d, self.radius.edge
-            ):
-                dist = np.linalg.norm(np.array(hit_loc_2d) - np.array(closest_point_2d))
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_edge = edge
-
-        if closest_edge:
-            return _Edge(
-                index=closest_edge.index,
-                length=closest_edge.calc_length(),
-                radius=self.radius.edge,
-            )
-        else:
-            return None
-
-    def _get_closest_vert(self, mouse_pos, verts, verts_2d, valid_indices):
-        """Get the closest vertex to the mouse cursor."""
-        co = np.array(mouse_pos, dtype=np.float32)
-        distances = np.linalg.norm(verts_2d - co, axis=1)
-        closest_index = np.argmin(distances)
-        closest_vert = verts[valid_indices[closest_index]]
-        closest_vert_2d = verts_2d[closest_index]
-        return closest_vert, closest_vert_2d
-
-    def _closest_point_on_edge(self, p1, p2, point):
-        """Get the closest point on the edge to the given point."""
+        # Closest point on each edge to the hit, all edges at once
+        p1 = np.array([e.verts[0].co for e in edges], dtype=np.float64)
+        p2 = np.array([e.verts[1].co for e in edges], dtype=np.float64)
+        hit = np.array(hit_loc, dtype=np.float64)
         edge_vec = p2 - p1
-        edge_len = edge_vec.length
+        length_sq = np.einsum("ij,ij->i", edge_vec, edge_vec)
+        t = np.einsum("ij,ij->i", hit - p1, edge_vec)
+        t = np.clip(t / np.where(length_sq > 0.0, length_sq, 1.0), 0.0, 1.0)
+        closest = p1 + edge_vec * t[:, None]
 
-        # Safeguard: If the edge length is zero, return the first point (p1)
-        if edge_len == 0:
-            return p1
+        coords, visible = view3d.locations_3d_to_region_2d(
+            region, rv3d, np.vstack((hit, closest)), matrix=matrix
+        )
+        if not visible[0]:
+            return None
 
-        edge_unit = edge_vec / edge_len
-        point_vec = point - p1
-        projection = point_vec.dot(edge_unit)
-        projection = min(max(projection, 0), edge_len)
-        closest_point = p1 + edge_unit * projection
-        return closest_point
+        index, dist = view3d.nearest_region_2d(coords[1:], visible[1:], coords[0])
+        if index is None or dist > self.radius.edge:
+            return None
 
-    def _is_within_radius(self, mouse_pos, point_2d, radius):
-        """Check if the point is within the radius of the mouse cursor."""
-        if point_2d is None:
-            return False
-        return np.linalg.norm(np.array(mouse_pos) - np.array(point_2d)) <= radius
+        closest_edge = edges[index]
+        return _Edge(
+            index=closest_edge.index,
+            length=closest_edge.calc_length(),
+            radius=self.radius.edge,
+        )
 
     def _verts_to_2darray(self, context, verts):
-        """Convert the vertices to the region coordinates."""
-        region = context.region
-        rv3d = context.region_data
-        matrix = context.edit_object.matrix_world
-        coords = [location_3d_to_region_2d(region, rv3d, matrix @ v.co) for v in verts]
-        valid_coords = [c for c in coords if c is not None]
-        valid_indices = np.array([i for i, c in enumerate(coords) if c is not None])
-        return np.array(valid_coords, dtype=np.float32), valid_indices
+        """Convert the vertices to the region coordinates and a visibility mask."""
+        coords = np.array([v.co for v in verts], dtype=np.float64)
+        return view3d.locations_3d_to_region_2d(
+            context.region,
+            context.region_data,
+            coords,
+            matrix=context.edit_object.matrix_world,
+        )
@@ -4,8 +4,8 @@ import bmesh
 def extrude(bm, face, plane, dz):
     """
     Extrude the face along the given direction by dz units using bmesh.ops.extrude_face_region.
-    Returns the indices of the faces in the following order:
-    [index of the starting face (after extrusion), indices of side faces, index of the top face]
+    Returns the faces in the following order:
+    [starting face (after extrusion), side faces, top face]
     """
 
     # Get the normal from the plane and normalize it
@@ -25,14 +25,6 @@ def extrude(bm, face, plane, dz):
     # Recalculate normals
     bm.normal_update()
 
-    # Update indices and lookup tables
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.index_update()
-    bm.faces.index_update()
-
     # Identify the top face (the new face created at the extrusion end)
     new_faces = [elem for elem in new_geom if isinstance(elem, bmesh.types.BMFace)]
     if not new_faces:
@@ -68,12 +60,7 @@ def extrude(bm, face, plane, dz):
     if bot_face is None:
         raise ValueError("Bottom face not found after extrusion.")
 
-    # Collect the indices in the desired order
-    new_face_indices = (
-        [bot_face.index] + [f.index for f in side_faces] + [top_face.index]
-    )
-
-    return new_face_indices
+    return [bot_face] + side_faces + [top_face]
 
 
 def set_z(face, normal, dz, verts=None, snap_value=0):
@@ -100,7 +87,7 @@ def set_z(face, normal, dz, verts=None, snap_value=0):
 
 
 def bevel_verts(bm, face, bevel_offset=0.0, bevel_segments=1):
-    """Bevel the face region"""
+    """Bevel the face region; returns the resulting face"""
 
     if bevel_offset != 0.0:
         rectangle_verts = [v for v in face.verts]
@@ -127,18 +114,11 @@ def bevel_verts(bm, face, bevel_offset=0.0, bevel_segments=1):
         if result["verts"]:
             face = result["verts"][0].link_faces[0]
 
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
-
-    return face.index
+    return face
 
 
 def bevel_edges(bm, edges, bevel_offset=0.0, bevel_segments=1):
-    """Bevel the edges"""
+    """Bevel the edges; returns the new vertices"""
 
     if bevel_offset != 0.0:
         result = bmesh.ops.bevel(
@@ -160,14 +140,7 @@ def bevel_edges(bm, edges, bevel_offset=0.0, bevel_segments=1):
             f.select = True
         bm.select_flush(True)
 
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
-
-        return [v.index for v in result["verts"]]
+        return result["verts"]
 
     return []
 
@@ -184,13 +157,6 @@ def remove_doubles(bm, face):
 
     face.select_set(True)
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
 
 def solidify(bm, faces):
     """Solidufy the selected faces"""
@@ -231,10 +197,3 @@ def solidify(bm, faces):
                     face.select = True
 
         bm.normal_update()
-
-        bm.verts.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.ensure_lookup_table()
-        bm.edges.index_update()
-        bm.faces.ensure_lookup_table()
-        bm.faces.index_update()
@@ -1,5 +1,9 @@
 import bmesh
 
+from ..utils import lazy, timing
+
+np = lazy.module("numpy")
+
 
 def set_copy(obj, all_copies):
     """
@@ -15,6 +19,7 @@ def set_copy(obj, all_copies):
     return copy
 
 
+@timing.timed("get_copy")
 def get_copy(obj, bm, mesh_data=None):
     """
     Get the 'copy' of existing BMesh.
@@ -32,12 +37,7 @@ def get_copy(obj, bm, mesh_data=None):
     bm.from_mesh(mesh_data)
     bmesh.update_edit_mesh(mesh, loop_triangles=True, destructive=True)
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
+    reindex(bm)
 
 
 def merge_copy(obj, bm, mesh_data=None):
@@ -61,28 +61,84 @@ def merge_copy(obj, bm, mesh_data=None):
         shape_key_index=0,
     )
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
+    reindex(bm)
 
 
-def remove_doubles(bm, verts_indicies):
+def remove_doubles(bm, verts):
     """
-    Remove doubles from the BMesh 'bm' using the indices of the vertices to check.
+    Remove doubles from the BMesh 'bm' among the given vertices.
 
     :param bm: A bmesh.BMesh.
-    :param verts_indicies: A list of vertex indices to check for doubles.
+    :param verts: A list of bmesh.types.BMVert to check for doubles.
     """
 
-    verts = [bm.verts[i] for i in verts_indicies]
     bmesh.ops.remove_doubles(bm, verts=verts, dist=0.0001)
     bm.select_flush(True)
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
+
+
+def reindex(bm):
+    """
+    Refresh the lookup tables and element indices of 'bm'.
+
+    The shape builders hand back the elements they create and leave both
+    stale, since in edit mode the cutter shares the target's BMesh and each
+    refresh walks all of it. Call this once per topology change, before
+    reading ``.index`` or indexing ``bm.verts``, ``bm.edges`` or ``bm.faces``.
+
+    :param bm: A bmesh.BMesh.
+    """
+    for seq in (bm.verts, bm.edges, bm.faces):
+        seq.ensure_lookup_table()
+        seq.index_update()
+
+
+def indexes(bm, elems):
+    """
+    Reindex 'bm' and return the indices of the given elements.
+
+    :param bm: A bmesh.BMesh.
+    :param elems: BMesh elements of 'bm'.
+    :return: The index of each element, in order.
+    :rtype: list[int]
+    """
+    reindex(bm)
+    return [elem.index for elem in elems]
+
+
+def place(verts, template, matrix, scale=1.0):
+    """
+    Move 'verts' onto a unit-space template scaled and placed by 'matrix'.
+
+    The template is transformed in one matrix multiply; the only per-vertex
+    work left is the coordinate write, which BMesh has no bulk setter for.
+
+    :param verts: The bmesh.types.BMVert to move, in template order.
+    :param template: Unit-space coordinates, an (n, 3) numpy.ndarray.
+    :param matrix: A 4x4 mathutils.Matrix placing the template.
+    :param scale: Uniform scale applied before 'matrix'.
+    """
+    m = np.array(matrix, dtype=np.float64)
+    coords = template @ (m[:3, :3] * scale).T + m[:3, 3]
+    for v, co in zip(verts, coords.tolist()):
+        v.co = co
+
+
+def refit(verts, source, target):
+    """
+    Carry the placement of 'verts' over to another unit-space template.
+
+    'verts' are the 'source' template under some affine transform: the
+    placement, offsets and live transforms applied since they were created.
+    The transform is recovered by least squares and applied to 'target'.
+
+    :param verts: The bmesh.types.BMVert built from 'source', in its order.
+    :param source: Unit-space coordinates, an (n, 3) numpy.ndarray.
+    :param target: Unit-space coordinates, an (m, 3) numpy.ndarray.
+    :return: The placed 'target' coordinates.
+    :rtype: list[list[float]]
+    """
+    coords = np.array([v.co for v in verts], dtype=np.float64)
+    src = np.column_stack((source, np.ones(len(source))))
+    transform, *_ = np.linalg.lstsq(src, coords, rcond=None)
+    dst = np.column_stack((target, np.ones(len(target))))
+    return (dst @ transform).tolist()
@@ -1,7 +1,11 @@
 import bmesh
+from ..utils import lazy
 from ..utils.types import DrawVert
+from .mesh import reindex
 from mathutils import Matrix, Vector
 
+np = lazy.module("numpy")
+
 
 def create(bm, plane):
     """Create a ngon face"""
@@ -182,6 +186,29 @@ def new(bm, verts_list):
     return face
 
 
+def trace(bm, face_index, points):
+    """Replace an ngon face with a face through the given points.
+
+    The old face and its verts are removed; the bmesh is reindexed once.
+
+    :return: The index of the new face.
+    """
+
+    face = bm.faces[face_index]
+    old_verts = list(face.verts)
+    bm.faces.remove(face)
+    for v in old_verts:
+        if not v.link_faces:
+            bm.verts.remove(v)
+
+    face = bm.faces.new([bm.verts.new(co) for co in points])
+    face.select_set(True)
+    bm.select_flush(True)
+
+    reindex(bm)
+    return face.index
+
+
 def fix_winding_order(bm, face_index, plane_normal):
     """Fix the winding order of a face to match the plane normal"""
 
@@ -192,11 +219,10 @@ def fix_winding_order(bm, face_index, plane_normal):
     if len(face_verts) < 3:
         return face_index
 
-    # Calculate current face normal based on first 3 vertices
-    v0, v1, v2 = face_verts[0].co, face_verts[1].co, face_verts[2].co
-    edge1 = v1 - v0
-    edge2 = v2 - v0
-    current_normal = edge1.cross(edge2).normalized()
+    # Calculate current face normal from all vertices; the first three alone
+    # give the wrong side when they sit on a concave corner
+    face.normal_update()
+    current_normal = face.normal
 
     # Check if it matches plane normal
     if current_normal.dot(plane_normal) < 0:
@@ -348,34 +374,29 @@ def resync_after_topology_change(op, bm, face_index, plane_normal, preserve_firs
 # In-modal undo/redo for NGON/NHEDRON point editing.
 #
 # A history state is an ordered snapshot of the editable face's vertex
-# coordinates (object-local, plain tuples). Undo/redo rebuilds the face from a
-# stored snapshot using the same delete-face + recreate-face pattern the rest of
-# the edit code relies on. History lives on ``op.data.edit_history`` and is
-# scoped to the EDIT phase of a single operator invocation.
+# coordinates (object-local, a read-only float32 array of shape (n, 3), the
+# precision BMesh stores them at). When the snapshot has as many verts as the
+# face, undo/redo writes its coordinates in place; otherwise it rebuilds the
+# face using the same delete-face + recreate-face pattern the rest of the edit
+# code relies on. History lives on ``op.data.edit_history`` and is scoped to
+# the EDIT phase of a single operator invocation.
 # ---------------------------------------------------------------------------
 
 _HISTORY_EPS = 1e-6
 
 
 def _snapshot(op):
-    """Ordered coords of the editable face's verts, as plain tuples."""
+    """Ordered coords of the editable face's verts, as an (n, 3) array."""
     bm = op.data.bm
     face = bm.faces[op.data.draw.faces[0]]
-    return tuple(tuple(v.co) for v in face.verts)
+    coords = np.array([v.co for v in face.verts], dtype=np.float32)
+    coords.flags.writeable = False
+    return coords
 
 
 def _coords_equal(a, b):
     """True when two snapshots match in length and per-component (epsilon)."""
-    if len(a) != len(b):
-        return False
-    for pa, pb in zip(a, b):
-        if (
-            abs(pa[0] - pb[0]) > _HISTORY_EPS
-            or abs(pa[1] - pb[1]) > _HISTORY_EPS
-            or abs(pa[2] - pb[2]) > _HISTORY_EPS
-        ):
-            return False
-    return True
+    return a.shape == b.shape and np.allclose(a, b, rtol=0.0, atol=_HISTORY_EPS)
 
 
 def history_reset(op):
@@ -430,40 +451,58 @@ def redo(op, context):
 
 
 def _restore(op, context, coords):
-    """Rebuild the editable face from a stored coordinate snapshot."""
+    """Bring the editable face back to a stored coordinate snapshot."""
     bm = op.data.bm
+    face = bm.faces[op.data.draw.faces[0]]
+    if len(face.verts) == len(coords):
+        _rewrite(op, bm, face, coords)
+    else:
+        _rebuild(op, bm, face, coords)
+
+    # Land back in idle hover; clear dangling interaction state.
+    op.edit_mode = "NONE"
+    op.highlight_type = None
+    op.highlight_index = None
+    op.edit_point = None
+    op.ui.active.callback.update_batch([])
+    op.ui.interface.callback.update_batch([])
+
+
+def _rewrite(op, bm, face, coords):
+    """Move the face's verts onto a snapshot of the same length.
+
+    The snapshot's vertex cycle is written from the face's first loop on, so
+    the polygon and its winding match the stored state without a topology
+    change.
+    """
+    for v, co in zip(face.verts, coords.tolist()):
+        v.co = co
+    face.normal_update()
+
+    rebuild_vertex_list(op, bm, face.index, preserve_first=True)
+    op.update_bmesh(op.data.obj, bm)
+    store(op)
+    update_ui_after_change(op, bm, op.data.obj.matrix_world)
+
+
+def _rebuild(op, bm, face, coords):
+    """Recreate the face from a snapshot with a different vertex count."""
 
     # Tear down the current isolated face and its now-orphaned verts.
-    if op.data.draw.faces:
-        face = bm.faces[op.data.draw.faces[0]]
-        old_verts = list(face.verts)
-        bm.faces.remove(face)
-        for v in old_verts:
-            if not v.link_faces:
-                bm.verts.remove(v)
+    old_verts = list(face.verts)
+    bm.faces.remove(face)
+    for v in old_verts:
+        if not v.link_faces:
+            bm.verts.remove(v)
 
     # Recreate the polygon from the snapshot, then reindex before reading index.
-    new_verts = [bm.verts.new(Vector(c)) for c in coords]
+    new_verts = [bm.verts.new(co) for co in coords.tolist()]
     new_face = bm.faces.new(new_verts)
     new_face.select_set(True)
-
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
+    reindex(bm)
 
     op.data.draw.faces[0] = new_face.index
     plane_normal = op.data.draw.matrix.plane[1]
     resync_after_topology_change(
         op, bm, new_face.index, plane_normal, preserve_first=False
     )
-
-    # Land back in idle hover; clear dangling interaction state.
-    op.edit_mode = "NONE"
-    op.highlight_type = None
-    op.highlight_index = None
-    op.edit_point = None
-    op.ui.active.callback.update_batch([])
-    op.ui.interface.callback.update_batch([])
@@ -2,7 +2,7 @@ from mathutils import Matrix, Vector
 
 
 def create(bm, plane):
-    """Create a rectangle face"""
+    """Create a rectangle face; returns it in a list"""
 
     location, normal = plane
     v1 = bm.verts.new(location)
@@ -10,18 +10,12 @@ def create(bm, plane):
     v3 = bm.verts.new(location)
     v4 = bm.verts.new(location)
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-
     face = bm.faces.new((v1, v2, v3, v4))
     face.normal = normal
     face.select_set(True)
     bm.select_flush(True)
 
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
-    return [face.index]
+    return [face]
 
 
 def set_xy(
@@ -1,7 +1,56 @@
 # filepath: c:\Users\Pixelkom\AppData\Roaming\Blender Foundation\Blender\AR\extensions\user_default\blockout\utilsbmesh\sphere.py
+import math
+from functools import lru_cache
+
 import bmesh
 from mathutils import Matrix, Vector
 
+from ..utils import lazy
+from .mesh import place, refit
+
+np = lazy.module("numpy")
+
+
+@lru_cache(maxsize=16)
+def template(subdivisions):
+    """
+    Unit sphere made from a subdivided cube, built once per subdivision level.
+
+    Vertices are ordered as first met walking the faces in order, so the
+    vertices of faces built from the template can be matched back to it.
+
+    :param subdivisions: Number of cuts per cube edge.
+    :return: Tuple of (coords, faces), a read-only (n, 3) numpy.ndarray of unit
+        coordinates and a tuple of vertex index tuples, one per face.
+    """
+    bm = bmesh.new()
+    try:
+        bmesh.ops.create_cube(bm, size=2.0)
+        if subdivisions > 0:
+            bmesh.ops.subdivide_edges(
+                bm, edges=list(bm.edges), cuts=subdivisions, use_grid_fill=True
+            )
+        bm.verts.index_update()
+        order = {}
+        for f in bm.faces:
+            for v in f.verts:
+                order.setdefault(v.index, len(order))
+        faces = tuple(tuple(order[v.index] for v in f.verts) for f in bm.faces)
+        coords = np.empty((len(order), 3), dtype=np.float64)
+        for v in bm.verts:
+            coords[order[v.index]] = v.co
+    finally:
+        bm.free()
+
+    coords /= np.linalg.norm(coords, axis=1)[:, None]
+    coords.setflags(write=False)
+    return coords, faces
+
+
+def _subdivisions(face_count):
+    """Subdivision level of a template sphere with 'face_count' faces."""
+    return round(math.sqrt(face_count / 6)) - 1
+
 
 def create(bm, plane, direction=None, subdivisions=1, radius=None):
     """
@@ -12,13 +61,11 @@ def create(bm, plane, direction=None, subdivisions=1, radius=None):
     :param direction: Optional direction vector to define the orientation. If None, one will be generated.
     :param subdivisions: Number of subdivisions (0 gives 6 faces/cube, 1 gives 24 faces, higher values give more detail).
     :param radius: The radius of the sphere. Defaults to 1.0.
-    :return: List of Vert objects making up the sphere.
+    :return: List of Face objects making up the sphere.
     """
     location, normal = plane
     normal = normal.normalized()
 
-    faces = []
-
     # Build coordinate axes
     if direction is not None:
         # Use the provided direction to build the coordinate system
@@ -37,66 +84,51 @@ def create(bm, plane, direction=None, subdivisions=1, radius=None):
     matrix = rotation_matrix.to_4x4()
     matrix.translation = location
 
-    # Step 1: Create a cube positioned along plane and direction
-    result = bmesh.ops.create_cube(
-        bm,
-        size=0.001,  # Starting with a unit cube
-        matrix=matrix,
-    )
-
-    cube_verts = result["verts"]
-
-    # Step 2: Subdivide the cube if needed to get more detail
-    if subdivisions > 0:
-        # Get all edges from the created cube
-        edges = []
-        for v in cube_verts:
-            v.select = True
-            edges.extend([e for e in v.link_edges if e not in edges])
-
-        # Subdivide the cube
-        subd_result = bmesh.ops.subdivide_edges(
-            bm, edges=edges, cuts=subdivisions, use_grid_fill=True
-        )
-
-        for f in subd_result["geom"]:
-            if isinstance(f, bmesh.types.BMFace):
-                f.select = True
-                faces.append(f)
-
-    verts = set()
-    for f in faces:
-        verts.update(f.verts)
-    verts = list(verts)
-
-    # Ensure lookup tables are updated
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-    bm.edges.ensure_lookup_table()
-    bm.edges.index_update()
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
     if radius is None:
-        initial_tiny_radius = 0.0001
-    else:
-        initial_tiny_radius = radius
-    for v in verts:
-        local_co = v.co - matrix.translation
-        # Make sure we don't have zero-length vectors
-        if local_co.length > 0:
-            local_co.normalize()
-            local_co *= initial_tiny_radius
-        else:
-            # Fallback for zero-length vectors
-            local_co = Vector((initial_tiny_radius, 0, 0))
-        v.co = local_co + matrix.translation
+        radius = 0.0001
+
+    coords, face_verts = template(subdivisions)
+    verts = [bm.verts.new() for _ in range(len(coords))]
+    place(verts, coords, matrix, scale=radius)
+
+    faces = []
+    for indices in face_verts:
+        face = bm.faces.new([verts[i] for i in indices])
+        face.select = True
+        faces.append(face)
 
     bm.select_flush(True)
 
-    faces_indexes = [f.index for f in faces]
+    return faces
+
+
+def resample(bm, faces, subdivisions):
+    """
+    Replace a sphere with one of a different subdivision level, in place.
+
+    The faces must be in the order create returned them; any affine transform
+    applied to their vertices since is kept.
+
+    :param bm: The bmesh object to modify.
+    :param faces: List of Face objects making up the sphere.
+    :param subdivisions: Subdivision level of the new sphere.
+    :return: List of Face objects making up the new sphere.
+    """
+    old_verts = list(dict.fromkeys(v for f in faces for v in f.verts))
+    source, _ = template(_subdivisions(len(faces)))
+    target, face_verts = template(subdivisions)
+    verts = [bm.verts.new(co) for co in refit(old_verts, source, target)]
+
+    select = faces[0].select
+    new_faces = []
+    for indices in face_verts:
+        face = bm.faces.new([verts[i] for i in indices], faces[0])
+        face.select_set(select)
+        new_faces.append(face)
+
+    bmesh.ops.delete(bm, geom=old_verts, context="VERTS")
 
-    return faces_indexes
+    return new_faces
 
 
 def set_radius(faces, plane, loc, direction, radius=None, snap_value=0):
@@ -152,17 +184,9 @@ def set_radius(faces, plane, loc, direction, radius=None, snap_value=0):
         # If no loc provided, use the x_axis as default direction
         point_3d = location + (x_axis * radius)
 
-    # Extract all unique vertices from the faces and update their positions
-    verts = set()
-    for f in faces:
-        for v in f.verts:
-            verts.add(v)
-
-    # Update the positions of the vertices
-    for v in verts:
-        local_co = v.co - location
-        if local_co.length > 0:
-            local_co.normalize()
-            v.co = location + (local_co * radius)
+    # Unique vertices in template order, then place them in one pass
+    verts = list(dict.fromkeys(v for f in faces for v in f.verts))
+    coords, _ = template(_subdivisions(len(faces)))
+    place(verts, coords, matrix, scale=radius)
 
     return radius, point_3d
@@ -4,25 +4,19 @@ from mathutils import Matrix, Vector
 
 
 def create(bm, plane):
-    """Create a triangle face"""
+    """Create a triangle face; returns it in a list"""
 
     location, normal = plane
     v1 = bm.verts.new(location)
     v2 = bm.verts.new(location)
     v3 = bm.verts.new(location)
 
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-
     face = bm.faces.new((v1, v2, v3))
     face.normal = normal
     face.select_set(True)
     bm.select_flush(True)
 
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-
-    return [face.index]
+    return [face]
 
 
 def set_xy(